@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.models.analytics import FoodieArea, RestaurantTypeSummary, TopRestaurant
+from src.utils.charts import (
+    ChartImage,
+    foodie_areas_bar_chart,
+    restaurant_types_pie_chart,
+    top_restaurants_bar_chart,
+)
+
+
+def _restaurant_types() -> List[RestaurantTypeSummary]:
+    return [
+        RestaurantTypeSummary(
+            restaurant_type=f"Type {i}",
+            count=100 - i * 7,
+            percentage=(100 - i * 7) / 4.0,
+            avg_rating=3.5,
+            avg_cost_for_two=400,
+        )
+        for i in range(8)
+    ]
+
+
+def _top_restaurants() -> List[TopRestaurant]:
+    return [
+        TopRestaurant(
+            name=f"Restaurant {i}",
+            location="BTM",
+            rating=4.2,
+            votes=10_000 - i * 500,
+            restaurant_type="Casual Dining",
+            cuisines=["North Indian"],
+            rank=i + 1,
+        )
+        for i in range(10)
+    ]
+
+
+def _foodie_areas() -> List[FoodieArea]:
+    return [
+        FoodieArea(
+            area=f"Area {i}",
+            restaurant_count=5_000 - i * 300,
+            avg_rating=3.9,
+            top_cuisines=["North Indian"],
+            restaurant_types=["Quick Bites"],
+        )
+        for i in range(10)
+    ]
+
+
+def _renderers(width: int, height: int) -> Dict[str, Callable[[], ChartImage]]:
+    types = _restaurant_types()
+    top = _top_restaurants()
+    areas = _foodie_areas()
+    return {
+        "restaurant-types-pie": lambda: restaurant_types_pie_chart(
+            types, width=width, height=height
+        ),
+        "top-restaurants-bar": lambda: top_restaurants_bar_chart(
+            top, width=width, height=height
+        ),
+        "foodie-areas-bar": lambda: foodie_areas_bar_chart(
+            areas, width=width, height=height
+        ),
+    }
+
+
+def run(*, iterations: int, width: int, height: int) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for chart_type, render in _renderers(width, height).items():
+        render()  # warm up fonts and the Agg backend
+        start = perf_counter()
+        for _ in range(iterations):
+            render()
+        elapsed = perf_counter() - start
+        results[chart_type] = iterations / elapsed if elapsed > 0 else float("inf")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure chart renders per second.")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--width", type=int, default=900)
+    parser.add_argument("--height", type=int, default=420)
+    args = parser.parse_args()
+
+    results = run(iterations=args.iterations, width=args.width, height=args.height)
+    for chart_type, renders_per_second in results.items():
+        print(f"{chart_type:<24} {renders_per_second:8.1f} renders/s")
+
+
+if __name__ == "__main__":
+    main()
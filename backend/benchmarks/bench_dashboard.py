@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import argparse
+import io
+import logging
+import os
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.app import create_app
+from src.services import analytics
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_JSON_PATHS = ["/api/restaurant-types", "/api/foodie-areas", "/api/top-restaurants"]
+_CHART_TYPES = ["restaurant-types-pie", "top-restaurants-bar", "foodie-areas-bar"]
+
+SCENARIOS: Dict[str, List[str]] = {
+    # What main.js fetched before charts were drawn client-side.
+    "separate+png": _JSON_PATHS
+    + [f"/api/charts/{c}?width=900&height=420" for c in _CHART_TYPES],
+    "separate+series": _JSON_PATHS + [f"/api/charts/{c}/data" for c in _CHART_TYPES],
+    "dashboard": ["/api/dashboard"],
+}
+
+
+def _page_load(client: Any, paths: List[str]) -> float:
+    start = perf_counter()
+    for path in paths:
+        resp = client.get(path)
+        if resp.status_code != 200:
+            raise RuntimeError(f"{path} returned {resp.status_code}")
+    return (perf_counter() - start) * 1000
+
+
+def _reset_caches(app: Any) -> None:
+    analytics._ANALYTICS_CACHE.clear()
+    app.config["API_CACHE"] = {}
+
+
+def run(*, data_file: str, iterations: int) -> Dict[str, Dict[str, float]]:
+    # Keep request logging enabled (it is part of the per-request cost) but off
+    # the terminal.
+    root = logging.getLogger()
+    root.handlers = [logging.StreamHandler(io.StringIO())]
+    root.setLevel(logging.INFO)
+    os.environ["DATA_FILE_PATH"] = data_file
+    os.environ["CHART_WARMUP"] = ""
+
+    app = create_app()
+    client = app.test_client()
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, paths in SCENARIOS.items():
+        measure: Callable[[], float] = lambda: _page_load(client, paths)  # noqa: E731
+
+        _reset_caches(app)
+        cold = measure()
+        warm = [measure() for _ in range(iterations)]
+        results[name] = {"cold_ms": cold, "warm_median_ms": statistics.median(warm)}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure dashboard page-load latency.")
+    parser.add_argument(
+        "--data-file", default=str(_REPO_ROOT / "data" / "zomato-lite.csv")
+    )
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    results = run(data_file=args.data_file, iterations=args.iterations)
+    for name, timings in results.items():
+        print(
+            f"{name:<18} cold {timings['cold_ms']:8.1f} ms"
+            f"   warm {timings['warm_median_ms']:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
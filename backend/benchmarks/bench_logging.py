@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import logging.handlers
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.app import create_app
+from src.utils.log_events import start_async_logging
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# (async handler, request.start sample rate)
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "sync": {"async": False, "start_rate": 1.0},
+    "async": {"async": True, "start_rate": 1.0},
+    "async+end-only": {"async": True, "start_rate": 0.0},
+}
+
+
+class _BlockingFileHandler(logging.FileHandler):
+    """A file handler whose writes block, like a pipe or log driver under pressure."""
+
+    def __init__(self, path: Path, *, write_latency_seconds: float) -> None:
+        super().__init__(path, encoding="utf-8")
+        self.write_latency_seconds = write_latency_seconds
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if self.write_latency_seconds:
+            time.sleep(self.write_latency_seconds)
+
+
+def _configure(
+    log_path: Path, *, use_async: bool, write_latency_seconds: float
+) -> Optional[logging.handlers.QueueListener]:
+    root = logging.getLogger()
+    for handler in root.handlers:
+        handler.close()
+    root.handlers = []
+    root.setLevel(logging.INFO)
+
+    handler = _BlockingFileHandler(
+        log_path, write_latency_seconds=write_latency_seconds
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    if use_async:
+        return start_async_logging(root, handler)
+    root.addHandler(handler)
+    return None
+
+
+def _drive(client: Any, path: str, requests: int) -> None:
+    for _ in range(requests):
+        if client.get(path).status_code != 200:
+            raise RuntimeError(f"{path} failed")
+
+
+def _throughput(
+    log_path: Path,
+    scenario: Dict[str, Any],
+    *,
+    requests: int,
+    threads: int,
+    path: str,
+    write_latency_seconds: float,
+) -> float:
+    listener = _configure(
+        log_path,
+        use_async=scenario["async"],
+        write_latency_seconds=write_latency_seconds,
+    )
+    app = create_app()
+    app.config["LOG_REQUEST_START_SAMPLE_RATE"] = scenario["start_rate"]
+    _drive(app.test_client(), path, 20)  # warm caches
+
+    per_thread = requests // threads
+    workers: List[threading.Thread] = [
+        threading.Thread(target=_drive, args=(app.test_client(), path, per_thread))
+        for _ in range(threads)
+    ]
+    start = perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = perf_counter() - start
+    # Draining the queue is not on the request path, so it is not timed.
+    if listener is not None:
+        listener.stop()
+    return per_thread * threads / elapsed
+
+
+def run(
+    *,
+    data_file: str,
+    requests: int,
+    threads: int,
+    path: str,
+    write_latency_ms: float,
+    rounds: int,
+) -> Dict[str, float]:
+    """Median requests per second for each scenario.
+
+    Scenarios are interleaved across rounds.
+    """
+    os.environ["DATA_FILE_PATH"] = data_file
+    os.environ["CHART_WARMUP"] = ""
+
+    samples: Dict[str, List[float]] = {name: [] for name in SCENARIOS}
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(rounds):
+            for name, scenario in SCENARIOS.items():
+                samples[name].append(
+                    _throughput(
+                        Path(tmp) / f"{name}.log",
+                        scenario,
+                        requests=requests,
+                        threads=threads,
+                        path=path,
+                        write_latency_seconds=write_latency_ms / 1000,
+                    )
+                )
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure request throughput under each logging mode."
+    )
+    parser.add_argument(
+        "--data-file", default=str(_REPO_ROOT / "data" / "zomato-lite.csv")
+    )
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--path", default="/api/top-restaurants")
+    parser.add_argument(
+        "--write-latency-ms",
+        type=float,
+        default=0.0,
+        help="Extra blocking time per log write (slow sink).",
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    results = run(
+        data_file=args.data_file,
+        requests=args.requests,
+        threads=args.threads,
+        path=args.path,
+        write_latency_ms=args.write_latency_ms,
+        rounds=args.rounds,
+    )
+    baseline = results["sync"]
+    for name, rps in results.items():
+        print(f"{name:<16} {rps:8.0f} req/s   x{rps / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic import parse_sizes, synthetic_csv
+from src.services.analytics import (
+    compute_foodie_areas,
+    compute_restaurant_type_summary,
+    compute_top_restaurants,
+)
+from src.services.data_loader import load_zomato_csv
+from src.utils.charts import (
+    foodie_areas_bar_chart,
+    restaurant_types_pie_chart,
+    top_restaurants_bar_chart,
+)
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "bench_service.json"
+
+# A benchmark is this much slower than its baseline before it counts as a regression.
+DEFAULT_THRESHOLD = 1.25
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def _benchmarks(csv_path: Path) -> List[Tuple[str, Callable[[], Any]]]:
+    df = load_zomato_csv(str(csv_path)).restaurants_df
+    types = compute_restaurant_type_summary(df).restaurant_types
+    top = compute_top_restaurants(df).top_restaurants
+    areas = compute_foodie_areas(df).foodie_areas
+    return [
+        ("load_zomato_csv", lambda: load_zomato_csv(str(csv_path))),
+        (
+            "compute_restaurant_type_summary",
+            lambda: compute_restaurant_type_summary(df),
+        ),
+        ("compute_top_restaurants", lambda: compute_top_restaurants(df)),
+        ("compute_foodie_areas", lambda: compute_foodie_areas(df)),
+        # Chart inputs are already aggregated, so these mostly track label
+        # cardinality; they run with the layout template cache warm.
+        (
+            "restaurant_types_pie_chart",
+            lambda: restaurant_types_pie_chart(types, width=900, height=420),
+        ),
+        (
+            "top_restaurants_bar_chart",
+            lambda: top_restaurants_bar_chart(top, width=900, height=420),
+        ),
+        (
+            "foodie_areas_bar_chart",
+            lambda: foodie_areas_bar_chart(areas, width=900, height=420),
+        ),
+    ]
+
+
+def run(*, sizes: List[int], repeat: int, seed: int) -> Dict[str, Dict[str, float]]:
+    """Best-of-``repeat`` seconds per benchmark, keyed by row count then benchmark."""
+    results: Dict[str, Dict[str, float]] = {}
+    for rows in sizes:
+        csv_path = synthetic_csv(rows, seed=seed)
+        timings: Dict[str, float] = {}
+        for name, fn in _benchmarks(csv_path):
+            fn()  # warm up
+            timings[name] = _best_of(fn, repeat)
+        results[str(rows)] = timings
+    return results
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {"machine": {}, "results": {}}
+    baseline: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    return baseline
+
+
+def save_baseline(path: Path, results: Dict[str, Dict[str, float]]) -> None:
+    """Merge ``results`` into the baseline file, replacing the sizes just measured."""
+    baseline = load_baseline(path)
+    baseline["machine"] = machine_info()
+    baseline["results"].update(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    *,
+    threshold: float,
+) -> List[Tuple[str, str, float, float, bool]]:
+    """Rows of (size, benchmark, seconds, ratio to baseline, regressed)."""
+    rows = []
+    for size, timings in results.items():
+        for name, seconds in timings.items():
+            base = baseline.get(size, {}).get(name)
+            ratio = seconds / base if base else float("nan")
+            rows.append((size, name, seconds, ratio, bool(base) and ratio > threshold))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the data loader, analytics and chart functions."
+    )
+    parser.add_argument(
+        "--sizes",
+        default="1k,100k",
+        help="Comma-separated: 1k, 100k, 1m, 10m or row counts.",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Record these results as the baseline.",
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    results = run(sizes=parse_sizes(args.sizes), repeat=args.repeat, seed=args.seed)
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+
+    rows = compare(
+        results, load_baseline(args.baseline)["results"], threshold=args.threshold
+    )
+    for size, name, seconds, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(
+            f"{size:>9} rows  {name:<32} {seconds * 1000:10.2f} ms"
+            f"   x{ratio:5.2f} vs baseline{flag}"
+        )
+
+    if any(regressed for *_, regressed in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
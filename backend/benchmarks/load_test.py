@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import logging
+import math
+import multiprocessing
+import os
+import random
+import re
+import socket
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic import parse_sizes, synthetic_csv
+from src.utils.log_events import start_async_logging
+
+_CHART_TYPES = ("restaurant-types-pie", "top-restaurants-bar", "foodie-areas-bar")
+
+# Weighted request paths per traffic mix.
+MIXES: Dict[str, List[Tuple[int, str]]] = {
+    # Page loads: the batched dashboard call plus the client-side chart series.
+    "dashboard": [(6, "/api/dashboard")]
+    + [(1, f"/api/charts/{c}/data") for c in _CHART_TYPES]
+    + [(1, "/api/restaurant-types")],
+    # Server-rendered PNG charts at the frontend size and a couple of others.
+    "chart-heavy": [(3, f"/api/charts/{c}?width=900&height=420") for c in _CHART_TYPES]
+    + [(1, f"/api/charts/{c}?width=640&height=360") for c in _CHART_TYPES]
+    + [(1, f"/api/charts/{c}/data") for c in _CHART_TYPES],
+    # Dashboards left open and monitoring hitting cheap endpoints.
+    "polling": [
+        (5, "/api/health"),
+        (2, "/api/top-restaurants"),
+        (2, "/api/foodie-areas"),
+        (1, "/api/restaurant-types"),
+        (1, "/api/admission"),
+    ],
+}
+
+_CACHE_EVENT = re.compile(
+    r'^restaurant_eda_cache_events_total\{cache="([^"]+)",event="([^"]+)"\} (\S+)$'
+)
+
+
+def endpoint_label(path: str) -> str:
+    """Group request paths by route: drop the query string, keep chart types."""
+    return path.split("?", 1)[0]
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def _serve(server: str, port: int, env: Dict[str, str]) -> None:
+    os.environ.update(env)
+    # Request logging stays on (it is part of the cost) and takes the shipped
+    # path: formatted records written by the async queue listener (or inline
+    # with LOG_ASYNC=false), to a file that discards them.
+    root = logging.getLogger()
+    root.handlers = []
+    root.setLevel(logging.INFO)
+    handler = logging.FileHandler(os.devnull)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    if os.environ.get("LOG_ASYNC", "true").lower() in {"1", "true", "yes"}:
+        start_async_logging(root, handler)
+    else:
+        root.addHandler(handler)
+
+    if server == "asgi":
+        import uvicorn
+
+        from src.asgi import create
+
+        uvicorn.run(
+            create, factory=True, host="127.0.0.1", port=port, log_level="warning"
+        )
+        return
+
+    from werkzeug.serving import WSGIRequestHandler, make_server
+
+    from src.app import create_app
+
+    WSGIRequestHandler.protocol_version = "HTTP/1.1"  # keep-alive
+    make_server("127.0.0.1", port, create_app(), threaded=True).serve_forever()
+
+
+def _wait_until_ready(host: str, port: int, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=2)
+            conn.request("GET", "/api/health")
+            ready = conn.getresponse().status == 200
+            conn.close()
+            if ready:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server on {host}:{port} did not become ready in {timeout}s")
+
+
+def _cache_events(host: str, port: int) -> Dict[Tuple[str, str], float]:
+    conn = http.client.HTTPConnection(host, port, timeout=10)
+    conn.request("GET", "/metrics")
+    body = conn.getresponse().read().decode("utf-8")
+    conn.close()
+    events: Dict[Tuple[str, str], float] = {}
+    for line in body.splitlines():
+        match = _CACHE_EVENT.match(line)
+        if match:
+            events[(match.group(1), match.group(2))] = float(match.group(3))
+    return events
+
+
+def cache_hit_rates(
+    before: Dict[Tuple[str, str], float], after: Dict[Tuple[str, str], float]
+) -> Dict[str, Dict[str, float]]:
+    """Per cache: lookups during the run and the share served fresh or stale."""
+    deltas: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for (cache, event), value in after.items():
+        deltas[cache][event] = value - before.get((cache, event), 0.0)
+    rates: Dict[str, Dict[str, float]] = {}
+    for cache, events in sorted(deltas.items()):
+        served = events.get("hit", 0.0) + events.get("stale", 0.0)
+        lookups = served + events.get("miss", 0.0)
+        rates[cache] = {
+            "lookups": lookups,
+            "hit_rate": served / lookups if lookups else float("nan"),
+        }
+    return rates
+
+
+def _worker(
+    host: str,
+    port: int,
+    mix: List[Tuple[int, str]],
+    stop_at: float,
+    seed: int,
+    stats: Dict[str, EndpointStats],
+    lock: threading.Lock,
+) -> None:
+    rng = random.Random(seed)
+    weights = [weight for weight, _ in mix]
+    paths = [path for _, path in mix]
+    local: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+    conn = http.client.HTTPConnection(host, port, timeout=60)
+    while time.monotonic() < stop_at:
+        path = rng.choices(paths, weights)[0]
+        label = endpoint_label(path)
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path)
+            resp = conn.getresponse()
+            resp.read()
+            status = resp.status
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=60)
+            local[label].errors += 1
+            continue
+        local[label].latencies_ms.append((time.perf_counter() - start) * 1000)
+        local[label].statuses[status] += 1
+        if status >= 400:
+            local[label].errors += 1
+    conn.close()
+    with lock:
+        for label, item in local.items():
+            merged = stats.setdefault(label, EndpointStats())
+            merged.latencies_ms.extend(item.latencies_ms)
+            merged.errors += item.errors
+            for status, count in item.statuses.items():
+                merged.statuses[status] += count
+
+
+def run_load(
+    host: str,
+    port: int,
+    *,
+    mix: str,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed: int,
+) -> Dict[str, Any]:
+    """Drive ``mix`` with ``concurrency`` closed-loop clients for ``duration`` s."""
+    requests = MIXES[mix]
+    if warmup > 0:
+        _run_clients(host, port, requests, concurrency, warmup, seed + 10_000)
+
+    before = _cache_events(host, port)
+    stats, elapsed = _run_clients(host, port, requests, concurrency, duration, seed)
+    after = _cache_events(host, port)
+
+    endpoints: Dict[str, Dict[str, Any]] = {}
+    total = 0
+    for label, item in sorted(stats.items()):
+        latencies = sorted(item.latencies_ms)
+        total += len(latencies)
+        endpoints[label] = {
+            "requests": len(latencies),
+            "errors": item.errors,
+            "rps": len(latencies) / elapsed,
+            "p50_ms": percentile(latencies, 50),
+            "p90_ms": percentile(latencies, 90),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": latencies[-1] if latencies else float("nan"),
+            "statuses": {
+                str(status): count for status, count in sorted(item.statuses.items())
+            },
+        }
+    return {
+        "mix": mix,
+        "concurrency": concurrency,
+        "duration_s": elapsed,
+        "total_rps": total / elapsed,
+        "endpoints": endpoints,
+        "caches": cache_hit_rates(before, after),
+    }
+
+
+def _run_clients(
+    host: str,
+    port: int,
+    mix: List[Tuple[int, str]],
+    concurrency: int,
+    duration: float,
+    seed: int,
+) -> Tuple[Dict[str, EndpointStats], float]:
+    stats: Dict[str, EndpointStats] = {}
+    lock = threading.Lock()
+    start = time.monotonic()
+    stop_at = start + duration
+    threads = [
+        threading.Thread(
+            target=_worker, args=(host, port, mix, stop_at, seed + i, stats, lock)
+        )
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return stats, time.monotonic() - start
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"\nmix={report['mix']} concurrency={report['concurrency']} "
+        f"duration={report['duration_s']:.1f}s total={report['total_rps']:.1f} req/s"
+    )
+    print(
+        f"{'endpoint':<38} {'req':>7} {'err':>5} {'req/s':>8} "
+        f"{'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}  statuses"
+    )
+    for label, row in report["endpoints"].items():
+        statuses = " ".join(
+            f"{status}:{count}" for status, count in row["statuses"].items()
+        )
+        print(
+            f"{label:<38} {row['requests']:>7} {row['errors']:>5} {row['rps']:>8.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p90_ms']:>8.1f} "
+            f"{row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}  {statuses}"
+        )
+    for cache, row in report["caches"].items():
+        print(
+            f"cache {cache:<10} lookups {row['lookups']:>8.0f}"
+            f"   hit rate {row['hit_rate']:6.1%}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Drive the API over HTTP with a request mix."
+    )
+    parser.add_argument(
+        "--mix",
+        choices=sorted(MIXES),
+        action="append",
+        help="Repeatable; default: all mixes.",
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="Measured seconds per mix."
+    )
+    parser.add_argument(
+        "--warmup", type=float, default=2.0, help="Unmeasured seconds before each mix."
+    )
+    parser.add_argument(
+        "--rows",
+        default="10k",
+        help="Synthetic dataset size (1k, 100k, 1m, 10m or a count).",
+    )
+    parser.add_argument("--server", choices=("wsgi", "asgi"), default="wsgi")
+    parser.add_argument(
+        "--url", help="Drive an already running server instead of starting one."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--json", type=Path, help="Also write the reports to this file."
+    )
+    parser.add_argument(
+        "--env",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Extra server settings (repeatable).",
+    )
+    args = parser.parse_args()
+
+    process: Optional[BaseProcess] = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname or "127.0.0.1", parts.port or 80
+    else:
+        rows = parse_sizes(args.rows)[0]
+        env = {
+            "DATA_FILE_PATH": str(synthetic_csv(rows, seed=args.seed)),
+            "CHART_WARMUP": "",
+        }
+        env.update(item.split("=", 1) for item in args.env)
+        host, port = "127.0.0.1", _free_port()
+        process = multiprocessing.get_context("spawn").Process(
+            target=_serve, args=(args.server, port, env), daemon=True
+        )
+        process.start()
+
+    try:
+        _wait_until_ready(host, port, timeout=300)
+        reports = []
+        for mix in args.mix or list(MIXES):
+            report = run_load(
+                host,
+                port,
+                mix=mix,
+                concurrency=args.concurrency,
+                duration=args.duration,
+                warmup=args.warmup,
+                seed=args.seed,
+            )
+            _print_report(report)
+            reports.append(report)
+        if args.json:
+            args.json.write_text(json.dumps(reports, indent=2) + "\n", encoding="utf-8")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.join(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# Row counts accepted by --sizes and the benchmark suite.
+SIZES: Dict[str, int] = {
+    "1k": 1_000,
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+
+# Generated CSVs are cached here (git-ignored); 10m rows is roughly 1 GB.
+DATA_DIR = Path(__file__).resolve().parent / ".data"
+
+# Cardinalities of the Bangalore Zomato dump (~51k rows): ~93 locations,
+# ~93 restaurant types (many "A, B" combinations), ~107 cuisines combined into
+# ~2.7k distinct cuisine lists, and ~8.8k distinct names (chains repeat).
+_LOCATIONS = 93
+_BASE_TYPES = [
+    "Quick Bites",
+    "Casual Dining",
+    "Cafe",
+    "Delivery",
+    "Dessert Parlor",
+    "Takeaway",
+    "Bakery",
+    "Beverage Shop",
+    "Bar",
+    "Food Court",
+    "Sweet Shop",
+    "Pub",
+    "Lounge",
+    "Fine Dining",
+    "Kiosk",
+    "Microbrewery",
+    "Mess",
+    "Club",
+    "Dhaba",
+    "Food Truck",
+]
+_REST_TYPES = 93
+_CUISINES = 107
+_CUISINE_COMBOS = 2_700
+_NAME_RATIO = 0.17
+
+_MISSING_RATES = ["NEW", "-"]
+
+
+def _zipf_weights(n: int, exponent: float = 1.1) -> np.ndarray:
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+
+def _rest_type_pool(rng: np.random.Generator) -> List[str]:
+    pool = list(_BASE_TYPES)
+    while len(pool) < _REST_TYPES:
+        a, b = rng.choice(len(_BASE_TYPES), size=2, replace=False)
+        combo = f"{_BASE_TYPES[a]}, {_BASE_TYPES[b]}"
+        if combo not in pool:
+            pool.append(combo)
+    return pool
+
+
+def _cuisine_pool(rng: np.random.Generator) -> List[str]:
+    names = [f"Cuisine {i}" for i in range(_CUISINES)]
+    weights = _zipf_weights(_CUISINES, 0.9)
+    pool: List[str] = []
+    seen = set()
+    while len(pool) < _CUISINE_COMBOS:
+        k = int(rng.integers(1, 6))
+        picked = rng.choice(_CUISINES, size=k, replace=False, p=weights)
+        combo = ", ".join(names[i] for i in picked)
+        if combo not in seen:
+            seen.add(combo)
+            pool.append(combo)
+    return pool
+
+
+def generate_zomato_frame(rows: int, *, seed: int = 0) -> pd.DataFrame:
+    """Build raw Zomato-shaped rows with the columns ``load_zomato_csv`` reads.
+
+    Values follow the raw CSV formats: ``rate`` like ``"4.1/5"``, ``"NEW"`` or
+    missing, and costs like ``"1,200"``.
+    """
+    rng = np.random.default_rng(seed)
+
+    locations = np.array([f"Area {i}" for i in range(_LOCATIONS)], dtype=object)
+    rest_types = np.array(_rest_type_pool(rng), dtype=object)
+    cuisines = np.array(_cuisine_pool(rng), dtype=object)
+    name_count = max(1, int(rows * _NAME_RATIO))
+    names = np.array([f"Restaurant {i}" for i in range(name_count)], dtype=object)
+
+    rate_values = np.array(
+        [f"{r / 10:.1f}/5" for r in range(18, 50)] + _MISSING_RATES + [np.nan],
+        dtype=object,
+    )
+    rate_weights = np.concatenate(
+        [np.exp(-0.5 * ((np.arange(18, 50) - 37) / 4.5) ** 2), [0.5, 0.03, 1.8]]
+    )
+    costs = np.array(
+        [
+            str(c) if c < 1000 else f"{c // 1000},{c % 1000:03d}"
+            for c in range(100, 3100, 50)
+        ]
+        + [np.nan],
+        dtype=object,
+    )
+
+    frame = pd.DataFrame(
+        {
+            "name": names[
+                rng.choice(name_count, size=rows, p=_zipf_weights(name_count, 0.6))
+            ],
+            "location": locations[
+                rng.choice(_LOCATIONS, size=rows, p=_zipf_weights(_LOCATIONS, 0.8))
+            ],
+            "rest_type": rest_types[
+                rng.choice(len(rest_types), size=rows, p=_zipf_weights(len(rest_types)))
+            ],
+            "cuisines": cuisines[
+                rng.choice(
+                    len(cuisines), size=rows, p=_zipf_weights(len(cuisines), 0.9)
+                )
+            ],
+            "rate": rate_values[
+                rng.choice(
+                    len(rate_values), size=rows, p=rate_weights / rate_weights.sum()
+                )
+            ],
+            "votes": np.minimum(
+                rng.lognormal(3.5, 1.8, size=rows).astype(np.int64), 20_000
+            ),
+            "approx_cost(for two people)": costs[
+                rng.choice(len(costs), size=rows, p=_zipf_weights(len(costs), 0.7))
+            ],
+        }
+    )
+    return frame
+
+
+def synthetic_csv(rows: int, *, seed: int = 0, data_dir: Optional[Path] = None) -> Path:
+    """Return the path of a cached synthetic CSV, generating it on first use."""
+    directory = data_dir or DATA_DIR
+    path = directory / f"zomato-synthetic-{rows}-{seed}.csv"
+    if not path.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        generate_zomato_frame(rows, seed=seed).to_csv(tmp, index=False)
+        tmp.replace(path)
+    return path
+
+
+def parse_sizes(spec: str) -> List[int]:
+    sizes = []
+    for raw in spec.split(","):
+        name = raw.strip().lower()
+        if not name:
+            continue
+        if name in SIZES:
+            sizes.append(SIZES[name])
+        else:
+            try:
+                sizes.append(int(name))
+            except ValueError:
+                raise ValueError(
+                    f"Unknown size {raw!r}: use {', '.join(SIZES)} or a row count"
+                ) from None
+    return sizes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic Zomato-shaped CSVs."
+    )
+    parser.add_argument("--sizes", default="1k,100k")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for rows in parse_sizes(args.sizes):
+        print(synthetic_csv(rows, seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionPolicy:
+    max_in_flight: int
+    max_latency_ms: float
+    retry_after_seconds: int = 1
+
+
+# Keyed by Flask endpoint name. Chart renders are the most expensive requests,
+# so they get the tightest budget; routes not listed here are never shed.
+DEFAULT_ADMISSION_POLICIES: Dict[str, AdmissionPolicy] = {
+    "api.get_chart": AdmissionPolicy(max_in_flight=4, max_latency_ms=2000),
+    "api.get_chart_data": AdmissionPolicy(max_in_flight=16, max_latency_ms=1000),
+    "api.get_restaurant_types": AdmissionPolicy(max_in_flight=16, max_latency_ms=1000),
+    "api.get_top_restaurants": AdmissionPolicy(max_in_flight=16, max_latency_ms=1000),
+    "api.get_foodie_areas": AdmissionPolicy(max_in_flight=16, max_latency_ms=1000),
+    "api.get_aggregate": AdmissionPolicy(max_in_flight=16, max_latency_ms=1000),
+    "api.get_cuisines": AdmissionPolicy(max_in_flight=16, max_latency_ms=1000),
+    "api.get_cuisine_cooccurrence": AdmissionPolicy(
+        max_in_flight=16, max_latency_ms=1000
+    ),
+    "api.get_similar_restaurants": AdmissionPolicy(
+        max_in_flight=16, max_latency_ms=1000
+    ),
+    "api.search_restaurants": AdmissionPolicy(max_in_flight=32, max_latency_ms=500),
+    "api.get_chains": AdmissionPolicy(max_in_flight=16, max_latency_ms=1000),
+    "api.lookup_restaurants": AdmissionPolicy(max_in_flight=16, max_latency_ms=1000),
+    "api.get_dashboard": AdmissionPolicy(max_in_flight=8, max_latency_ms=2000),
+    "api.post_batch": AdmissionPolicy(max_in_flight=8, max_latency_ms=2000),
+}
+
+# Weight of the newest sample in the latency moving average.
+_LATENCY_ALPHA = 0.2
+
+
+class OverloadedError(Exception):
+    def __init__(self, endpoint: str, retry_after_seconds: int) -> None:
+        super().__init__(f"Service overloaded: {endpoint} is over its admission budget")
+        self.endpoint = endpoint
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass(slots=True)
+class _EndpointState:
+    in_flight: int = 0
+    latency_ms: float = 0.0
+    admitted: int = 0
+    rejected: int = 0
+    served_stale: int = 0
+
+
+class AdmissionController:
+    """Bound queue depth and recent latency per endpoint.
+
+    A request is over budget when the endpoint already has ``max_in_flight``
+    requests running, or when its moving-average latency exceeds
+    ``max_latency_ms`` while other requests are still running. An idle endpoint
+    always admits, so a latency spike cannot lock it out.
+    """
+
+    def __init__(self, policies: Optional[Dict[str, AdmissionPolicy]] = None) -> None:
+        self.policies = dict(
+            DEFAULT_ADMISSION_POLICIES if policies is None else policies
+        )
+        self._lock = threading.Lock()
+        self._states: Dict[str, _EndpointState] = {
+            name: _EndpointState() for name in self.policies
+        }
+
+    def policy(self, endpoint: str) -> Optional[AdmissionPolicy]:
+        return self.policies.get(endpoint)
+
+    @staticmethod
+    def _exceeds(policy: AdmissionPolicy, state: _EndpointState) -> bool:
+        if state.in_flight >= policy.max_in_flight:
+            return True
+        return state.in_flight > 0 and state.latency_ms > policy.max_latency_ms
+
+    def try_acquire(self, endpoint: str) -> bool:
+        """Admit a request unless the endpoint is over budget.
+
+        The check and the in-flight count happen under one lock hold, so a
+        burst cannot all pass the check before any of it counts as in flight.
+        Unlisted endpoints are always admitted.
+        """
+        policy = self.policies.get(endpoint)
+        if policy is None:
+            return True
+        with self._lock:
+            state = self._states[endpoint]
+            if self._exceeds(policy, state):
+                return False
+            state.in_flight += 1
+            state.admitted += 1
+            return True
+
+    def release(self, endpoint: str, latency_ms: float) -> None:
+        with self._lock:
+            state = self._states.get(endpoint)
+            if state is None:
+                return
+            state.in_flight = max(0, state.in_flight - 1)
+            if state.latency_ms == 0.0:
+                state.latency_ms = latency_ms
+            else:
+                state.latency_ms += _LATENCY_ALPHA * (latency_ms - state.latency_ms)
+
+    def record_rejected(self, endpoint: str) -> None:
+        with self._lock:
+            state = self._states.get(endpoint)
+            if state is not None:
+                state.rejected += 1
+
+    def record_stale(self, endpoint: str) -> None:
+        with self._lock:
+            state = self._states.get(endpoint)
+            if state is not None:
+                state.served_stale += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                name: {
+                    "in_flight": state.in_flight,
+                    "latency_ms": round(state.latency_ms, 3),
+                    "admitted": state.admitted,
+                    "rejected": state.rejected,
+                    "served_stale": state.served_stale,
+                    "max_in_flight": self.policies[name].max_in_flight,
+                    "max_latency_ms": self.policies[name].max_latency_ms,
+                }
+                for name, state in self._states.items()
+            }
+
+
+def parse_admission_policies(spec: Optional[str]) -> Dict[str, AdmissionPolicy]:
+    """Parse ``"api.get_chart=4:2000,api.post_batch=8:2000:2"`` over the defaults.
+
+    Each entry is ``endpoint=max_in_flight:max_latency_ms[:retry_after_seconds]``.
+    """
+    policies = dict(DEFAULT_ADMISSION_POLICIES)
+    if not spec:
+        return policies
+    for raw in spec.split(","):
+        item = raw.strip()
+        if not item:
+            continue
+        endpoint, _, budget = item.partition("=")
+        parts = budget.split(":")
+        try:
+            if len(parts) not in (2, 3):
+                raise ValueError
+            policy = AdmissionPolicy(
+                max_in_flight=int(parts[0]),
+                max_latency_ms=float(parts[1]),
+                retry_after_seconds=int(parts[2]) if len(parts) == 3 else 1,
+            )
+        except ValueError:
+            raise ValueError(f"Invalid admission policy: {item!r}") from None
+        if (
+            not endpoint.strip()
+            or policy.max_in_flight < 1
+            or policy.max_latency_ms <= 0
+        ):
+            raise ValueError(f"Invalid admission policy: {item!r}")
+        policies[endpoint.strip()] = policy
+    return policies
@@ -2,62 +2,630 @@ from __future__ import annotations
 
 import time
 import uuid
+from dataclasses import asdict
+from datetime import datetime, timezone
 from time import perf_counter
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
-from flask import Blueprint, current_app, g, jsonify, request
+from flask import (
+    Blueprint,
+    Flask,
+    Response,
+    current_app,
+    g,
+    jsonify,
+    request,
+    send_file,
+)
+from flask.typing import ResponseReturnValue
+from pydantic import BaseModel, ValidationError
 
+from src.api.admission import AdmissionController, OverloadedError
 from src.api.schemas import (
+    AdmissionData,
+    AdmissionEndpointStats,
+    AdmissionResponse,
+    AggregateData,
+    AggregateResponse,
+    BatchData,
+    BatchQuery,
+    BatchRequest,
+    BatchResponse,
+    BatchResult,
+    CacheNamespaceSize,
+    ChainsData,
+    ChainsResponse,
     ChartData,
     ChartResponse,
+    ChartSeriesData,
+    ChartSeriesResponse,
+    CuisineCooccurrenceData,
+    CuisineCooccurrenceResponse,
+    CuisinePairModel,
+    CuisinesData,
+    CuisinesResponse,
+    CuisineSummaryModel,
     FoodieAreasData,
     FoodieAreasResponse,
     HealthData,
     HealthResponse,
+    MemoryBreakdown,
+    RestaurantChainModel,
+    RestaurantLookupData,
+    RestaurantLookupRequest,
+    RestaurantLookupResponse,
+    RestaurantModel,
+    RestaurantResponse,
+    RestaurantSearchData,
+    RestaurantSearchResponse,
     RestaurantTypesData,
     RestaurantTypesResponse,
+    SimilarRestaurantModel,
+    SimilarRestaurantsData,
+    SimilarRestaurantsResponse,
     TopRestaurantsData,
     TopRestaurantsResponse,
     make_error_response,
     make_response_metadata,
 )
+from src.services.aggregate import parse_aggregate_plan
 from src.services.analytics import (
+    analytics_cache_entries,
+    get_aggregate_cached,
+    get_cuisine_cooccurrence_cached,
+    get_cuisine_summary_cached,
     get_foodie_areas_cached,
     get_restaurant_type_summary_cached,
     get_top_restaurants_cached,
 )
-from src.utils.charts import foodie_areas_bar_chart, restaurant_types_pie_chart, top_restaurants_bar_chart
-
+from src.services.bounded_cache import DEFAULT_MAX_ENTRIES, BoundedCache
+from src.services.chains import chain_index_entries, find_chains
+from src.services.charts import (
+    CHART_TYPES,
+    PinnedChartStore,
+    chart_series_payload,
+    chart_size_in_range,
+    render_chart_payload,
+)
+from src.services.cube import rollup_cube_entries
+from src.services.dataset import dataset_fingerprint, dataset_version
+from src.services.deadline import Deadline, DeadlineExceeded
+from src.services.indexes import RowFilter, dataset_index_entries, parse_row_filter
+from src.services.memory import (
+    MemoryReport,
+    MemorySampler,
+    collect_memory_report,
+    peak_rss_bytes,
+    process_rss_bytes,
+)
+from src.services.ranking import weighted_rating_entries
+from src.services.restaurants import (
+    get_restaurant,
+    parse_unit,
+    restaurant_table_entries,
+)
+from src.services.restaurants import lookup_restaurants as lookup_restaurant_records
+from src.services.search import find_restaurants, search_index_entries
+from src.services.similar import find_similar_restaurants, similarity_index_entries
+from src.services.single_flight import SingleFlight
+from src.utils.charts import layout_templates
+from src.utils.metrics import CACHE_EVENTS
+from src.utils.profiling import find_profile
+from src.utils.timing import stage
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 
+# Everything the dashboard page renders on load, as one batch.
+DASHBOARD_QUERIES = [
+    BatchQuery(id="restaurant-types", endpoint="restaurant-types"),
+    BatchQuery(id="top-restaurants", endpoint="top-restaurants"),
+    BatchQuery(id="foodie-areas", endpoint="foodie-areas"),
+    *[
+        BatchQuery(
+            id=chart_type, endpoint="chart-data", params={"chart_type": chart_type}
+        )
+        for chart_type in CHART_TYPES
+    ],
+]
 
-def _get_cache() -> Dict[str, Any]:
-    cache = current_app.config.setdefault("API_CACHE", {})
-    if isinstance(cache, dict):
-        return cache
-    current_app.config["API_CACHE"] = {}
-    return current_app.config["API_CACHE"]
 
+# Endpoints that can answer from an expired cache entry instead of being shed.
+_STALE_CAPABLE_ENDPOINTS = {"api.get_chart", "api.get_chart_data"}
 
-def _cache_get(key: str) -> Any | None:
-    cache = _get_cache()
-    item = cache.get(key)
-    if not item:
-        return None
-    ts = item.get("ts")
-    ttl = item.get("ttl")
-    if not isinstance(ts, (int, float)) or not isinstance(ttl, (int, float)):
-        return None
-    if time.time() - ts > ttl:
-        cache.pop(key, None)
+# Longest accepted restaurant search query, in characters.
+_MAX_SEARCH_QUERY = 100
+
+
+def _get_admission() -> AdmissionController:
+    controller = current_app.config.get("ADMISSION")
+    if isinstance(controller, AdmissionController):
+        return controller
+    controller = AdmissionController()
+    current_app.config["ADMISSION"] = controller
+    return controller
+
+
+def _overloaded_response(exc: OverloadedError) -> Response:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    response = jsonify(
+        make_error_response(request_id=request_id, processing_time_ms=0, error=str(exc))
+    )
+    response.status_code = 503
+    response.headers["Retry-After"] = str(exc.retry_after_seconds)
+    return response
+
+
+def _deadline_exceeded_response(exc: DeadlineExceeded) -> Response:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    response = jsonify(
+        make_error_response(request_id=request_id, processing_time_ms=0, error=str(exc))
+    )
+    response.status_code = 504
+    return response
+
+
+@api_bp.before_request
+def _start_deadline() -> Optional[ResponseReturnValue]:
+    """Attach the request deadline: ``X-Request-Deadline-Ms`` header or ``deadline_ms``
+    query parameter, capped at (and defaulting to) ``REQUEST_DEADLINE_MS``."""
+    server_ms = int(current_app.config.get("REQUEST_DEADLINE_MS", 30000))
+    raw = request.headers.get("X-Request-Deadline-Ms") or request.args.get(
+        "deadline_ms"
+    )
+
+    deadline_ms = server_ms
+    if raw is not None:
+        try:
+            deadline_ms = int(raw)
+        except ValueError:
+            deadline_ms = 0
+        if deadline_ms < 1:
+            request_id = getattr(g, "request_id", str(uuid.uuid4()))
+            return jsonify(
+                make_error_response(
+                    request_id=request_id,
+                    processing_time_ms=0,
+                    error=(
+                        "Invalid parameter: deadline must be a positive integer"
+                        " of milliseconds"
+                    ),
+                )
+            ), 400
+        deadline_ms = min(deadline_ms, server_ms)
+
+    g.deadline = Deadline.after_ms(deadline_ms)
+    return None
+
+
+@api_bp.before_request
+def _admit_request() -> Optional[ResponseReturnValue]:
+    endpoint = request.endpoint or ""
+    controller = _get_admission()
+    policy = controller.policy(endpoint)
+    if policy is None:
         return None
-    return item.get("value")
+
+    if not controller.try_acquire(endpoint):
+        if endpoint in _STALE_CAPABLE_ENDPOINTS:
+            # Let the route answer from whatever the cache holds, however old.
+            g.admission_degraded = True
+            return None
+        controller.record_rejected(endpoint)
+        return _overloaded_response(
+            OverloadedError(endpoint, policy.retry_after_seconds)
+        )
+
+    g.admission_endpoint = endpoint
+    g.admission_start = perf_counter()
+    return None
+
+
+@api_bp.teardown_request
+def _release_admission(exc: BaseException | None) -> None:
+    endpoint = g.pop("admission_endpoint", None)
+    if endpoint is not None:
+        latency_ms = (perf_counter() - g.pop("admission_start", perf_counter())) * 1000
+        _get_admission().release(endpoint, latency_ms)
 
 
-def _cache_set(key: str, value: Any, *, ttl: int = 300) -> None:
+@api_bp.errorhandler(OverloadedError)
+def _handle_overloaded(exc: OverloadedError) -> Response:
+    return _overloaded_response(exc)
+
+
+@api_bp.errorhandler(DeadlineExceeded)
+def _handle_deadline_exceeded(exc: DeadlineExceeded) -> Response:
+    return _deadline_exceeded_response(exc)
+
+
+def _get_cache() -> BoundedCache[str, Dict[str, Any]]:
+    max_entries = int(current_app.config.get("CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+    cache = current_app.config.get("API_CACHE")
+    if isinstance(cache, BoundedCache):
+        cache.max_entries = max_entries
+        return cache
+    items = cache.items() if isinstance(cache, dict) else ()
+    bounded: BoundedCache[str, Dict[str, Any]] = BoundedCache(
+        items, max_entries=max_entries
+    )
+    current_app.config["API_CACHE"] = bounded
+    return bounded
+
+
+def _get_cache_flight() -> SingleFlight:
+    flight = current_app.config.get("API_CACHE_FLIGHT")
+    if isinstance(flight, SingleFlight):
+        return flight
+    flight = SingleFlight()
+    current_app.config["API_CACHE_FLIGHT"] = flight
+    return flight
+
+
+def _cache_get_or_compute(
+    key: str, compute: Callable[[Optional[Deadline]], Any], *, ttl: int = 300
+) -> Any:
+    """Return a cached value, computing it at most once across concurrent requests.
+
+    With ``CACHE_STALE_WHILE_REVALIDATE`` > 0, an entry that expired less than
+    that many seconds ago is returned as-is while a background refresh runs.
+    When admission control has degraded the request, any cached entry is
+    returned regardless of age and a miss raises ``OverloadedError``.
+
+    ``compute`` receives the request deadline, or ``None`` for background
+    refreshes, which are not tied to the request that triggered them.
+    """
     cache = _get_cache()
-    cache[key] = {"ts": time.time(), "ttl": ttl, "value": value}
+    flight = _get_cache_flight()
+    stale_seconds = int(current_app.config.get("CACHE_STALE_WHILE_REVALIDATE", 0))
+    deadline: Optional[Deadline] = g.get("deadline")
+
+    def compute_and_store(run_deadline: Optional[Deadline]) -> Any:
+        value = compute(run_deadline)
+        evicted = cache.put(key, {"ts": time.time(), "ttl": ttl, "value": value})
+        if evicted:
+            CACHE_EVENTS.inc("api", "eviction", amount=evicted)
+        return value
+
+    with stage("cache"):
+        item = cache.get(key)
+        if g.get("admission_degraded"):
+            endpoint = request.endpoint or ""
+            if item:
+                CACHE_EVENTS.inc("api", "stale")
+                _get_admission().record_stale(endpoint)
+                return item.get("value")
+            _get_admission().record_rejected(endpoint)
+            policy = _get_admission().policy(endpoint)
+            raise OverloadedError(endpoint, policy.retry_after_seconds if policy else 1)
+
+        if item:
+            ts = item.get("ts")
+            item_ttl = item.get("ttl")
+            if isinstance(ts, (int, float)) and isinstance(item_ttl, (int, float)):
+                age = time.time() - ts
+                if age <= item_ttl:
+                    CACHE_EVENTS.inc("api", "hit")
+                    cache.touch(key)
+                    return item.get("value")
+                if age <= item_ttl + stale_seconds:
+                    CACHE_EVENTS.inc("api", "stale")
+                    cache.touch(key)
+                    flight.refresh(key, lambda: compute_and_store(None))
+                    return item.get("value")
+            if cache.discard(key, item):
+                CACHE_EVENTS.inc("api", "eviction")
+
+        CACHE_EVENTS.inc("api", "miss")
+
+    return flight.do(key, lambda: compute_and_store(deadline), deadline=deadline)
+
+
+def _json_response(payload: BaseModel) -> Response:
+    with stage("serialize"):
+        return jsonify(payload.model_dump(mode="json"))
+
+
+def _get_pinned_charts() -> PinnedChartStore:
+    store = current_app.config.get("PINNED_CHARTS")
+    if isinstance(store, PinnedChartStore):
+        return store
+    store = PinnedChartStore()
+    current_app.config["PINNED_CHARTS"] = store
+    return store
+
+
+def _cache_snapshot(cache: object) -> Dict[str, Any]:
+    # Request threads write to the cache while the sampler copies it.
+    if isinstance(cache, BoundedCache):
+        return cache.snapshot()
+    return dict(cache) if isinstance(cache, dict) else {}
+
+
+def create_memory_sampler(app: Flask) -> MemorySampler:
+    """The sampler behind the ``/api/health`` memory breakdown.
+
+    It runs outside any request, so it reads config off ``app`` itself.
+    """
+
+    def collect() -> MemoryReport:
+        pinned = app.config.get("PINNED_CHARTS")
+        return collect_memory_report(
+            app.config.get("RESTAURANTS_DF"),
+            caches={
+                "api": _cache_snapshot(app.config.get("API_CACHE")),
+                "analytics": analytics_cache_entries(),
+            },
+            precomputed={
+                "pinned_charts": (
+                    pinned.items() if isinstance(pinned, PinnedChartStore) else {}
+                ),
+                "chart_layout_templates": layout_templates(),
+                "restaurant_tables": restaurant_table_entries(),
+                "filter_indexes": dataset_index_entries(),
+                "rollup_cubes": rollup_cube_entries(),
+                "weighted_ratings": weighted_rating_entries(),
+                "similarity_indexes": similarity_index_entries(),
+                "search_indexes": search_index_entries(),
+                "chain_indexes": chain_index_entries(),
+            },
+        )
+
+    interval = float(app.config.get("MEMORY_SAMPLE_INTERVAL", 60))
+    return MemorySampler(collect, interval_seconds=interval)
+
+
+def _get_memory_sampler() -> MemorySampler:
+    sampler: MemorySampler = current_app.extensions["memory_sampler"]
+    return sampler
+
+
+def _parse_limit(raw: str, *, maximum: int) -> int:
+    try:
+        limit = int(raw)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid parameter: limit must be an integer") from None
+    if limit < 1 or limit > maximum:
+        raise ValueError(f"Invalid parameter: limit must be between 1 and {maximum}")
+    return limit
+
+
+def _parse_sort_by(raw: str) -> str:
+    if raw not in {"votes", "rating", "weighted_rating"}:
+        raise ValueError(
+            "Invalid parameter: sort_by must be one of: votes, rating, weighted_rating"
+        )
+    return raw
+
+
+def _restaurant_types_data(
+    restaurants_df: Any, *, filters: Optional[RowFilter] = None, unit: str = "listings"
+) -> RestaurantTypesData:
+    result = get_restaurant_type_summary_cached(
+        restaurants_df, filters=filters, unit=unit, deadline=g.get("deadline")
+    )
+    with stage("validate"):
+        return RestaurantTypesData(
+            restaurant_types=[
+                {
+                    "restaurant_type": item.restaurant_type,
+                    "count": item.count,
+                    "percentage": item.percentage,
+                    "avg_rating": item.avg_rating,
+                    "avg_cost_for_two": item.avg_cost_for_two,
+                }
+                for item in result.restaurant_types
+            ],
+            total_types=len(result.restaurant_types),
+        )
+
+
+def _top_restaurants_data(
+    restaurants_df: Any,
+    *,
+    limit: int,
+    sort_by: str,
+    filters: Optional[RowFilter] = None,
+    unit: str = "listings",
+) -> TopRestaurantsData:
+    result = get_top_restaurants_cached(
+        restaurants_df,
+        limit=limit,
+        sort_by=sort_by,  # type: ignore[arg-type]
+        filters=filters,
+        unit=unit,
+        deadline=g.get("deadline"),
+    )
+    with stage("validate"):
+        return TopRestaurantsData(
+            top_restaurants=[
+                {
+                    "name": item.name,
+                    "location": item.location,
+                    "rating": item.rating,
+                    "votes": item.votes,
+                    "restaurant_type": item.restaurant_type,
+                    "cuisines": item.cuisines,
+                    "rank": item.rank,
+                    "restaurant_id": item.restaurant_id,
+                }
+                for item in result.top_restaurants
+            ],
+            total_restaurants=result.total_restaurants,
+        )
+
+
+def _foodie_areas_data(
+    restaurants_df: Any,
+    *,
+    limit: int,
+    filters: Optional[RowFilter] = None,
+    unit: str = "listings",
+) -> FoodieAreasData:
+    result = get_foodie_areas_cached(
+        restaurants_df,
+        limit=limit,
+        filters=filters,
+        unit=unit,
+        deadline=g.get("deadline"),
+    )
+    with stage("validate"):
+        return FoodieAreasData(
+            foodie_areas=[
+                {
+                    "area": item.area,
+                    "restaurant_count": item.restaurant_count,
+                    "avg_rating": item.avg_rating,
+                    "top_cuisines": item.top_cuisines,
+                    "restaurant_types": item.restaurant_types,
+                }
+                for item in result.foodie_areas
+            ],
+            total_areas=result.total_areas,
+        )
+
+
+def _cuisines_data(
+    restaurants_df: Any,
+    *,
+    limit: int,
+    filters: Optional[RowFilter] = None,
+    unit: str = "listings",
+) -> CuisinesData:
+    result = get_cuisine_summary_cached(
+        restaurants_df,
+        limit=limit,
+        filters=filters,
+        unit=unit,
+        deadline=g.get("deadline"),
+    )
+    with stage("validate"):
+        return CuisinesData(
+            cuisines=[
+                CuisineSummaryModel(**asdict(item)) for item in result.cuisines
+            ],
+            total_cuisines=result.total_cuisines,
+        )
+
+
+def _cuisine_cooccurrence_data(
+    restaurants_df: Any,
+    *,
+    limit: int,
+    filters: Optional[RowFilter] = None,
+    unit: str = "listings",
+) -> CuisineCooccurrenceData:
+    result = get_cuisine_cooccurrence_cached(
+        restaurants_df,
+        limit=limit,
+        filters=filters,
+        unit=unit,
+        deadline=g.get("deadline"),
+    )
+    with stage("validate"):
+        return CuisineCooccurrenceData(
+            pairs=[CuisinePairModel(**asdict(item)) for item in result.pairs],
+            total_pairs=result.total_pairs,
+        )
+
+
+def _chart_series_data(restaurants_df: Any, chart_type: str) -> ChartSeriesData:
+    cache_key = f"chart-data:{dataset_version(restaurants_df)}:{chart_type}"
+    series = _cache_get_or_compute(
+        cache_key,
+        lambda deadline: chart_series_payload(
+            restaurants_df, chart_type, deadline=deadline
+        ),
+    )
+    with stage("validate"):
+        return ChartSeriesData(**series)
+
+
+def _run_batch_query(restaurants_df: Any, query: BatchQuery) -> BatchResult:
+    params = {key: str(value) for key, value in query.params.items()}
+
+    try:
+        filters = parse_row_filter(params)
+        unit = parse_unit(params.get("unit"))
+        if query.endpoint == "top-restaurants":
+            limit = _parse_limit(params.get("limit", "10"), maximum=10)
+            sort_by = _parse_sort_by(params.get("sort_by", "votes"))
+        elif query.endpoint == "foodie-areas":
+            limit = _parse_limit(params.get("limit", "10"), maximum=20)
+        elif query.endpoint == "chart-data":
+            chart_type = params.get("chart_type", "")
+            if chart_type not in CHART_TYPES:
+                return BatchResult(
+                    success=False,
+                    status_code=404,
+                    error=f"Chart type '{chart_type}' not found",
+                )
+    except ValueError as exc:
+        return BatchResult(success=False, status_code=400, error=str(exc))
+
+    try:
+        if query.endpoint == "restaurant-types":
+            data: Any = _restaurant_types_data(
+                restaurants_df, filters=filters, unit=unit
+            )
+        elif query.endpoint == "top-restaurants":
+            data = _top_restaurants_data(
+                restaurants_df, limit=limit, sort_by=sort_by, filters=filters, unit=unit
+            )
+        elif query.endpoint == "foodie-areas":
+            data = _foodie_areas_data(
+                restaurants_df, limit=limit, filters=filters, unit=unit
+            )
+        else:
+            data = _chart_series_data(restaurants_df, chart_type)
+    except DeadlineExceeded as exc:
+        return BatchResult(success=False, status_code=504, error=str(exc))
+    except Exception as exc:
+        return BatchResult(success=False, status_code=500, error=str(exc))
+
+    return BatchResult(success=True, status_code=200, data=data.model_dump(mode="json"))
+
+
+def _batch_response(queries: list[BatchQuery]) -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    # Read the frame once so every sub-query sees the same dataset version.
+    restaurants_df = current_app.config.get("RESTAURANTS_DF")
+    if restaurants_df is None:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error="Restaurant data not loaded",
+            )
+        ), 500
+
+    payload = BatchResponse(
+        data=BatchData(
+            dataset_version=dataset_fingerprint(restaurants_df),
+            results={
+                query.id: _run_batch_query(restaurants_df, query) for query in queries
+            },
+        ),
+        metadata=make_response_metadata(
+            request_id=request_id,
+            processing_time_ms=int((perf_counter() - start) * 1000),
+        ),
+    )
+    return _json_response(payload)
+
+
+def _memory_breakdown(report: MemoryReport) -> MemoryBreakdown:
+    return MemoryBreakdown(
+        sampled_at=datetime.fromtimestamp(report.sampled_at, tz=timezone.utc),
+        dataset_bytes=report.dataset_bytes,
+        dataset_columns=report.dataset_columns,
+        caches={
+            namespace: CacheNamespaceSize(**size)
+            for namespace, size in report.caches.items()
+        },
+        precomputed=report.precomputed,
+    )
 
 
 @api_bp.get("/health")
@@ -67,7 +635,11 @@ def get_health():
 
     data_loaded = current_app.config.get("RESTAURANTS_DF") is not None
 
-    mem_mb = 0
+    rss_bytes = process_rss_bytes()
+    mem_mb = rss_bytes // (1024 * 1024)
+    # ru_maxrss is only updated periodically, so it can trail the live RSS.
+    peak_mem_mb = max(peak_rss_bytes(), rss_bytes) // (1024 * 1024)
+    report = _get_memory_sampler().latest()
 
     uptime_seconds = int(time.time() - current_app.config.get("START_TIME", time.time()))
 
@@ -76,14 +648,62 @@ def get_health():
             status="healthy",
             uptime_seconds=uptime_seconds,
             memory_usage_mb=mem_mb,
+            peak_memory_usage_mb=peak_mem_mb,
             data_loaded=data_loaded,
+            memory=_memory_breakdown(report) if report is not None else None,
         ),
         metadata=make_response_metadata(
-            request_id=request_id, processing_time_ms=int((perf_counter() - start) * 1000)
+            request_id=request_id,
+            processing_time_ms=int((perf_counter() - start) * 1000),
         ),
     )
 
-    return jsonify(payload.model_dump(mode="json"))
+    return _json_response(payload)
+
+
+@api_bp.get("/admission")
+def get_admission() -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    payload = AdmissionResponse(
+        data=AdmissionData(
+            endpoints={
+                endpoint: AdmissionEndpointStats(**stats)
+                for endpoint, stats in _get_admission().snapshot().items()
+            }
+        ),
+        metadata=make_response_metadata(
+            request_id=request_id,
+            processing_time_ms=int((perf_counter() - start) * 1000),
+        ),
+    )
+    return _json_response(payload)
+
+
+@api_bp.get("/profiles/<profile_id>")
+def get_profile(profile_id: str) -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    path = None
+    if current_app.config.get("PROFILING_ENABLED"):
+        path = find_profile(current_app.config["PROFILE_DIR"], profile_id)
+    if path is None:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=f"Profile '{profile_id}' not found",
+            )
+        ), 404
+
+    mimetype = (
+        "text/plain" if path.suffix == ".collapsed" else "application/octet-stream"
+    )
+    return send_file(
+        path, mimetype=mimetype, as_attachment=True, download_name=path.name
+    )
 
 
 @api_bp.get("/restaurant-types")
@@ -102,27 +722,28 @@ def get_restaurant_types():
         ), 500
 
     try:
-        result = get_restaurant_type_summary_cached(restaurants_df)
+        filters = parse_row_filter(request.args)
+        unit = parse_unit(request.args.get("unit"))
+    except ValueError as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 400
 
+    try:
         payload = RestaurantTypesResponse(
-            data=RestaurantTypesData(
-                restaurant_types=[
-                    {
-                        "restaurant_type": item.restaurant_type,
-                        "count": item.count,
-                        "percentage": item.percentage,
-                        "avg_rating": item.avg_rating,
-                        "avg_cost_for_two": item.avg_cost_for_two,
-                    }
-                    for item in result.restaurant_types
-                ],
-                total_types=len(result.restaurant_types),
-            ),
+            data=_restaurant_types_data(restaurants_df, filters=filters, unit=unit),
             metadata=make_response_metadata(
-                request_id=request_id, processing_time_ms=int((perf_counter() - start) * 1000)
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
             ),
         )
-        return jsonify(payload.model_dump(mode="json"))
+        return _json_response(payload)
+    except DeadlineExceeded:
+        raise
     except Exception as exc:
         return jsonify(
             make_error_response(
@@ -163,7 +784,7 @@ def get_chart(chart_type: str):
             )
         ), 400
 
-    if width < 300 or width > 1200 or height < 200 or height > 800:
+    if not chart_size_in_range(width, height):
         return jsonify(
             make_error_response(
                 request_id=request_id,
@@ -172,8 +793,7 @@ def get_chart(chart_type: str):
             )
         ), 400
 
-    valid_types = {"restaurant-types-pie", "top-restaurants-bar", "foodie-areas-bar"}
-    if chart_type not in valid_types:
+    if chart_type not in CHART_TYPES:
         return jsonify(
             make_error_response(
                 request_id=request_id,
@@ -182,56 +802,46 @@ def get_chart(chart_type: str):
             )
         ), 404
 
-    cache_key = f"chart:{chart_type}:{width}:{height}"  # intentionally not including data hash
-    cached = _cache_get(cache_key)
-    if cached is not None:
+    pinned = _get_pinned_charts().get(
+        dataset_version(restaurants_df), chart_type, width, height
+    )
+    if pinned is not None:
+        with stage("validate"):
+            chart_data = ChartData(**pinned)
         payload = ChartResponse(
-            data=ChartData(**cached),
+            data=chart_data,
             metadata=make_response_metadata(
-                request_id=request_id, processing_time_ms=int((perf_counter() - start) * 1000)
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
             ),
         )
-        return jsonify(payload.model_dump(mode="json"))
+        return _json_response(payload)
 
+    cache_key = f"chart:{chart_type}:{width}:{height}"  # intentionally not including data hash
     try:
-        if chart_type == "restaurant-types-pie":
-            analytics_key = "analytics:restaurant-types"
-            result = _cache_get(analytics_key)
-            if result is None:
-                result = get_restaurant_type_summary_cached(restaurants_df)
-                _cache_set(analytics_key, result, ttl=300)
-            chart = restaurant_types_pie_chart(result.restaurant_types, width=width, height=height)
-        elif chart_type == "top-restaurants-bar":
-            analytics_key = "analytics:top-restaurants"
-            result = _cache_get(analytics_key)
-            if result is None:
-                result = get_top_restaurants_cached(restaurants_df)
-                _cache_set(analytics_key, result, ttl=300)
-            chart = top_restaurants_bar_chart(result.top_restaurants, width=width, height=height)
-        else:
-            analytics_key = "analytics:foodie-areas"
-            result = _cache_get(analytics_key)
-            if result is None:
-                result = get_foodie_areas_cached(restaurants_df)
-                _cache_set(analytics_key, result, ttl=300)
-            chart = foodie_areas_bar_chart(result.foodie_areas, width=width, height=height)
-
-        chart_payload = {
-            "chart_type": chart_type,
-            "title": chart.title,
-            "base64_image": chart.base64_image,
-            "width": width,
-            "height": height,
-        }
-        _cache_set(cache_key, chart_payload, ttl=300)
+        chart_payload = _cache_get_or_compute(
+            cache_key,
+            lambda deadline: render_chart_payload(
+                restaurants_df,
+                chart_type,
+                width=width,
+                height=height,
+                deadline=deadline,
+            ),
+        )
 
+        with stage("validate"):
+            chart_data = ChartData(**chart_payload)
         payload = ChartResponse(
-            data=ChartData(**chart_payload),
+            data=chart_data,
             metadata=make_response_metadata(
-                request_id=request_id, processing_time_ms=int((perf_counter() - start) * 1000)
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
             ),
         )
-        return jsonify(payload.model_dump(mode="json"))
+        return _json_response(payload)
+    except (DeadlineExceeded, OverloadedError):
+        raise
     except Exception as exc:
         return jsonify(
             make_error_response(
@@ -242,8 +852,8 @@ def get_chart(chart_type: str):
         ), 500
 
 
-@api_bp.get("/foodie-areas")
-def get_foodie_areas():
+@api_bp.get("/charts/<chart_type>/data")
+def get_chart_data(chart_type: str) -> ResponseReturnValue:
     request_id = getattr(g, "request_id", str(uuid.uuid4()))
     start = perf_counter()
 
@@ -257,49 +867,77 @@ def get_foodie_areas():
             )
         ), 500
 
-    limit_raw = request.args.get("limit", "10")
+    if chart_type not in CHART_TYPES:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=f"Chart type '{chart_type}' not found",
+            )
+        ), 404
+
     try:
-        limit = int(limit_raw)
-    except ValueError:
+        payload = ChartSeriesResponse(
+            data=_chart_series_data(restaurants_df, chart_type),
+            metadata=make_response_metadata(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+            ),
+        )
+        return _json_response(payload)
+    except (DeadlineExceeded, OverloadedError):
+        raise
+    except Exception as exc:
         return jsonify(
             make_error_response(
                 request_id=request_id,
                 processing_time_ms=int((perf_counter() - start) * 1000),
-                error="Invalid parameter: limit must be an integer",
+                error=str(exc),
             )
-        ), 400
+        ), 500
+
+
+@api_bp.get("/foodie-areas")
+def get_foodie_areas():
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
 
-    if limit < 1 or limit > 20:
+    restaurants_df = current_app.config.get("RESTAURANTS_DF")
+    if restaurants_df is None:
         return jsonify(
             make_error_response(
                 request_id=request_id,
                 processing_time_ms=int((perf_counter() - start) * 1000),
-                error="Invalid parameter: limit must be between 1 and 20",
+                error="Restaurant data not loaded",
             )
-        ), 400
+        ), 500
 
     try:
-        result = get_foodie_areas_cached(restaurants_df, limit=limit)  # type: ignore[arg-type]
+        limit = _parse_limit(request.args.get("limit", "10"), maximum=20)
+        filters = parse_row_filter(request.args)
+        unit = parse_unit(request.args.get("unit"))
+    except ValueError as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 400
 
+    try:
         payload = FoodieAreasResponse(
-            data=FoodieAreasData(
-                foodie_areas=[
-                    {
-                        "area": item.area,
-                        "restaurant_count": item.restaurant_count,
-                        "avg_rating": item.avg_rating,
-                        "top_cuisines": item.top_cuisines,
-                        "restaurant_types": item.restaurant_types,
-                    }
-                    for item in result.foodie_areas
-                ],
-                total_areas=result.total_areas,
+            data=_foodie_areas_data(
+                restaurants_df, limit=limit, filters=filters, unit=unit
             ),
             metadata=make_response_metadata(
-                request_id=request_id, processing_time_ms=int((perf_counter() - start) * 1000)
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
             ),
         )
-        return jsonify(payload.model_dump(mode="json"))
+        return _json_response(payload)
+    except DeadlineExceeded:
+        raise
     except Exception as exc:
         return jsonify(
             make_error_response(
@@ -325,62 +963,84 @@ def get_top_restaurants():
             )
         ), 500
 
-    limit_raw = request.args.get("limit", "10")
-    sort_by = request.args.get("sort_by", "votes")
-
     try:
-        limit = int(limit_raw)
-    except ValueError:
+        limit = _parse_limit(request.args.get("limit", "10"), maximum=10)
+        sort_by = _parse_sort_by(request.args.get("sort_by", "votes"))
+        filters = parse_row_filter(request.args)
+        unit = parse_unit(request.args.get("unit"))
+    except ValueError as exc:
         return jsonify(
             make_error_response(
                 request_id=request_id,
                 processing_time_ms=int((perf_counter() - start) * 1000),
-                error="Invalid parameter: limit must be an integer",
+                error=str(exc),
             )
         ), 400
 
-    if limit < 1 or limit > 10:
+    try:
+        payload = TopRestaurantsResponse(
+            data=_top_restaurants_data(
+                restaurants_df, limit=limit, sort_by=sort_by, filters=filters, unit=unit
+            ),
+            metadata=make_response_metadata(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+            ),
+        )
+        return _json_response(payload)
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 500
+
+
+@api_bp.get("/cuisines")
+def get_cuisines() -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    restaurants_df = current_app.config.get("RESTAURANTS_DF")
+    if restaurants_df is None:
         return jsonify(
             make_error_response(
                 request_id=request_id,
                 processing_time_ms=int((perf_counter() - start) * 1000),
-                error="Invalid parameter: limit must be between 1 and 10",
+                error="Restaurant data not loaded",
             )
-        ), 400
+        ), 500
 
-    if sort_by not in {"votes", "rating"}:
+    try:
+        limit = _parse_limit(request.args.get("limit", "50"), maximum=500)
+        filters = parse_row_filter(request.args)
+        unit = parse_unit(request.args.get("unit"))
+    except ValueError as exc:
         return jsonify(
             make_error_response(
                 request_id=request_id,
                 processing_time_ms=int((perf_counter() - start) * 1000),
-                error="Invalid parameter: sort_by must be one of: votes, rating",
+                error=str(exc),
             )
         ), 400
 
     try:
-        result = get_top_restaurants_cached(restaurants_df, limit=limit, sort_by=sort_by)  # type: ignore[arg-type]
-
-        payload = TopRestaurantsResponse(
-            data=TopRestaurantsData(
-                top_restaurants=[
-                    {
-                        "name": item.name,
-                        "location": item.location,
-                        "rating": item.rating,
-                        "votes": item.votes,
-                        "restaurant_type": item.restaurant_type,
-                        "cuisines": item.cuisines,
-                        "rank": item.rank,
-                    }
-                    for item in result.top_restaurants
-                ],
-                total_restaurants=result.total_restaurants,
+        payload = CuisinesResponse(
+            data=_cuisines_data(
+                restaurants_df, limit=limit, filters=filters, unit=unit
             ),
             metadata=make_response_metadata(
-                request_id=request_id, processing_time_ms=int((perf_counter() - start) * 1000)
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
             ),
         )
-        return jsonify(payload.model_dump(mode="json"))
+        return _json_response(payload)
+    except DeadlineExceeded:
+        raise
     except Exception as exc:
         return jsonify(
             make_error_response(
@@ -389,3 +1049,461 @@ def get_top_restaurants():
                 error=str(exc),
             )
         ), 500
+
+
+@api_bp.get("/cuisines/co-occurrence")
+def get_cuisine_cooccurrence() -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    restaurants_df = current_app.config.get("RESTAURANTS_DF")
+    if restaurants_df is None:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error="Restaurant data not loaded",
+            )
+        ), 500
+
+    try:
+        limit = _parse_limit(request.args.get("limit", "50"), maximum=500)
+        filters = parse_row_filter(request.args)
+        unit = parse_unit(request.args.get("unit"))
+    except ValueError as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 400
+
+    try:
+        payload = CuisineCooccurrenceResponse(
+            data=_cuisine_cooccurrence_data(
+                restaurants_df, limit=limit, filters=filters, unit=unit
+            ),
+            metadata=make_response_metadata(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+            ),
+        )
+        return _json_response(payload)
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 500
+
+
+@api_bp.get("/chains")
+def get_chains() -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    restaurants_df = current_app.config.get("RESTAURANTS_DF")
+    if restaurants_df is None:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error="Restaurant data not loaded",
+            )
+        ), 500
+
+    try:
+        limit = _parse_limit(request.args.get("limit", "20"), maximum=200)
+        try:
+            min_outlets = int(request.args.get("min_outlets", "2"))
+        except ValueError:
+            raise ValueError(
+                "Invalid parameter: min_outlets must be an integer"
+            ) from None
+        if min_outlets < 2:
+            raise ValueError("Invalid parameter: min_outlets must be at least 2")
+    except ValueError as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 400
+
+    try:
+        with stage("compute"):
+            result = find_chains(restaurants_df, limit=limit, min_outlets=min_outlets)
+        with stage("validate"):
+            data = ChainsData(
+                chains=[
+                    RestaurantChainModel(**asdict(chain)) for chain in result.chains
+                ],
+                total_chains=result.total_chains,
+            )
+        payload = ChainsResponse(
+            data=data,
+            metadata=make_response_metadata(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+            ),
+        )
+        return _json_response(payload)
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 500
+
+
+@api_bp.get("/restaurants/search")
+def search_restaurants() -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    restaurants_df = current_app.config.get("RESTAURANTS_DF")
+    if restaurants_df is None:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error="Restaurant data not loaded",
+            )
+        ), 500
+
+    query = request.args.get("q", "").strip()
+    try:
+        if not query:
+            raise ValueError("Invalid parameter: q is required")
+        if len(query) > _MAX_SEARCH_QUERY:
+            raise ValueError(
+                f"Invalid parameter: q must be at most {_MAX_SEARCH_QUERY} characters"
+            )
+        limit = _parse_limit(request.args.get("limit", "10"), maximum=50)
+    except ValueError as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 400
+
+    try:
+        with stage("compute"):
+            result = find_restaurants(
+                restaurants_df,
+                query,
+                limit=limit,
+                location=request.args.get("location"),
+            )
+        with stage("validate"):
+            data = RestaurantSearchData(
+                query=query,
+                restaurants=[
+                    RestaurantModel(**asdict(item)) for item in result.restaurants
+                ],
+            )
+        payload = RestaurantSearchResponse(
+            data=data,
+            metadata=make_response_metadata(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+            ),
+        )
+        return _json_response(payload)
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 500
+
+
+@api_bp.get("/restaurants/<restaurant_id>")
+def get_restaurant_detail(restaurant_id: str) -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    restaurants_df = current_app.config.get("RESTAURANTS_DF")
+    if restaurants_df is None:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error="Restaurant data not loaded",
+            )
+        ), 500
+
+    try:
+        with stage("compute"):
+            record = get_restaurant(restaurants_df, restaurant_id)
+        if record is None:
+            return jsonify(
+                make_error_response(
+                    request_id=request_id,
+                    processing_time_ms=int((perf_counter() - start) * 1000),
+                    error=f"Restaurant '{restaurant_id}' not found",
+                )
+            ), 404
+        payload = RestaurantResponse(
+            data=RestaurantModel(**asdict(record)),
+            metadata=make_response_metadata(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+            ),
+        )
+        return _json_response(payload)
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 500
+
+
+@api_bp.post("/restaurants/lookup")
+def lookup_restaurants() -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    restaurants_df = current_app.config.get("RESTAURANTS_DF")
+    if restaurants_df is None:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error="Restaurant data not loaded",
+            )
+        ), 500
+
+    try:
+        lookup = RestaurantLookupRequest.model_validate(
+            request.get_json(silent=True) or {}
+        )
+    except ValidationError as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=f"Invalid request body: {exc.error_count()} validation error(s)",
+            )
+        ), 400
+    if not lookup.ids and not lookup.keys:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error="Invalid request body: ids or keys is required",
+            )
+        ), 400
+
+    try:
+        with stage("compute"):
+            records = lookup_restaurant_records(
+                restaurants_df,
+                ids=lookup.ids,
+                keys=[(key.name, key.location) for key in lookup.keys],
+            )
+        with stage("validate"):
+            data = RestaurantLookupData(
+                restaurants=[
+                    None if record is None else RestaurantModel(**asdict(record))
+                    for record in records
+                ],
+                found=sum(record is not None for record in records),
+            )
+        payload = RestaurantLookupResponse(
+            data=data,
+            metadata=make_response_metadata(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+            ),
+        )
+        return _json_response(payload)
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 500
+
+
+@api_bp.get("/restaurants/<restaurant_id>/similar")
+def get_similar_restaurants(restaurant_id: str) -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    restaurants_df = current_app.config.get("RESTAURANTS_DF")
+    if restaurants_df is None:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error="Restaurant data not loaded",
+            )
+        ), 500
+
+    try:
+        limit = _parse_limit(request.args.get("limit", "10"), maximum=50)
+    except ValueError as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 400
+
+    try:
+        with stage("compute"):
+            result = find_similar_restaurants(
+                restaurants_df, restaurant_id, limit=limit
+            )
+        if result is None:
+            return jsonify(
+                make_error_response(
+                    request_id=request_id,
+                    processing_time_ms=int((perf_counter() - start) * 1000),
+                    error=f"Restaurant '{restaurant_id}' not found",
+                )
+            ), 404
+        with stage("validate"):
+            data = SimilarRestaurantsData(
+                restaurant=RestaurantModel(**asdict(result.restaurant)),
+                similar=[
+                    SimilarRestaurantModel(
+                        **asdict(item.restaurant), similarity=item.similarity
+                    )
+                    for item in result.similar
+                ],
+            )
+        payload = SimilarRestaurantsResponse(
+            data=data,
+            metadata=make_response_metadata(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+            ),
+        )
+        return _json_response(payload)
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 500
+
+
+@api_bp.get("/aggregate")
+def get_aggregate() -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    restaurants_df = current_app.config.get("RESTAURANTS_DF")
+    if restaurants_df is None:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error="Restaurant data not loaded",
+            )
+        ), 500
+
+    try:
+        plan = parse_aggregate_plan(request.args)
+    except ValueError as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 400
+
+    try:
+        result = get_aggregate_cached(restaurants_df, plan, deadline=g.get("deadline"))
+        with stage("validate"):
+            data = AggregateData(
+                group_by=list(plan.group_by),
+                metrics=list(plan.metrics),
+                rows=result.rows,
+                total_groups=result.total_groups,
+            )
+        payload = AggregateResponse(
+            data=data,
+            metadata=make_response_metadata(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+            ),
+        )
+        return _json_response(payload)
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=str(exc),
+            )
+        ), 500
+
+
+@api_bp.post("/batch")
+def post_batch() -> ResponseReturnValue:
+    request_id = getattr(g, "request_id", str(uuid.uuid4()))
+    start = perf_counter()
+
+    try:
+        batch = BatchRequest.model_validate(request.get_json(silent=True) or {})
+    except ValidationError as exc:
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error=f"Invalid request body: {exc.error_count()} validation error(s)",
+            )
+        ), 400
+
+    ids = [query.id for query in batch.queries]
+    if len(set(ids)) != len(ids):
+        return jsonify(
+            make_error_response(
+                request_id=request_id,
+                processing_time_ms=int((perf_counter() - start) * 1000),
+                error="Invalid request body: query ids must be unique",
+            )
+        ), 400
+
+    return _batch_response(batch.queries)
+
+
+@api_bp.get("/dashboard")
+def get_dashboard() -> ResponseReturnValue:
+    return _batch_response(DASHBOARD_QUERIES)
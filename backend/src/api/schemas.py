@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -45,6 +45,7 @@ class TopRestaurantModel(BaseModel):
     restaurant_type: str
     cuisines: List[str]
     rank: int = Field(ge=1, le=10)
+    restaurant_id: Optional[str] = None
 
 
 class TopRestaurantsData(BaseModel):
@@ -77,6 +78,142 @@ class FoodieAreasResponse(BaseModel):
     metadata: ResponseMetadata
 
 
+class CuisineSummaryModel(BaseModel):
+    cuisine: str
+    restaurant_count: int = Field(ge=0)
+    avg_rating: Optional[float] = Field(default=None, ge=0, le=5)
+    avg_cost_for_two: Optional[int] = Field(default=None, ge=0)
+    top_areas: List[str]
+
+
+class CuisinesData(BaseModel):
+    cuisines: List[CuisineSummaryModel]
+    total_cuisines: int = Field(ge=0)
+
+
+class CuisinesResponse(BaseModel):
+    success: bool = True
+    data: CuisinesData
+    metadata: ResponseMetadata
+
+
+class CuisinePairModel(BaseModel):
+    cuisine_a: str
+    cuisine_b: str
+    count: int = Field(ge=1)
+
+
+class CuisineCooccurrenceData(BaseModel):
+    pairs: List[CuisinePairModel]
+    total_pairs: int = Field(ge=0)
+
+
+class CuisineCooccurrenceResponse(BaseModel):
+    success: bool = True
+    data: CuisineCooccurrenceData
+    metadata: ResponseMetadata
+
+
+class RestaurantChainModel(BaseModel):
+    name: str
+    outlets: int = Field(ge=2)
+    area_count: int = Field(ge=1)
+    top_areas: List[str]
+    avg_rating: Optional[float] = Field(default=None, ge=0, le=5)
+    total_votes: int = Field(ge=0)
+    name_variants: List[str]
+
+
+class ChainsData(BaseModel):
+    chains: List[RestaurantChainModel]
+    total_chains: int = Field(ge=0)
+
+
+class ChainsResponse(BaseModel):
+    success: bool = True
+    data: ChainsData
+    metadata: ResponseMetadata
+
+
+class AggregateData(BaseModel):
+    group_by: List[str]
+    metrics: List[str]
+    rows: List[Dict[str, Any]]
+    total_groups: int = Field(ge=0)
+
+
+class AggregateResponse(BaseModel):
+    success: bool = True
+    data: AggregateData
+    metadata: ResponseMetadata
+
+
+class RestaurantModel(BaseModel):
+    restaurant_id: str
+    name: str
+    location: str
+    restaurant_type: str
+    cuisines: List[str]
+    rating: Optional[float] = Field(default=None, ge=0, le=5)
+    votes: int = Field(ge=0)
+    approx_cost_for_two: Optional[int] = Field(default=None, ge=0)
+    listings: int = Field(ge=1)
+
+
+class SimilarRestaurantModel(RestaurantModel):
+    similarity: float = Field(ge=0, le=1)
+
+
+class SimilarRestaurantsData(BaseModel):
+    restaurant: RestaurantModel
+    similar: List[SimilarRestaurantModel]
+
+
+class SimilarRestaurantsResponse(BaseModel):
+    success: bool = True
+    data: SimilarRestaurantsData
+    metadata: ResponseMetadata
+
+
+class RestaurantResponse(BaseModel):
+    success: bool = True
+    data: RestaurantModel
+    metadata: ResponseMetadata
+
+
+class RestaurantKey(BaseModel):
+    name: str = Field(min_length=1)
+    location: str = Field(min_length=1)
+
+
+class RestaurantLookupRequest(BaseModel):
+    ids: List[str] = Field(default_factory=list, max_length=500)
+    keys: List[RestaurantKey] = Field(default_factory=list, max_length=500)
+
+
+class RestaurantLookupData(BaseModel):
+    # One entry per requested id, then per key; null where nothing matched.
+    restaurants: List[Optional[RestaurantModel]]
+    found: int = Field(ge=0)
+
+
+class RestaurantLookupResponse(BaseModel):
+    success: bool = True
+    data: RestaurantLookupData
+    metadata: ResponseMetadata
+
+
+class RestaurantSearchData(BaseModel):
+    query: str
+    restaurants: List[RestaurantModel]
+
+
+class RestaurantSearchResponse(BaseModel):
+    success: bool = True
+    data: RestaurantSearchData
+    metadata: ResponseMetadata
+
+
 class ChartData(BaseModel):
     chart_type: str
     title: str
@@ -91,11 +228,97 @@ class ChartResponse(BaseModel):
     metadata: ResponseMetadata
 
 
+class ChartLayoutHints(BaseModel):
+    kind: Literal["pie", "barh"]
+    value_label: str
+    show_percentages: bool
+
+
+class ChartSeriesData(BaseModel):
+    chart_type: str
+    title: str
+    labels: List[str]
+    values: List[float]
+    layout: ChartLayoutHints
+
+
+class ChartSeriesResponse(BaseModel):
+    success: bool = True
+    data: ChartSeriesData
+    metadata: ResponseMetadata
+
+
+class BatchQuery(BaseModel):
+    id: str = Field(min_length=1)
+    endpoint: Literal[
+        "restaurant-types", "top-restaurants", "foodie-areas", "chart-data"
+    ]
+    params: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    queries: List[BatchQuery] = Field(min_length=1, max_length=20)
+
+
+class BatchResult(BaseModel):
+    success: bool
+    status_code: int
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class BatchData(BaseModel):
+    # Content hash of the loaded data; changes only when the data does.
+    dataset_version: str
+    results: Dict[str, BatchResult]
+
+
+class BatchResponse(BaseModel):
+    success: bool = True
+    data: BatchData
+    metadata: ResponseMetadata
+
+
+class AdmissionEndpointStats(BaseModel):
+    in_flight: int = Field(ge=0)
+    latency_ms: float = Field(ge=0)
+    admitted: int = Field(ge=0)
+    rejected: int = Field(ge=0)
+    served_stale: int = Field(ge=0)
+    max_in_flight: int = Field(ge=1)
+    max_latency_ms: float = Field(gt=0)
+
+
+class AdmissionData(BaseModel):
+    endpoints: Dict[str, AdmissionEndpointStats]
+
+
+class AdmissionResponse(BaseModel):
+    success: bool = True
+    data: AdmissionData
+    metadata: ResponseMetadata
+
+
+class CacheNamespaceSize(BaseModel):
+    entries: int = Field(ge=0)
+    bytes: int = Field(ge=0)
+
+
+class MemoryBreakdown(BaseModel):
+    sampled_at: datetime
+    dataset_bytes: int = Field(ge=0)
+    dataset_columns: Dict[str, int]
+    caches: Dict[str, CacheNamespaceSize]
+    precomputed: Dict[str, int]
+
+
 class HealthData(BaseModel):
     status: str
     uptime_seconds: int = Field(ge=0)
     memory_usage_mb: int = Field(ge=0)
+    peak_memory_usage_mb: int = Field(default=0, ge=0)
     data_loaded: bool
+    memory: Optional[MemoryBreakdown] = None
 
 
 class HealthResponse(BaseModel):
@@ -1,21 +1,52 @@
 from __future__ import annotations
 
-import sys
-
-import os
 import logging
-import json
+import os
+import sys
+import tempfile
 import time
 from pathlib import Path
 from typing import Optional
 
-from flask import Flask, g, jsonify, render_template, request
+from flask import Flask, Response, g, jsonify, render_template, request
 
 if __name__ == "__main__" and __package__ is None:
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from src.api.routes import api_bp
+from src.api.admission import AdmissionController, parse_admission_policies
+from src.api.routes import api_bp, create_memory_sampler
+from src.api.schemas import make_error_response
+from src.services.analytics import set_cache_max_entries, set_stale_while_revalidate
+from src.services.bounded_cache import DEFAULT_MAX_ENTRIES
+from src.services.chains import get_chain_index
+from src.services.charts import PinnedChartStore, parse_chart_warmup
+from src.services.cube import get_rollup_cube
 from src.services.data_loader import load_zomato_csv
+from src.services.dataset import dataset_fingerprint
+from src.services.indexes import get_dataset_index
+from src.services.ranking import (
+    get_weighted_ratings,
+    parse_rating_prior,
+    set_rating_prior,
+)
+from src.services.restaurants import UNITS, get_restaurant_table
+from src.services.search import get_search_index
+from src.services.similar import get_similarity_index
+from src.utils.log_events import JsonEvent, sampled, start_async_logging
+from src.utils.metrics import (
+    DATASET_LOAD_SECONDS,
+    REGISTRY,
+    REQUEST_LATENCY,
+    REQUESTS_IN_FLIGHT,
+    format_metric,
+)
+from src.utils.profiling import (
+    RequestProfile,
+    is_safe_profile_id,
+    parse_profile_mode,
+    prune_profiles,
+)
+from src.utils.timing import begin_request_timings, current_timings, end_request_timings
 
 
 def _load_dotenv(dotenv_path: Path) -> None:
@@ -43,8 +74,13 @@ def _configure_logging() -> None:
         return
     handler = logging.StreamHandler()
     handler.setFormatter(logging.Formatter("%(message)s"))
-    root.addHandler(handler)
     root.setLevel(logging.INFO)
+    if os.environ.get("LOG_ASYNC", "true").lower() in {"1", "true", "yes"}:
+        # Request threads only enqueue; formatting and the blocking write
+        # happen on the listener thread.
+        start_async_logging(root, handler)
+    else:
+        root.addHandler(handler)
 
 
 def create_app() -> Flask:
@@ -63,6 +99,29 @@ def create_app() -> Flask:
 
     app.config["START_TIME"] = time.time()
 
+    # Seconds an expired cache entry may still be served while it is refreshed
+    # in the background (API and analytics caches). 0 disables it.
+    app.config["CACHE_STALE_WHILE_REVALIDATE"] = int(
+        os.environ.get("CACHE_STALE_WHILE_REVALIDATE", "0")
+    )
+    set_stale_while_revalidate(app.config["CACHE_STALE_WHILE_REVALIDATE"])
+
+    # Entries the API and analytics caches each keep before evicting the least
+    # recently used; keys vary with filter values, so they are bounded.
+    app.config["CACHE_MAX_ENTRIES"] = int(
+        os.environ.get("CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES))
+    )
+    set_cache_max_entries(app.config["CACHE_MAX_ENTRIES"])
+
+    # Prior behind sort_by=weighted_rating: votes' worth of the mean rating
+    # each restaurant starts with, and whether that mean is per location or
+    # restaurant type rather than overall.
+    app.config["WEIGHTED_RATING_PRIOR"] = parse_rating_prior(
+        os.environ.get("WEIGHTED_RATING_PRIOR_VOTES"),
+        os.environ.get("WEIGHTED_RATING_PRIOR_BY"),
+    )
+    set_rating_prior(app.config["WEIGHTED_RATING_PRIOR"])
+
     data_path = os.environ.get("DATA_FILE_PATH")
     if data_path is None:
         backend_data = repo_root / "backend" / "data" / "zomato.csv"
@@ -73,40 +132,177 @@ def create_app() -> Flask:
             data_path = str(repo_data)
 
     restaurants_df = None
+    load_start = time.perf_counter()
     try:
         loaded = load_zomato_csv(data_path)
         restaurants_df = loaded.restaurants_df
     except Exception:
         restaurants_df = None
+    else:
+        DATASET_LOAD_SECONDS.observe(time.perf_counter() - load_start)
+        # The published dataset fingerprint, the deduplicated restaurant
+        # table, filter indexes and rollup cubes (per listing and per
+        # restaurant), the weighted-rating order, the similarity and search
+        # indexes and the chain clusters are built with the data rather than
+        # on the first request that needs them.
+        dataset_fingerprint(restaurants_df)
+        get_restaurant_table(restaurants_df)
+        for unit in UNITS:
+            get_dataset_index(restaurants_df, unit)
+            get_rollup_cube(restaurants_df, unit)
+        get_weighted_ratings(restaurants_df)
+        get_similarity_index(restaurants_df)
+        get_search_index(restaurants_df)
+        get_chain_index(restaurants_df)
 
     app.config["RESTAURANTS_DF"] = restaurants_df
 
+    # Charts listed in CHART_WARMUP ("chart-type:WxH,...") are rendered in the
+    # background once the data is loaded and served without the cache TTL.
+    app.config["CHART_WARMUP"] = parse_chart_warmup(os.environ.get("CHART_WARMUP"))
+    app.config["PINNED_CHARTS"] = PinnedChartStore()
+    if restaurants_df is not None and app.config["CHART_WARMUP"]:
+        app.config["PINNED_CHARTS"].start_warmup(
+            restaurants_df, app.config["CHART_WARMUP"]
+        )
+
+    # Server-side request deadline; clients may ask for a shorter one.
+    app.config["REQUEST_DEADLINE_MS"] = int(
+        os.environ.get("REQUEST_DEADLINE_MS", "30000")
+    )
+
+    # How often /api/health re-measures the dataset, cache and precomputed sizes.
+    app.config["MEMORY_SAMPLE_INTERVAL"] = float(
+        os.environ.get("MEMORY_SAMPLE_INTERVAL", "60")
+    )
+    app.extensions["memory_sampler"] = create_memory_sampler(app)
+
+    # Opt-in per-request profiling: with PROFILING_ENABLED, a request carrying
+    # "X-Profile: cprofile|sample" (or ?profile=...) is profiled and the result
+    # kept in PROFILE_DIR under its request id.
+    app.config["PROFILING_ENABLED"] = os.environ.get(
+        "PROFILING_ENABLED", "false"
+    ).lower() in {"1", "true", "yes"}
+    app.config["PROFILE_DIR"] = Path(
+        os.environ.get(
+            "PROFILE_DIR", str(Path(tempfile.gettempdir()) / "restaurant-eda-profiles")
+        )
+    )
+    app.config["PROFILE_KEEP"] = int(os.environ.get("PROFILE_KEEP", "50"))
+    app.config["PROFILE_SAMPLE_INTERVAL_MS"] = float(
+        os.environ.get("PROFILE_SAMPLE_INTERVAL_MS", "5")
+    )
+
+    # Fraction of requests that also log request.start (1 = all, 0 = none);
+    # request.end always carries the full per-request record.
+    app.config["LOG_REQUEST_START_SAMPLE_RATE"] = float(
+        os.environ.get("LOG_REQUEST_START_SAMPLE_RATE", "1")
+    )
+
+    # Per-endpoint admission budgets ("endpoint=max_in_flight:max_latency_ms,...").
+    app.config["ADMISSION"] = AdmissionController(
+        parse_admission_policies(os.environ.get("ADMISSION_POLICIES"))
+    )
+
     app.register_blueprint(api_bp)
 
     @app.before_request
     def _before_request():
         g.request_id = request.headers.get("X-Request-ID") or os.urandom(16).hex()
         g.start_time = time.time()
+        g.stage_timings_token = begin_request_timings()
+        g.metrics_route = (
+            request.url_rule.rule if request.url_rule is not None else "unmatched"
+        )
+        REQUESTS_IN_FLIGHT.inc(g.metrics_route)
 
+        if sampled(app.config["LOG_REQUEST_START_SAMPLE_RATE"]):
+            logging.getLogger(__name__).info(
+                JsonEvent(
+                    {
+                        "event": "request.start",
+                        "request_id": g.request_id,
+                        "method": request.method,
+                        "path": request.path,
+                    }
+                )
+            )
+
+        if app.config["PROFILING_ENABLED"]:
+            try:
+                mode = parse_profile_mode(
+                    request.headers.get("X-Profile") or request.args.get("profile")
+                )
+            except ValueError as exc:
+                return jsonify(
+                    make_error_response(
+                        request_id=g.request_id, processing_time_ms=0, error=str(exc)
+                    )
+                ), 400
+            if mode is not None:
+                profile = RequestProfile(
+                    mode,
+                    sample_interval_seconds=app.config["PROFILE_SAMPLE_INTERVAL_MS"]
+                    / 1000,
+                )
+                try:
+                    profile.start()
+                except ValueError:
+                    # cProfile refuses to start while another profiler is
+                    # active on this thread.
+                    return None
+                g.profile = profile
+        return None
+
+    def _save_profile(profile: RequestProfile, response: Response) -> None:
+        request_id = getattr(g, "request_id", "")
+        profile_id = (
+            request_id if is_safe_profile_id(request_id) else os.urandom(16).hex()
+        )
+        try:
+            path = profile.save(app.config["PROFILE_DIR"], profile_id)
+            prune_profiles(app.config["PROFILE_DIR"], keep=app.config["PROFILE_KEEP"])
+        except OSError as exc:
+            logging.getLogger(__name__).warning(
+                "Could not save profile %s: %s", profile_id, exc
+            )
+            return
+        response.headers["X-Profile-Id"] = profile_id
         logging.getLogger(__name__).info(
-            json.dumps(
+            JsonEvent(
                 {
-                    "event": "request.start",
-                    "request_id": g.request_id,
-                    "method": request.method,
-                    "path": request.path,
+                    "event": "profile.saved",
+                    "request_id": request_id,
+                    "mode": profile.mode,
+                    "path": str(path),
                 }
             )
         )
 
     @app.after_request
     def _after_request(response):
+        profile = g.pop("profile", None)
+        if profile is not None:
+            _save_profile(profile, response)
+
         duration_ms = int((time.time() - getattr(g, "start_time", time.time())) * 1000)
         response.headers["X-Request-ID"] = getattr(g, "request_id", "")
         response.headers["X-Processing-Time-ms"] = str(duration_ms)
+        timings = current_timings()
+        stages_ms = timings.as_ms() if timings is not None else {}
+        if timings is not None:
+            response.headers["Server-Timing"] = timings.server_timing(
+                time.time() - getattr(g, "start_time", time.time())
+            )
+        REQUEST_LATENCY.observe(
+            time.time() - getattr(g, "start_time", time.time()),
+            getattr(g, "metrics_route", "unmatched"),
+            request.method,
+            str(response.status_code),
+        )
 
         logging.getLogger(__name__).info(
-            json.dumps(
+            JsonEvent(
                 {
                     "event": "request.end",
                     "request_id": getattr(g, "request_id", ""),
@@ -114,18 +310,31 @@ def create_app() -> Flask:
                     "path": request.path,
                     "status_code": response.status_code,
                     "processing_time_ms": duration_ms,
+                    "stages_ms": stages_ms,
                 }
             )
         )
         return response
 
+    @app.teardown_request
+    def _teardown_request(exc: Optional[BaseException]) -> None:
+        profile = g.pop("profile", None)
+        if profile is not None:
+            profile.stop()
+        token = g.pop("stage_timings_token", None)
+        if token is not None:
+            end_request_timings(token)
+        route = g.pop("metrics_route", None)
+        if route is not None:
+            REQUESTS_IN_FLIGHT.dec(route)
+
     @app.errorhandler(Exception)
     def _handle_unexpected_error(exc: Exception):
         request_id = getattr(g, "request_id", os.urandom(16).hex())
         duration_ms = int((time.time() - getattr(g, "start_time", time.time())) * 1000)
 
         logging.getLogger(__name__).error(
-            json.dumps(
+            JsonEvent(
                 {
                     "event": "request.error",
                     "request_id": request_id,
@@ -150,6 +359,39 @@ def create_app() -> Flask:
             500,
         )
 
+    @app.get("/metrics")
+    def metrics() -> Response:
+        lines = REGISTRY.render().splitlines()
+        admission = app.config["ADMISSION"].snapshot()
+        for field, kind, help_text in (
+            ("in_flight", "gauge", "Requests currently admitted, by endpoint."),
+            (
+                "latency_ms",
+                "gauge",
+                "Moving-average latency used for admission, by endpoint.",
+            ),
+            ("admitted", "counter", "Requests admitted, by endpoint."),
+            ("rejected", "counter", "Requests shed with 503, by endpoint."),
+            (
+                "served_stale",
+                "counter",
+                "Degraded requests answered from stale cache, by endpoint.",
+            ),
+        ):
+            suffix = "_total" if kind == "counter" else ""
+            lines.extend(
+                format_metric(
+                    f"restaurant_eda_admission_{field}{suffix}",
+                    kind,
+                    help_text,
+                    [
+                        ({"endpoint": name}, stats[field])
+                        for name, stats in sorted(admission.items())
+                    ],
+                )
+            )
+        return Response("\n".join(lines) + "\n", mimetype="text/plain; version=0.0.4")
+
     @app.get("/")
     def index():
         return render_template("index.html")
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+if __name__ == "__main__" and __package__ is None:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flask import Flask
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+ENDPOINT_CLASSES = ("light", "analytics", "charts")
+
+# Worker threads per endpoint class. Chart renders and analytics each get their
+# own pool so that cheap endpoints such as /api/health never queue behind them.
+DEFAULT_CONCURRENCY_LIMITS: Dict[str, int] = {"light": 16, "analytics": 4, "charts": 2}
+
+
+def classify_path(path: str) -> str:
+    if path.startswith("/api/charts/") and not path.endswith("/data"):
+        return "charts"
+    if path.startswith("/api/") and path != "/api/health":
+        return "analytics"
+    return "light"
+
+
+def parse_concurrency_limits(spec: Optional[str]) -> Dict[str, int]:
+    """Parse ``"light=16,analytics=4,charts=2"``; missing classes keep their default."""
+    limits = dict(DEFAULT_CONCURRENCY_LIMITS)
+    if not spec:
+        return limits
+    for raw in spec.split(","):
+        item = raw.strip()
+        if not item:
+            continue
+        name, _, value = item.partition("=")
+        name = name.strip()
+        try:
+            limit = int(value)
+        except ValueError:
+            raise ValueError(f"Invalid concurrency limit: {item!r}") from None
+        if name not in ENDPOINT_CLASSES or limit < 1:
+            raise ValueError(f"Invalid concurrency limit: {item!r}")
+        limits[name] = limit
+    return limits
+
+
+def _build_environ(scope: Scope, body: bytes) -> Dict[str, Any]:
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ: Dict[str, Any] = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": str(server[0]),
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": str(client[0]),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        value = raw_value.decode("latin-1")
+        if name == "CONTENT_TYPE":
+            environ["CONTENT_TYPE"] = value
+        elif name == "CONTENT_LENGTH":
+            continue  # the body is fully buffered; its real length is set above
+        else:
+            key = f"HTTP_{name}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+def _call_wsgi(
+    wsgi_app: Callable[..., Iterable[bytes]], environ: Dict[str, Any]
+) -> Tuple[int, List[Tuple[bytes, bytes]], bytes]:
+    status_headers: Dict[str, Any] = {}
+
+    def start_response(
+        status: str, headers: List[Tuple[str, str]], exc_info: Any = None
+    ) -> None:
+        status_headers["status"] = int(status.split(" ", 1)[0])
+        status_headers["headers"] = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers
+        ]
+
+    result = wsgi_app(environ, start_response)
+    try:
+        body = b"".join(result)
+    finally:
+        close = getattr(result, "close", None)
+        if close is not None:
+            close()
+    return status_headers["status"], status_headers["headers"], body
+
+
+class AsgiAdapter:
+    """Serve the Flask app over ASGI, running each request on its class's executor.
+
+    Each endpoint class has a bounded thread pool, which is the concurrency
+    limit for that class: at most ``limits[class]`` requests of the class run at
+    once and the rest wait on the event loop without holding a thread.
+    """
+
+    def __init__(
+        self, wsgi_app: Flask, *, limits: Optional[Dict[str, int]] = None
+    ) -> None:
+        self.wsgi_app = wsgi_app
+        self.limits = dict(limits or DEFAULT_CONCURRENCY_LIMITS)
+        self.executors = {
+            name: ThreadPoolExecutor(
+                max_workers=self.limits[name], thread_name_prefix=f"asgi-{name}"
+            )
+            for name in ENDPOINT_CLASSES
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise RuntimeError(f"Unsupported ASGI scope type: {scope['type']}")
+
+        chunks: List[bytes] = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+
+        environ = _build_environ(scope, b"".join(chunks))
+        executor = self.executors[classify_path(scope["path"])]
+        loop = asyncio.get_running_loop()
+        status, headers, body = await loop.run_in_executor(
+            executor, _call_wsgi, self.wsgi_app, environ
+        )
+
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def shutdown(self) -> None:
+        for executor in self.executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def create_asgi_app(wsgi_app: Optional[Flask] = None) -> AsgiAdapter:
+    if wsgi_app is None:
+        # Imported here: loading src.app builds the app and its dataset.
+        from src.app import app
+
+        wsgi_app = app
+    limits = parse_concurrency_limits(os.environ.get("CONCURRENCY_LIMITS"))
+    wsgi_app.config["CONCURRENCY_LIMITS"] = limits
+    return AsgiAdapter(wsgi_app, limits=limits)
+
+
+def create() -> AsgiAdapter:
+    """Application factory for ``uvicorn --factory src.asgi:create``."""
+    return create_asgi_app()
+
+
+if __name__ == "__main__":
+    try:
+        import uvicorn
+    except Exception as exc:  # pragma: no cover
+        raise RuntimeError(
+            "ASGI serving requires uvicorn (see requirements.txt)."
+        ) from exc
+
+    port = int(os.environ.get("FLASK_PORT", "5000"))
+    uvicorn.run(create, factory=True, host="127.0.0.1", port=port, log_level="warning")
@@ -22,6 +22,7 @@ class TopRestaurant:
     restaurant_type: str
     cuisines: List[str]
     rank: int
+    restaurant_id: Optional[str] = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -31,3 +32,49 @@ class FoodieArea:
     avg_rating: Optional[float]
     top_cuisines: List[str]
     restaurant_types: List[str]
+
+
+@dataclass(frozen=True, slots=True)
+class CuisineSummary:
+    cuisine: str
+    restaurant_count: int
+    avg_rating: Optional[float]
+    avg_cost_for_two: Optional[int]
+    top_areas: List[str]
+
+
+@dataclass(frozen=True, slots=True)
+class CuisinePair:
+    cuisine_a: str
+    cuisine_b: str
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class RestaurantRecord:
+    restaurant_id: str
+    name: str
+    location: str
+    restaurant_type: str
+    cuisines: List[str]
+    rating: Optional[float]
+    votes: int
+    approx_cost_for_two: Optional[int]
+    listings: int
+
+
+@dataclass(frozen=True, slots=True)
+class SimilarRestaurant:
+    restaurant: RestaurantRecord
+    similarity: float
+
+
+@dataclass(frozen=True, slots=True)
+class RestaurantChain:
+    name: str
+    outlets: int
+    area_count: int
+    top_areas: List[str]
+    avg_rating: Optional[float]
+    total_votes: int
+    name_variants: List[str]
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.services.cube import DIMENSIONS, RollupCube, cube_for
+from src.services.deadline import Deadline, check_deadline
+from src.services.indexes import RowFilter, parse_row_filter
+from src.services.restaurants import parse_unit
+
+METRICS = (
+    "count",
+    "rated_count",
+    "avg_rating",
+    "avg_cost_for_two",
+    "sum_votes",
+    "avg_votes",
+)
+
+MAX_LIMIT = 1000
+
+_PLAN_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
+class AggregatePlan:
+    group_by: Tuple[str, ...]
+    metrics: Tuple[str, ...]
+    order_by: Tuple[Tuple[str, bool], ...]  # (field, descending)
+    limit: int
+    filters: RowFilter
+    unit: str = "listings"
+
+    def cache_key(self) -> str:
+        order = ",".join(("-" if desc else "") + name for name, desc in self.order_by)
+        return (
+            f"{','.join(self.group_by)}|{','.join(self.metrics)}|{order}|{self.limit}"
+            f"|{self.filters.cache_key()}|{self.unit}"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AggregateResult:
+    rows: List[Dict[str, Any]]
+    total_groups: int
+
+
+def _split(raw: Optional[str]) -> List[str]:
+    return [part.strip() for part in (raw or "").split(",") if part.strip()]
+
+
+def _parse_plan(params: Mapping[str, Any]) -> AggregatePlan:
+    group_by = _split(params.get("group_by"))
+    if not group_by:
+        raise ValueError("Invalid parameter: group_by is required")
+    for name in group_by:
+        if name not in DIMENSIONS:
+            raise ValueError(
+                "Invalid parameter: group_by must be drawn from: "
+                f"{', '.join(DIMENSIONS)}"
+            )
+    if len(set(group_by)) != len(group_by):
+        raise ValueError("Invalid parameter: group_by must not repeat a dimension")
+
+    metrics = _split(params.get("metrics")) or ["count"]
+    for name in metrics:
+        if name not in METRICS:
+            raise ValueError(
+                f"Invalid parameter: metrics must be drawn from: {', '.join(METRICS)}"
+            )
+
+    order_by: List[Tuple[str, bool]] = []
+    for part in _split(params.get("order_by")):
+        name, desc = (part[1:], True) if part.startswith("-") else (part, False)
+        if name not in group_by and name not in metrics:
+            raise ValueError(
+                "Invalid parameter: order_by must name a group_by field or a"
+                " requested metric"
+            )
+        order_by.append((name, desc))
+    if not order_by:
+        # Largest groups first by default, like the hand-written summaries.
+        order_by = [(metrics[0], True)]
+    order_by.extend(
+        (name, False) for name in group_by if all(name != o for o, _ in order_by)
+    )
+
+    raw_limit = params.get("limit", "100")
+    try:
+        limit = int(raw_limit)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid parameter: limit must be an integer") from None
+    if limit < 1 or limit > MAX_LIMIT:
+        raise ValueError(f"Invalid parameter: limit must be between 1 and {MAX_LIMIT}")
+
+    return AggregatePlan(
+        group_by=tuple(group_by),
+        metrics=tuple(dict.fromkeys(metrics)),
+        order_by=tuple(order_by),
+        limit=limit,
+        filters=parse_row_filter(params),
+        unit=parse_unit(params.get("unit")),
+    )
+
+
+_PLANS: "OrderedDict[Tuple[Tuple[str, str], ...], AggregatePlan]" = OrderedDict()
+_PLAN_LOCK = threading.Lock()
+
+
+def parse_aggregate_plan(params: Mapping[str, Any]) -> AggregatePlan:
+    """Validate aggregate query parameters into a plan, reusing recently parsed ones.
+
+    Plans do not depend on the data, so the plan cache is shared across
+    dataset versions; results are cached per version by the caller.
+    """
+    key = tuple(sorted((str(k), str(v)) for k, v in params.items()))
+    with _PLAN_LOCK:
+        plan = _PLANS.get(key)
+        if plan is not None:
+            _PLANS.move_to_end(key)
+            return plan
+    plan = _parse_plan(params)
+    with _PLAN_LOCK:
+        _PLANS[key] = plan
+        while len(_PLANS) > _PLAN_CACHE_SIZE:
+            _PLANS.popitem(last=False)
+    return plan
+
+
+def _metric_values(rolled: pd.DataFrame, metric: str) -> pd.Series:
+    if metric == "count":
+        return rolled["count"]
+    if metric == "rated_count":
+        return rolled["rating_count"]
+    if metric == "avg_rating":
+        return rolled["avg_rating"]
+    if metric == "avg_cost_for_two":
+        return rolled["avg_cost_for_two"].round()
+    if metric == "sum_votes":
+        return rolled["votes_sum"]
+    return rolled["votes_sum"] / rolled["count"]
+
+
+def _json_value(value: Any, integer: bool) -> Any:
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, (np.integer, np.floating, int, float)):
+        return int(value) if integer else float(value)
+    return str(value)
+
+
+def run_aggregate(
+    cube: RollupCube,
+    plan: AggregatePlan,
+    where: Dict[str, str],
+    *,
+    deadline: Optional[Deadline] = None,
+) -> AggregateResult:
+    rolled = cube.rollup(plan.group_by, where=where)
+    check_deadline(deadline, "aggregate rollup")
+    table = rolled[list(plan.group_by)].copy()
+    for metric in plan.metrics:
+        table[metric] = _metric_values(rolled, metric).to_numpy()
+
+    # NaN averages sort last whichever direction is requested.
+    table = table.sort_values(
+        by=[name for name, _ in plan.order_by],
+        ascending=[not desc for _, desc in plan.order_by],
+        kind="stable",
+        na_position="last",
+    )
+    integers = {"count", "rated_count", "sum_votes", "avg_cost_for_two"}
+    rows = [
+        {
+            name: _json_value(value, name in integers)
+            for name, value in zip(table.columns, values)
+        }
+        for values in table.head(plan.limit).itertuples(index=False, name=None)
+    ]
+    return AggregateResult(rows=rows, total_groups=int(len(table)))
+
+
+def compute_aggregate(
+    restaurants_df: pd.DataFrame,
+    plan: AggregatePlan,
+    *,
+    deadline: Optional[Deadline] = None,
+) -> AggregateResult:
+    cube, where = cube_for(restaurants_df, plan.filters, plan.unit)
+    check_deadline(deadline, "aggregate filter")
+    return run_aggregate(cube, plan, where, deadline=deadline)
@@ -1,31 +1,136 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from time import perf_counter
-import time
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypeVar, cast
 
+import numpy as np
 import pandas as pd
 
-from src.models.analytics import FoodieArea, RestaurantTypeSummary, TopRestaurant
+from src.models.analytics import (
+    CuisinePair,
+    CuisineSummary,
+    FoodieArea,
+    RestaurantTypeSummary,
+    TopRestaurant,
+)
+from src.services.aggregate import AggregatePlan, AggregateResult, compute_aggregate
+from src.services.bounded_cache import BoundedCache
+from src.services.cube import RollupCube, cube_filter, cube_for, get_rollup_cube
+from src.services.dataset import dataset_version
+from src.services.deadline import Deadline, check_deadline
+from src.services.indexes import RowFilter, get_dataset_index
+from src.services.ranking import WeightedRatings, get_weighted_ratings, rating_prior
+from src.services.restaurants import RestaurantTable, get_restaurant_table, unit_frame
+from src.services.single_flight import SingleFlight
+from src.utils.metrics import CACHE_EVENTS
+from src.utils.timing import stage
 
+T = TypeVar("T")
 
-_ANALYTICS_CACHE: Dict[str, Tuple[float, int, Any]] = {}
+# Values are ``(stored_at, ttl, value)``.
+_ANALYTICS_CACHE: BoundedCache[str, Tuple[float, int, Any]] = BoundedCache()
+_ANALYTICS_FLIGHT = SingleFlight()
 
+# Seconds past the TTL during which an expired entry is still served while a
+# background refresh recomputes it. 0 disables stale-while-revalidate.
+_STALE_WHILE_REVALIDATE = 0
 
-def _cache_get(key: str) -> Any | None:
-    item = _ANALYTICS_CACHE.get(key)
-    if item is None:
-        return None
-    ts, ttl, value = item
-    if time.time() - ts > ttl:
-        _ANALYTICS_CACHE.pop(key, None)
-        return None
-    return value
+
+def set_stale_while_revalidate(seconds: int) -> None:
+    global _STALE_WHILE_REVALIDATE
+    _STALE_WHILE_REVALIDATE = max(0, int(seconds))
+
+
+def set_cache_max_entries(entries: int) -> None:
+    _ANALYTICS_CACHE.max_entries = max(1, int(entries))
 
 
 def _cache_set(key: str, value: Any, *, ttl: int) -> None:
-    _ANALYTICS_CACHE[key] = (time.time(), ttl, value)
+    evicted = _ANALYTICS_CACHE.put(key, (time.time(), ttl, value))
+    if evicted:
+        CACHE_EVENTS.inc("analytics", "eviction", amount=evicted)
+
+
+def analytics_cache_entries() -> Dict[str, Any]:
+    """Return a snapshot of the cached analytics values keyed by cache key."""
+    return {key: value for key, (_, _, value) in _ANALYTICS_CACHE.snapshot().items()}
+
+
+def _cache_get_or_compute(
+    key: str,
+    compute: Callable[[Optional[Deadline]], T],
+    *,
+    ttl: int,
+    deadline: Optional[Deadline] = None,
+) -> T:
+    with stage("cache"):
+        item = _ANALYTICS_CACHE.get(key)
+        if item is not None:
+            ts, item_ttl, value = item
+            age = time.time() - ts
+            if age <= item_ttl:
+                CACHE_EVENTS.inc("analytics", "hit")
+                _ANALYTICS_CACHE.touch(key)
+                return cast(T, value)
+            if age <= item_ttl + _STALE_WHILE_REVALIDATE:
+                CACHE_EVENTS.inc("analytics", "stale")
+                _ANALYTICS_CACHE.touch(key)
+                # Background refreshes are not tied to the triggering request's
+                # deadline.
+                _ANALYTICS_FLIGHT.refresh(
+                    key, lambda: _compute_and_store(key, compute, None, ttl=ttl)
+                )
+                return cast(T, value)
+            if _ANALYTICS_CACHE.discard(key, item):
+                CACHE_EVENTS.inc("analytics", "eviction")
+
+        CACHE_EVENTS.inc("analytics", "miss")
+    return _ANALYTICS_FLIGHT.do(
+        key,
+        lambda: _compute_and_store(key, compute, deadline, ttl=ttl),
+        deadline=deadline,
+    )
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    return None if pd.isna(value) else float(value)
+
+
+def _optional_cost(value: Any) -> Optional[int]:
+    return None if pd.isna(value) else int(round(float(value)))
+
+
+def _filter_key(filters: Optional[RowFilter]) -> str:
+    return "" if filters is None or filters.is_empty() else f":{filters.cache_key()}"
+
+
+def _unit_key(unit: str) -> str:
+    return "" if unit == "listings" else f":unit={unit}"
+
+
+def _filtered(
+    restaurants_df: pd.DataFrame, filters: Optional[RowFilter], unit: str = "listings"
+) -> pd.DataFrame:
+    rows = unit_frame(restaurants_df, unit)
+    if filters is None or filters.is_empty():
+        return rows
+    with stage("filter"):
+        return get_dataset_index(restaurants_df, unit).apply(rows, filters)
+
+
+def _compute_and_store(
+    key: str,
+    compute: Callable[[Optional[Deadline]], T],
+    deadline: Optional[Deadline],
+    *,
+    ttl: int,
+) -> T:
+    with stage("compute"):
+        value = compute(deadline)
+    _cache_set(key, value, ttl=ttl)
+    return value
 
 
 @dataclass(frozen=True, slots=True)
@@ -48,7 +153,23 @@ class FoodieAreasResult:
     processing_time_ms: int
 
 
-def compute_restaurant_type_summary(restaurants_df: pd.DataFrame) -> RestaurantTypeAnalyticsResult:
+@dataclass(frozen=True, slots=True)
+class CuisineAnalyticsResult:
+    cuisines: List[CuisineSummary]
+    total_cuisines: int
+    processing_time_ms: int
+
+
+@dataclass(frozen=True, slots=True)
+class CuisineCooccurrenceResult:
+    pairs: List[CuisinePair]
+    total_pairs: int
+    processing_time_ms: int
+
+
+def compute_restaurant_type_summary(
+    restaurants_df: pd.DataFrame, *, deadline: Optional[Deadline] = None
+) -> RestaurantTypeAnalyticsResult:
     start = perf_counter()
 
     if restaurants_df.empty:
@@ -59,9 +180,14 @@ def compute_restaurant_type_summary(restaurants_df: pd.DataFrame) -> RestaurantT
     grouped = restaurants_df.groupby("restaurant_type", dropna=False)
     counts = grouped.size().rename("count").reset_index()
 
-    avg_rating = grouped["rating"].mean(numeric_only=False).rename("avg_rating").reset_index()
+    avg_rating = (
+        grouped["rating"].mean(numeric_only=False).rename("avg_rating").reset_index()
+    )
     avg_cost = (
-        grouped["approx_cost_for_two"].mean(numeric_only=False).rename("avg_cost_for_two").reset_index()
+        grouped["approx_cost_for_two"]
+        .mean(numeric_only=False)
+        .rename("avg_cost_for_two")
+        .reset_index()
     )
 
     merged = counts.merge(avg_rating, on="restaurant_type", how="left").merge(
@@ -70,7 +196,11 @@ def compute_restaurant_type_summary(restaurants_df: pd.DataFrame) -> RestaurantT
 
     merged["percentage"] = (merged["count"] / total) * 100.0
 
-    merged = merged.sort_values(by=["count", "restaurant_type"], ascending=[False, True])
+    check_deadline(deadline, "restaurant type aggregation")
+
+    merged = merged.sort_values(
+        by=["count", "restaurant_type"], ascending=[False, True]
+    )
 
     items: List[RestaurantTypeSummary] = []
     for row in merged.itertuples(index=False):
@@ -95,19 +225,78 @@ def compute_restaurant_type_summary(restaurants_df: pd.DataFrame) -> RestaurantT
         )
 
     processing_time_ms = int((perf_counter() - start) * 1000)
-    return RestaurantTypeAnalyticsResult(restaurant_types=items, processing_time_ms=processing_time_ms)
+    return RestaurantTypeAnalyticsResult(
+        restaurant_types=items, processing_time_ms=processing_time_ms
+    )
+
+
+def compute_restaurant_type_summary_from_cube(
+    cube: RollupCube,
+    *,
+    where: Optional[Dict[str, str]] = None,
+    deadline: Optional[Deadline] = None,
+) -> RestaurantTypeAnalyticsResult:
+    """Like ``compute_restaurant_type_summary``, but answered from the rollup cube."""
+    start = perf_counter()
+
+    rolled = cube.rollup(("restaurant_type",), where=where)
+    total = int(rolled["count"].sum())
+    if total == 0:
+        return RestaurantTypeAnalyticsResult(restaurant_types=[], processing_time_ms=0)
+
+    check_deadline(deadline, "restaurant type aggregation")
+
+    rolled = rolled.sort_values(
+        by=["count", "restaurant_type"], ascending=[False, True]
+    )
+    items: List[RestaurantTypeSummary] = []
+    for row in rolled.to_dict("records"):
+        items.append(
+            RestaurantTypeSummary(
+                restaurant_type=str(row["restaurant_type"]),
+                count=int(row["count"]),
+                percentage=float(row["count"] / total * 100.0),
+                avg_rating=_optional_float(row["avg_rating"]),
+                avg_cost_for_two=_optional_cost(row["avg_cost_for_two"]),
+            )
+        )
+
+    processing_time_ms = int((perf_counter() - start) * 1000)
+    return RestaurantTypeAnalyticsResult(
+        restaurant_types=items, processing_time_ms=processing_time_ms
+    )
 
 
 def get_restaurant_type_summary_cached(
-    restaurants_df: pd.DataFrame, *, ttl: int = 300
+    restaurants_df: pd.DataFrame,
+    *,
+    filters: Optional[RowFilter] = None,
+    unit: str = "listings",
+    ttl: int = 300,
+    deadline: Optional[Deadline] = None,
 ) -> RestaurantTypeAnalyticsResult:
-    key = f"restaurant-types:{id(restaurants_df)}:{len(restaurants_df)}"
-    cached = _cache_get(key)
-    if cached is not None:
-        return cached
-    result = compute_restaurant_type_summary(restaurants_df)
-    _cache_set(key, result, ttl=ttl)
-    return result
+    key = (
+        f"restaurant-types:{dataset_version(restaurants_df)}"
+        f"{_unit_key(unit)}{_filter_key(filters)}"
+    )
+    where = cube_filter(filters)
+
+    def compute(d: Optional[Deadline]) -> RestaurantTypeAnalyticsResult:
+        if where is not None:
+            cube = get_rollup_cube(restaurants_df, unit)
+            return compute_restaurant_type_summary_from_cube(
+                cube, where=where, deadline=d
+            )
+        return compute_restaurant_type_summary(
+            _filtered(restaurants_df, filters, unit), deadline=d
+        )
+
+    return _cache_get_or_compute(
+        key,
+        compute,
+        ttl=ttl,
+        deadline=deadline,
+    )
 
 
 def _parse_cuisines(value: object) -> List[str]:
@@ -121,111 +310,122 @@ def _parse_cuisines(value: object) -> List[str]:
     return [part.strip() for part in s.split(",") if part.strip()]
 
 
-def compute_top_restaurants(
-    restaurants_df: pd.DataFrame,
+def _rank_restaurants(
+    restaurants: pd.DataFrame,
     *,
-    limit: int = 10,
-    sort_by: Literal["votes", "rating"] = "votes",
-) -> TopRestaurantsResult:
-    start = perf_counter()
+    limit: int,
+    sort_by: str,
+    ratings: Optional[WeightedRatings] = None,
+) -> np.ndarray:
+    """Positions of the ``limit`` best rows; ties keep frame (name, location) order."""
+    votes = restaurants["votes"].to_numpy(dtype=np.int64)
+    rating = np.nan_to_num(restaurants["rating"].to_numpy(dtype=float), nan=-1.0)
+    if sort_by == "weighted_rating":
+        if ratings is not None and restaurants is ratings.frame:
+            # The whole table was ranked when the ratings were built.
+            return ratings.order[:limit]
+        if ratings is None:
+            ratings = WeightedRatings(restaurants, rating_prior())
+        primary, secondary = np.nan_to_num(ratings.score(restaurants), nan=-1.0), votes
+    else:
+        primary, secondary = (rating, votes) if sort_by == "rating" else (votes, rating)
 
-    total = int(len(restaurants_df))
-    if total == 0:
-        return TopRestaurantsResult(top_restaurants=[], total_restaurants=0, processing_time_ms=0)
+    candidates = np.arange(len(restaurants))
+    if len(candidates) > limit:
+        # Only rows reaching the limit-th best primary key can make the cut.
+        cutoff = np.partition(primary, len(primary) - limit)[len(primary) - limit]
+        candidates = np.flatnonzero(primary >= cutoff)
+    order = np.lexsort((-secondary[candidates], -primary[candidates]))
+    return candidates[order[:limit]]
 
-    df = restaurants_df.copy()
 
-    if "rating" not in df.columns:
-        df["rating"] = None
-    if "votes" not in df.columns:
-        df["votes"] = 0
-    if "cuisines" not in df.columns:
-        df["cuisines"] = ""
+def compute_top_restaurants_from_table(
+    restaurants: pd.DataFrame,
+    *,
+    total_restaurants: int,
+    limit: int = 10,
+    sort_by: Literal["votes", "rating", "weighted_rating"] = "votes",
+    ratings: Optional[WeightedRatings] = None,
+    deadline: Optional[Deadline] = None,
+) -> TopRestaurantsResult:
+    """``compute_top_restaurants`` over already merged rows.
 
-    df["votes"] = pd.to_numeric(df["votes"], errors="coerce").fillna(0).astype(int)
-    df["rating_sort"] = pd.to_numeric(df["rating"], errors="coerce").fillna(-1.0).astype(float)
+    ``restaurants`` is a ``RestaurantTable.frame`` or part of one.
 
-    if "name" not in df.columns:
-        df["name"] = "Unknown"
-    if "location" not in df.columns:
-        df["location"] = "Unknown"
-    if "restaurant_type" not in df.columns:
-        df["restaurant_type"] = "Unknown"
+    ``ratings`` supplies the prior for ``sort_by="weighted_rating"``; without
+    it the prior mean comes from ``restaurants`` themselves.
+    """
+    start = perf_counter()
 
-    df["name"] = df["name"].astype(str)
-    df["location"] = df["location"].astype(str)
-    df["restaurant_type"] = df["restaurant_type"].astype(str)
-
-    df["cuisines_list"] = df["cuisines"].apply(_parse_cuisines)
-
-    def _merge_cuisines(series: pd.Series) -> List[str]:
-        merged: List[str] = []
-        seen: set[str] = set()
-        for cuisines in series:
-            if not isinstance(cuisines, list):
-                continue
-            for c in cuisines:
-                if c not in seen:
-                    seen.add(c)
-                    merged.append(c)
-        return merged
-
-    def _pick_restaurant_type(series: pd.Series) -> str:
-        counts: Dict[str, int] = {}
-        for v in series:
-            s = str(v)
-            counts[s] = counts.get(s, 0) + 1
-        if not counts:
-            return "Unknown"
-        return max(counts.items(), key=lambda x: x[1])[0]
-
-    df = (
-        df.groupby(["name", "location"], as_index=False)
-        .agg(
-            restaurant_type=("restaurant_type", _pick_restaurant_type),
-            votes=("votes", "max"),
-            rating_sort=("rating_sort", "max"),
-            cuisines_list=("cuisines_list", _merge_cuisines),
-        )
-        .reset_index(drop=True)
+    top = restaurants.take(
+        _rank_restaurants(restaurants, limit=limit, sort_by=sort_by, ratings=ratings)
     )
+    check_deadline(deadline, "restaurant ranking")
+
+    rows = zip(
+        top["restaurant_id"].tolist(),
+        top["name"].tolist(),
+        top["location"].tolist(),
+        top["rating"].to_numpy(dtype=float).tolist(),
+        top["votes"].tolist(),
+        top["restaurant_type"].tolist(),
+        top["cuisines"].tolist(),
+    )
+    items = [
+        TopRestaurant(
+            name=str(name),
+            location=str(location),
+            rating=None if np.isnan(rating) else float(rating),
+            votes=int(votes),
+            restaurant_type=str(kind),
+            cuisines=_parse_cuisines(cuisines),
+            rank=rank,
+            restaurant_id=str(restaurant_id),
+        )
+        for rank, (restaurant_id, name, location, rating, votes, kind, cuisines) in (
+            enumerate(rows, start=1)
+        )
+    ]
 
-    if sort_by == "rating":
-        df = df.sort_values(by=["rating_sort", "votes"], ascending=[False, False])
-    else:
-        df = df.sort_values(by=["votes", "rating_sort"], ascending=[False, False])
-
-    top_df = df.head(limit)
+    processing_time_ms = int((perf_counter() - start) * 1000)
+    return TopRestaurantsResult(
+        top_restaurants=items,
+        total_restaurants=total_restaurants,
+        processing_time_ms=processing_time_ms,
+    )
 
-    items: List[TopRestaurant] = []
-    for idx, row in enumerate(top_df.itertuples(index=False), start=1):
-        rating = None
-        if hasattr(row, "rating_sort") and getattr(row, "rating_sort") is not None:
-            try:
-                rating_val = float(getattr(row, "rating_sort"))
-                rating = None if rating_val < 0 else rating_val
-            except Exception:
-                rating = None
 
-        cuisines = getattr(row, "cuisines_list", [])
-        if not isinstance(cuisines, list):
-            cuisines = []
+def compute_top_restaurants(
+    restaurants_df: pd.DataFrame,
+    *,
+    limit: int = 10,
+    sort_by: Literal["votes", "rating", "weighted_rating"] = "votes",
+    ratings: Optional[WeightedRatings] = None,
+    deadline: Optional[Deadline] = None,
+) -> TopRestaurantsResult:
+    start = perf_counter()
 
-        items.append(
-            TopRestaurant(
-                name=str(getattr(row, "name")),
-                location=str(getattr(row, "location")),
-                rating=rating,
-                votes=int(getattr(row, "votes")),
-                restaurant_type=str(getattr(row, "restaurant_type")),
-                cuisines=cuisines,
-                rank=idx,
-            )
+    total = int(len(restaurants_df))
+    if total == 0:
+        return TopRestaurantsResult(
+            top_restaurants=[], total_restaurants=0, processing_time_ms=0
         )
 
+    # Listings of one (name, location) are merged with the vectorised table rules.
+    table = RestaurantTable(restaurants_df)
+    check_deadline(deadline, "restaurant deduplication")
+
+    result = compute_top_restaurants_from_table(
+        table.frame,
+        total_restaurants=total,
+        limit=limit,
+        sort_by=sort_by,
+        ratings=ratings,
+        deadline=deadline,
+    )
     processing_time_ms = int((perf_counter() - start) * 1000)
     return TopRestaurantsResult(
-        top_restaurants=items,
+        top_restaurants=result.top_restaurants,
         total_restaurants=total,
         processing_time_ms=processing_time_ms,
     )
@@ -235,19 +435,62 @@ def get_top_restaurants_cached(
     restaurants_df: pd.DataFrame,
     *,
     limit: int = 10,
-    sort_by: Literal["votes", "rating"] = "votes",
+    sort_by: Literal["votes", "rating", "weighted_rating"] = "votes",
+    filters: Optional[RowFilter] = None,
+    unit: str = "listings",
     ttl: int = 300,
+    deadline: Optional[Deadline] = None,
 ) -> TopRestaurantsResult:
-    key = f"top-restaurants:{id(restaurants_df)}:{len(restaurants_df)}:{limit}:{sort_by}"
-    cached = _cache_get(key)
-    if cached is not None:
-        return cached
-    result = compute_top_restaurants(restaurants_df, limit=limit, sort_by=sort_by)
-    _cache_set(key, result, ttl=ttl)
-    return result
+    sort_key: str = sort_by
+    ratings: Optional[WeightedRatings] = None
+    if sort_by == "weighted_rating":
+        # Filtered rankings keep the whole dataset's prior mean.
+        ratings = get_weighted_ratings(restaurants_df)
+        sort_key = f"{sort_by}[{ratings.prior.votes:g}:{ratings.prior.by or ''}]"
+    key = (
+        f"top-restaurants:{dataset_version(restaurants_df)}:{limit}:{sort_key}{_unit_key(unit)}"
+        f"{_filter_key(filters)}"
+    )
+
+    def compute(d: Optional[Deadline]) -> TopRestaurantsResult:
+        if unit == "restaurants":
+            # Filters apply to the merged restaurants; nothing is left to merge.
+            rows = _filtered(restaurants_df, filters, unit)
+            return compute_top_restaurants_from_table(
+                rows,
+                total_restaurants=len(rows),
+                limit=limit,
+                sort_by=sort_by,
+                ratings=ratings,
+                deadline=d,
+            )
+        if filters is None or filters.is_empty():
+            # The load-time table already holds every listing merged.
+            return compute_top_restaurants_from_table(
+                get_restaurant_table(restaurants_df).frame,
+                total_restaurants=len(restaurants_df),
+                limit=limit,
+                sort_by=sort_by,
+                ratings=ratings,
+                deadline=d,
+            )
+        return compute_top_restaurants(
+            _filtered(restaurants_df, filters),
+            limit=limit,
+            sort_by=sort_by,
+            ratings=ratings,
+            deadline=d,
+        )
 
+    return _cache_get_or_compute(key, compute, ttl=ttl, deadline=deadline)
 
-def compute_foodie_areas(restaurants_df: pd.DataFrame, *, limit: int = 10) -> FoodieAreasResult:
+
+def compute_foodie_areas(
+    restaurants_df: pd.DataFrame,
+    *,
+    limit: int = 10,
+    deadline: Optional[Deadline] = None,
+) -> FoodieAreasResult:
     start = perf_counter()
 
     if restaurants_df.empty:
@@ -271,13 +514,18 @@ def compute_foodie_areas(restaurants_df: pd.DataFrame, *, limit: int = 10) -> Fo
 
     grouped = df.groupby("location", dropna=False)
     counts = grouped.size().rename("restaurant_count").reset_index()
-    avg_rating = grouped["rating"].mean(numeric_only=False).rename("avg_rating").reset_index()
+    avg_rating = (
+        grouped["rating"].mean(numeric_only=False).rename("avg_rating").reset_index()
+    )
     merged = counts.merge(avg_rating, on="location", how="left")
 
-    merged = merged.sort_values(by=["restaurant_count", "location"], ascending=[False, True]).head(limit)
+    merged = merged.sort_values(
+        by=["restaurant_count", "location"], ascending=[False, True]
+    ).head(limit)
 
     items: List[FoodieArea] = []
     for row in merged.itertuples(index=False):
+        check_deadline(deadline, "foodie area breakdown")
         area = str(getattr(row, "location"))
         restaurant_count = int(getattr(row, "restaurant_count"))
 
@@ -305,7 +553,11 @@ def compute_foodie_areas(restaurants_df: pd.DataFrame, *, limit: int = 10) -> Fo
         restaurant_types: List[str] = []
         if "restaurant_type" in area_df.columns and not area_df.empty:
             restaurant_types = (
-                area_df["restaurant_type"].astype(str).value_counts().head(5).index.tolist()
+                area_df["restaurant_type"]
+                .astype(str)
+                .value_counts()
+                .head(5)
+                .index.tolist()
             )
 
         items.append(
@@ -319,14 +571,248 @@ def compute_foodie_areas(restaurants_df: pd.DataFrame, *, limit: int = 10) -> Fo
         )
 
     processing_time_ms = int((perf_counter() - start) * 1000)
-    return FoodieAreasResult(foodie_areas=items, total_areas=total_areas, processing_time_ms=processing_time_ms)
+    return FoodieAreasResult(
+        foodie_areas=items,
+        total_areas=total_areas,
+        processing_time_ms=processing_time_ms,
+    )
+
+
+def _top_labels_per_group(
+    rolled: pd.DataFrame, group: str, label: str, weight: str, n: int
+) -> Dict[str, List[str]]:
+    # Highest weight first; ties keep first-appearance order like ``value_counts``.
+    ranked = rolled.sort_values(
+        by=[weight, "first_seen"], ascending=[False, True], kind="stable"
+    )
+    top = ranked.groupby(group, sort=False).head(n)
+    return {
+        str(key): [str(v) for v in values]
+        for key, values in top.groupby(group, sort=False)[label]
+    }
+
+
+def compute_foodie_areas_from_cube(
+    cube: RollupCube,
+    *,
+    limit: int = 10,
+    where: Optional[Dict[str, str]] = None,
+    deadline: Optional[Deadline] = None,
+) -> FoodieAreasResult:
+    """``compute_foodie_areas`` answered from the rollup cube instead of raw rows."""
+    start = perf_counter()
+
+    areas = cube.rollup(("location",), where=where)
+    if areas.empty:
+        return FoodieAreasResult(foodie_areas=[], total_areas=0, processing_time_ms=0)
+
+    total_areas = int(len(areas))
+    areas = areas.sort_values(by=["count", "location"], ascending=[False, True])
+    areas = areas.head(limit)
+    check_deadline(deadline, "foodie area breakdown")
+
+    cuisines = cube.rollup(("location", "cuisine"), where=where)
+    types = cube.rollup(("location", "restaurant_type"), where=where)
+    shown = set(areas["location"])
+    top_cuisines = _top_labels_per_group(
+        cuisines[cuisines["location"].isin(shown)], "location", "cuisine", "mentions", 5
+    )
+    top_types = _top_labels_per_group(
+        types[types["location"].isin(shown)], "location", "restaurant_type", "count", 5
+    )
+
+    items = [
+        FoodieArea(
+            area=str(row["location"]),
+            restaurant_count=int(row["count"]),
+            avg_rating=_optional_float(row["avg_rating"]),
+            top_cuisines=top_cuisines.get(str(row["location"]), []),
+            restaurant_types=top_types.get(str(row["location"]), []),
+        )
+        for row in areas.to_dict("records")
+    ]
+
+    processing_time_ms = int((perf_counter() - start) * 1000)
+    return FoodieAreasResult(
+        foodie_areas=items,
+        total_areas=total_areas,
+        processing_time_ms=processing_time_ms,
+    )
 
 
-def get_foodie_areas_cached(restaurants_df: pd.DataFrame, *, limit: int = 10, ttl: int = 300) -> FoodieAreasResult:
-    key = f"foodie-areas:{id(restaurants_df)}:{len(restaurants_df)}:{limit}"
-    cached = _cache_get(key)
-    if cached is not None:
-        return cached
-    result = compute_foodie_areas(restaurants_df, limit=limit)
-    _cache_set(key, result, ttl=ttl)
-    return result
+def get_foodie_areas_cached(
+    restaurants_df: pd.DataFrame,
+    *,
+    limit: int = 10,
+    filters: Optional[RowFilter] = None,
+    unit: str = "listings",
+    ttl: int = 300,
+    deadline: Optional[Deadline] = None,
+) -> FoodieAreasResult:
+    key = (
+        f"foodie-areas:{dataset_version(restaurants_df)}:{limit}"
+        f"{_unit_key(unit)}{_filter_key(filters)}"
+    )
+    where = cube_filter(filters)
+
+    def compute(d: Optional[Deadline]) -> FoodieAreasResult:
+        if where is not None:
+            cube = get_rollup_cube(restaurants_df, unit)
+            return compute_foodie_areas_from_cube(
+                cube, limit=limit, where=where, deadline=d
+            )
+        return compute_foodie_areas(
+            _filtered(restaurants_df, filters, unit), limit=limit, deadline=d
+        )
+
+    return _cache_get_or_compute(
+        key,
+        compute,
+        ttl=ttl,
+        deadline=deadline,
+    )
+
+
+def compute_cuisine_summary(
+    cube: RollupCube,
+    *,
+    limit: int = 50,
+    where: Optional[Dict[str, str]] = None,
+    deadline: Optional[Deadline] = None,
+) -> CuisineAnalyticsResult:
+    """Per-cuisine restaurant count, averages and top areas, most served first."""
+    start = perf_counter()
+
+    rolled = cube.rollup(("cuisine",), where=where)
+    if rolled.empty:
+        return CuisineAnalyticsResult(
+            cuisines=[], total_cuisines=0, processing_time_ms=0
+        )
+
+    total_cuisines = int(len(rolled))
+    rolled = rolled.sort_values(by=["count", "cuisine"], ascending=[False, True])
+    rolled = rolled.head(limit)
+    check_deadline(deadline, "cuisine aggregation")
+
+    areas = cube.rollup(("cuisine", "location"), where=where)
+    areas = areas[areas["cuisine"].isin(set(rolled["cuisine"]))]
+    top_areas = _top_labels_per_group(areas, "cuisine", "location", "count", 3)
+
+    items: List[CuisineSummary] = []
+    for row in rolled.to_dict("records"):
+        items.append(
+            CuisineSummary(
+                cuisine=str(row["cuisine"]),
+                restaurant_count=int(row["count"]),
+                avg_rating=_optional_float(row["avg_rating"]),
+                avg_cost_for_two=_optional_cost(row["avg_cost_for_two"]),
+                top_areas=top_areas.get(str(row["cuisine"]), []),
+            )
+        )
+
+    processing_time_ms = int((perf_counter() - start) * 1000)
+    return CuisineAnalyticsResult(
+        cuisines=items,
+        total_cuisines=total_cuisines,
+        processing_time_ms=processing_time_ms,
+    )
+
+
+def compute_cuisine_cooccurrence(
+    cube: RollupCube,
+    *,
+    limit: int = 50,
+    cuisine: Optional[str] = None,
+    where: Optional[Dict[str, str]] = None,
+    deadline: Optional[Deadline] = None,
+) -> CuisineCooccurrenceResult:
+    """Most frequent cuisine pairs; with ``cuisine``, only the pairs that include it."""
+    start = perf_counter()
+
+    pairs = cube.cooccurrence(where=where)
+    if cuisine is not None:
+        wanted = cuisine.strip().lower()
+        involved = (pairs["cuisine_a"].str.lower() == wanted) | (
+            pairs["cuisine_b"].str.lower() == wanted
+        )
+        pairs = pairs[involved]
+    check_deadline(deadline, "cuisine co-occurrence")
+
+    total_pairs = int(len(pairs))
+    pairs = pairs.sort_values(
+        by=["count", "cuisine_a", "cuisine_b"], ascending=[False, True, True]
+    ).head(limit)
+    items = [
+        CuisinePair(
+            cuisine_a=str(row["cuisine_a"]),
+            cuisine_b=str(row["cuisine_b"]),
+            count=int(row["count"]),
+        )
+        for row in pairs.to_dict("records")
+    ]
+
+    processing_time_ms = int((perf_counter() - start) * 1000)
+    return CuisineCooccurrenceResult(
+        pairs=items, total_pairs=total_pairs, processing_time_ms=processing_time_ms
+    )
+
+
+def get_cuisine_summary_cached(
+    restaurants_df: pd.DataFrame,
+    *,
+    limit: int = 50,
+    filters: Optional[RowFilter] = None,
+    unit: str = "listings",
+    ttl: int = 300,
+    deadline: Optional[Deadline] = None,
+) -> CuisineAnalyticsResult:
+    key = (
+        f"cuisines:{dataset_version(restaurants_df)}:{limit}"
+        f"{_unit_key(unit)}{_filter_key(filters)}"
+    )
+
+    def compute(d: Optional[Deadline]) -> CuisineAnalyticsResult:
+        cube, where = cube_for(restaurants_df, filters, unit)
+        return compute_cuisine_summary(cube, limit=limit, where=where, deadline=d)
+
+    return _cache_get_or_compute(key, compute, ttl=ttl, deadline=deadline)
+
+
+def get_cuisine_cooccurrence_cached(
+    restaurants_df: pd.DataFrame,
+    *,
+    limit: int = 50,
+    filters: Optional[RowFilter] = None,
+    unit: str = "listings",
+    ttl: int = 300,
+    deadline: Optional[Deadline] = None,
+) -> CuisineCooccurrenceResult:
+    key = (
+        f"cuisine-pairs:{dataset_version(restaurants_df)}:{limit}"
+        f"{_unit_key(unit)}{_filter_key(filters)}"
+    )
+
+    def compute(d: Optional[Deadline]) -> CuisineCooccurrenceResult:
+        cube, where = cube_for(restaurants_df, filters, unit)
+        cuisine = filters.cuisine if filters is not None else None
+        return compute_cuisine_cooccurrence(
+            cube, limit=limit, cuisine=cuisine, where=where, deadline=d
+        )
+
+    return _cache_get_or_compute(key, compute, ttl=ttl, deadline=deadline)
+
+
+def get_aggregate_cached(
+    restaurants_df: pd.DataFrame,
+    plan: AggregatePlan,
+    *,
+    ttl: int = 300,
+    deadline: Optional[Deadline] = None,
+) -> AggregateResult:
+    key = f"aggregate:{dataset_version(restaurants_df)}:{plan.cache_key()}"
+    return _cache_get_or_compute(
+        key,
+        lambda d: compute_aggregate(restaurants_df, plan, deadline=d),
+        ttl=ttl,
+        deadline=deadline,
+    )
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Entries each response cache keeps before evicting the least recently used.
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class BoundedCache(OrderedDict[K, V]):
+    """A dict of at most ``max_entries`` items, least recently used evicted first.
+
+    Cache keys embed free-form filter values and dataset versions, so an
+    unbounded dict would grow with every distinct query and every reload.
+    Lookups mark an entry used through ``touch``; ``put`` and ``discard``
+    return how many entries they removed so callers can count evictions.
+    Reads and writes share one lock; iterate over ``snapshot()`` rather than
+    the cache itself, since other threads may be writing to it.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Tuple[K, V]] = (),
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        super().__init__(items)
+        self.max_entries = max(1, int(max_entries))
+        # Reentrant: ``discard`` reads through ``get`` while holding it.
+        self._lock = threading.RLock()
+        with self._lock:
+            self._trim()
+
+    def _trim(self) -> int:
+        evicted = 0
+        while len(self) > self.max_entries:
+            self.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:  # type: ignore[override]
+        with self._lock:
+            return super().get(key, default)
+
+    def snapshot(self) -> Dict[K, V]:
+        """A copy of the entries, safe to iterate while other threads write."""
+        with self._lock:
+            return dict(self)
+
+    def touch(self, key: K) -> None:
+        with self._lock:
+            if key in self:
+                self.move_to_end(key)
+
+    def put(self, key: K, value: V) -> int:
+        """Store ``value`` as most recently used; returns the entries evicted."""
+        with self._lock:
+            self[key] = value
+            self.move_to_end(key)
+            return self._trim()
+
+    def discard(self, key: K, value: V) -> int:
+        """Remove ``key`` if it still holds ``value`` (a refresh may replace it)."""
+        with self._lock:
+            if self.get(key) is not value:
+                return 0
+            del self[key]
+            return 1
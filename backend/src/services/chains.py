@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.models.analytics import RestaurantChain
+from src.services.dataset import VersionedRegistry
+from src.services.search import SearchIndex, get_search_index
+
+# Names whose trigram sets have at least this Jaccard similarity, and whose
+# characters line up at least as well in order, are spellings of one brand.
+NAME_SIMILARITY = 0.8
+
+# Blocks (names sharing a blocking trigram) larger than this are too generic
+# to tell brands apart and are not expanded into candidate pairs.
+_MAX_BLOCK = 64
+
+# Candidate pairs verified per batch, which bounds the trigram probe arrays.
+_PAIR_BATCH = 1 << 18
+
+_SHIFT = np.int64(32)
+_MASK = np.int64(0xFFFFFFFF)
+
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    values = np.sort(values)
+    return values[np.r_[True, values[1:] != values[:-1]]] if len(values) else values
+
+
+def _ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """``starts[i] + 0 .. lengths[i] - 1`` for every ``i``, concatenated."""
+    offsets = np.arange(lengths.sum()) - np.repeat(
+        np.cumsum(lengths) - lengths, lengths
+    )
+    ranges: np.ndarray = np.repeat(starts, lengths) + offsets
+    return ranges
+
+
+def connected_labels(size: int, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Smallest node of each node's connected component.
+
+    Edges are ``left[i]``-``right[i]``.
+
+    Union-find in array form: every round hooks the larger root of each
+    edge onto the smaller one, then compresses paths by pointer jumping.
+    """
+    parent = np.arange(size, dtype=np.int64)
+    while len(left):
+        a, b = parent[left], parent[right]
+        split = a != b
+        if not split.any():
+            break
+        left, right, a, b = left[split], right[split], a[split], b[split]
+        np.minimum.at(parent, np.maximum(a, b), np.minimum(a, b))
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+    return parent
+
+
+class ChainIndex:
+    """Restaurant chains: brands whose outlets may be listed under varying names.
+
+    Names come from the search index, already normalised (lower case,
+    punctuation to spaces) and split into trigrams. Two names are one brand
+    when they are equal ignoring spaces ("mc donald s", "mcdonald s") or
+    when their trigram sets have Jaccard similarity of at least
+    ``threshold`` and their ``SequenceMatcher`` ratio reaches it too (trigram
+    sets alone ignore word order and repeated words, so "cafe" and "cafe
+    cafe" would match). Brands are the connected components of the matches.
+
+    Comparing all pairs of names would be quadratic, so candidates are
+    blocked by prefix filtering: each name's trigrams are ordered rarest
+    first and only its first ``n - ceil(threshold * n) + 1`` are blocking
+    keys. Two names that similar must share one of them, and rare keys keep
+    the blocks small; only pairs inside a block whose sizes allow the
+    threshold are verified.
+
+    A chain is a brand with at least two restaurants (name, location).
+    """
+
+    def __init__(
+        self, search: SearchIndex, *, threshold: float = NAME_SIMILARITY
+    ) -> None:
+        self.threshold = threshold
+        frame = search.table.frame
+
+        left, right = self._spacing_variants(search.names)
+        similar_left, similar_right = self._similar_pairs(
+            search, *self._candidate_pairs(search)
+        )
+        # Few pairs are left by now, so the in-order comparison can be exact.
+        spelled = np.asarray(
+            [
+                SequenceMatcher(None, search.names[a], search.names[b]).ratio()
+                >= threshold
+                for a, b in zip(similar_left.tolist(), similar_right.tolist())
+            ],
+            dtype=bool,
+        )
+        similar_left, similar_right = similar_left[spelled], similar_right[spelled]
+        name_brand = connected_labels(
+            len(search.names),
+            np.concatenate([left, similar_left]),
+            np.concatenate([right, similar_right]),
+        )
+        self.restaurant_brand = name_brand[search.restaurant_name]
+
+        location_codes, locations = pd.factorize(frame["location"].astype(str))
+        rows = pd.DataFrame(
+            {
+                "brand": self.restaurant_brand,
+                "name": frame["name"].astype(str).to_numpy(),
+                "location": location_codes,
+                "rating": frame["rating"].to_numpy(dtype=float),
+                "votes": frame["votes"].to_numpy(dtype=np.int64),
+            }
+        )
+        outlets = np.bincount(self.restaurant_brand, minlength=len(search.names))
+        rows = rows[outlets[self.restaurant_brand] >= 2]
+
+        # Spellings and areas per brand, most outlets (then votes) first.
+        names = (
+            rows.groupby(["brand", "name"], sort=False)
+            .agg(outlets=("votes", "size"), votes=("votes", "sum"))
+            .reset_index()
+            .sort_values(
+                by=["brand", "outlets", "votes", "name"],
+                ascending=[True, False, False, True],
+            )
+        )
+        areas = (
+            rows.groupby(["brand", "location"], sort=False)
+            .size()
+            .rename("outlets")
+            .reset_index()
+            .sort_values(
+                by=["brand", "outlets", "location"], ascending=[True, False, True]
+            )
+        )
+        self._names = names["name"].to_numpy(dtype=object)
+        self._name_starts = names["brand"].to_numpy()
+        self._areas = np.asarray(locations, dtype=object)[areas["location"].to_numpy()]
+        self._area_starts = areas["brand"].to_numpy()
+
+        chains = rows.groupby("brand", sort=False).agg(
+            outlets=("votes", "size"),
+            areas=("location", "nunique"),
+            avg_rating=("rating", "mean"),
+            total_votes=("votes", "sum"),
+        )
+        display = names.drop_duplicates("brand").set_index("brand")["name"]
+        chains["name"] = display.reindex(chains.index).to_numpy()
+        chains = chains.reset_index().sort_values(
+            by=["outlets", "total_votes", "name"],
+            ascending=[False, False, True],
+            kind="stable",
+        )
+        self._chains = chains.reset_index(drop=True)
+        self._outlets = self._chains["outlets"].to_numpy()
+
+    @staticmethod
+    def _spacing_variants(names: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Edges from each name to the first name equal to it ignoring spaces."""
+        codes, compact = pd.factorize(
+            pd.Series([name.replace(" ", "") for name in names], dtype=object)
+        )
+        ids = np.arange(len(names), dtype=np.int64)
+        first = np.full(len(compact), len(names), dtype=np.int64)
+        np.minimum.at(first, codes, ids)
+        keep = (first[codes] != ids) & (np.asarray(compact, dtype=object)[codes] != "")
+        return ids[keep], first[codes][keep]
+
+    def _candidate_pairs(self, search: SearchIndex) -> Tuple[np.ndarray, np.ndarray]:
+        """Distinct name pairs ``left < right`` that share a blocking trigram."""
+        holders = np.diff(search._gram_starts)
+        gram = np.repeat(np.arange(len(holders), dtype=np.int64), holders)
+        owner = search._postings.astype(np.int64)
+        sizes = search._name_grams
+
+        # Each name's trigrams, rarest first; the first few are its blocking keys.
+        order = np.lexsort((gram, holders[gram], owner))
+        first = np.searchsorted(owner[order], np.arange(len(sizes)))
+        rank = np.arange(len(order)) - first[owner[order]]
+        keys = sizes - np.ceil(self.threshold * sizes - 1e-9).astype(np.int64) + 1
+        blocking = np.sort(order[rank < keys[owner[order]]])
+
+        # Postings are grouped by trigram with owners ascending, so each block
+        # is a run of ``blocking`` and pairs within it come out as left < right.
+        block_gram = gram[blocking]
+        starts = (
+            np.flatnonzero(np.r_[True, block_gram[1:] != block_gram[:-1]])
+            if len(blocking)
+            else blocking
+        )
+        lengths = np.diff(np.append(starts, len(blocking)))
+        usable = (lengths >= 2) & (lengths <= _MAX_BLOCK)
+        members = _ranges(starts[usable], lengths[usable])
+        block_length = np.repeat(lengths[usable], lengths[usable])
+        offset = members - np.repeat(starts[usable], lengths[usable])
+        partners = block_length - 1 - offset
+        first_of_pair = np.repeat(members, partners)
+        second_of_pair = _ranges(members + 1, partners)
+
+        owners = owner[blocking]
+        pairs = _sorted_unique(
+            (owners[first_of_pair] << _SHIFT) | owners[second_of_pair]
+        )
+        left, right = pairs >> _SHIFT, pairs & _MASK
+
+        # Jaccard >= t needs the smaller set to hold at least t of the larger.
+        small, large = (
+            np.minimum(sizes[left], sizes[right]),
+            np.maximum(sizes[left], sizes[right]),
+        )
+        fits = small >= self.threshold * large - 1e-9
+        return left[fits], right[fits]
+
+    def _similar_pairs(
+        self, search: SearchIndex, left: np.ndarray, right: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Candidate pairs whose trigram Jaccard similarity reaches the threshold."""
+        holders = np.diff(search._gram_starts)
+        gram = np.repeat(np.arange(len(holders), dtype=np.int64), holders)
+        by_owner = np.sort((search._postings.astype(np.int64) << _SHIFT) | gram)
+        owner_starts = np.searchsorted(
+            by_owner >> _SHIFT, np.arange(len(search.names) + 1)
+        )
+        sizes = search._name_grams
+
+        keep = np.zeros(len(left), dtype=bool)
+        for at in range(0, len(left), _PAIR_BATCH):
+            a, b = left[at : at + _PAIR_BATCH], right[at : at + _PAIR_BATCH]
+            size_a = sizes[a]
+            pair = np.repeat(np.arange(len(a)), size_a)
+            probes = (b[pair] << _SHIFT) | (
+                by_owner[_ranges(owner_starts[a], size_a)] & _MASK
+            )
+            found = np.searchsorted(by_owner, probes)
+            hit = by_owner[np.minimum(found, len(by_owner) - 1)] == probes
+            shared = np.bincount(pair[hit], minlength=len(a))
+            keep[at : at + _PAIR_BATCH] = (
+                shared >= self.threshold * (size_a + sizes[b] - shared) - 1e-9
+            )
+        return left[keep], right[keep]
+
+    def __len__(self) -> int:
+        return len(self._chains)
+
+    def _slice(
+        self, values: np.ndarray, starts: np.ndarray, brand: int, count: int
+    ) -> List[str]:
+        lo, hi = np.searchsorted(starts, [brand, brand + 1])
+        return [str(v) for v in values[lo : min(hi, lo + count)]]
+
+    def chains(
+        self, *, limit: int, min_outlets: int = 2
+    ) -> Tuple[List[RestaurantChain], int]:
+        """The ``limit`` largest chains with ``min_outlets`` or more outlets.
+
+        Also returns how many chains qualify.
+        """
+        total = int(np.searchsorted(-self._outlets, -min_outlets, side="right"))
+        items = [
+            RestaurantChain(
+                name=str(row.name),
+                outlets=int(row.outlets),
+                area_count=int(row.areas),
+                top_areas=self._slice(
+                    self._areas, self._area_starts, int(row.brand), 5
+                ),
+                avg_rating=None
+                if pd.isna(row.avg_rating)
+                else round(float(row.avg_rating), 2),
+                total_votes=int(row.total_votes),
+                name_variants=self._slice(
+                    self._names, self._name_starts, int(row.brand), 5
+                ),
+            )
+            for row in self._chains.head(min(limit, total)).itertuples(index=False)
+        ]
+        return items, total
+
+
+_INDEXES: VersionedRegistry[None, ChainIndex] = VersionedRegistry()
+
+
+def chain_index_entries() -> Dict[None, ChainIndex]:
+    """Snapshot of the cached chain clusters, for the memory report."""
+    return _INDEXES.entries()
+
+
+def get_chain_index(restaurants_df: pd.DataFrame) -> ChainIndex:
+    """Return the chains of this frame, clustering them on first use."""
+    return _INDEXES.get(
+        restaurants_df,
+        None,
+        lambda _previous: ChainIndex(get_search_index(restaurants_df)),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ChainsResult:
+    chains: List[RestaurantChain]
+    total_chains: int
+    processing_time_ms: int
+
+
+def find_chains(
+    restaurants_df: pd.DataFrame, *, limit: int = 20, min_outlets: int = 2
+) -> ChainsResult:
+    """The largest restaurant chains, by number of outlets."""
+    start = perf_counter()
+    chains, total = get_chain_index(restaurants_df).chains(
+        limit=limit, min_outlets=min_outlets
+    )
+    processing_time_ms = int((perf_counter() - start) * 1000)
+    return ChainsResult(
+        chains=chains, total_chains=total, processing_time_ms=processing_time_ms
+    )
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import logging
+import threading
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from src.services.analytics import (
+    get_foodie_areas_cached,
+    get_restaurant_type_summary_cached,
+    get_top_restaurants_cached,
+)
+from src.services.dataset import dataset_version
+from src.services.deadline import Deadline, check_deadline
+from src.utils.charts import (
+    foodie_areas_bar_chart,
+    restaurant_types_pie_chart,
+    top_restaurants_bar_chart,
+)
+from src.utils.metrics import CHART_RENDER_SECONDS
+
+CHART_TYPES = ("restaurant-types-pie", "top-restaurants-bar", "foodie-areas-bar")
+
+ChartSpec = Tuple[str, int, int]
+
+# Nothing is pre-rendered by default: the dashboard draws its charts from the
+# series endpoints (/api/charts/<type>/data), so a PNG is only worth rendering
+# ahead of time for clients that are known to ask for it at a fixed size.
+DEFAULT_CHART_WARMUP: List[ChartSpec] = []
+
+# Sizes /api/charts/<type> accepts, in pixels (inclusive).
+CHART_WIDTH_RANGE = (300, 1200)
+CHART_HEIGHT_RANGE = (200, 800)
+
+
+def chart_size_in_range(width: int, height: int) -> bool:
+    return (
+        CHART_WIDTH_RANGE[0] <= width <= CHART_WIDTH_RANGE[1]
+        and CHART_HEIGHT_RANGE[0] <= height <= CHART_HEIGHT_RANGE[1]
+    )
+
+
+def render_chart_payload(
+    restaurants_df: pd.DataFrame,
+    chart_type: str,
+    *,
+    width: int,
+    height: int,
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Any]:
+    """Render ``chart_type`` as a base64 PNG payload.
+
+    The deadline is checked before the render starts; a render that has
+    started is finished so its result can still be cached.
+    """
+    if chart_type == "restaurant-types-pie":
+        types_result = get_restaurant_type_summary_cached(
+            restaurants_df, deadline=deadline
+        )
+        check_deadline(deadline, "chart render")
+        render_start = perf_counter()
+        chart = restaurant_types_pie_chart(
+            types_result.restaurant_types, width=width, height=height
+        )
+    elif chart_type == "top-restaurants-bar":
+        top_result = get_top_restaurants_cached(restaurants_df, deadline=deadline)
+        check_deadline(deadline, "chart render")
+        render_start = perf_counter()
+        chart = top_restaurants_bar_chart(
+            top_result.top_restaurants, width=width, height=height
+        )
+    elif chart_type == "foodie-areas-bar":
+        areas_result = get_foodie_areas_cached(restaurants_df, deadline=deadline)
+        check_deadline(deadline, "chart render")
+        render_start = perf_counter()
+        chart = foodie_areas_bar_chart(
+            areas_result.foodie_areas, width=width, height=height
+        )
+    else:
+        raise ValueError(f"Chart type '{chart_type}' not found")
+    CHART_RENDER_SECONDS.observe(perf_counter() - render_start, chart_type)
+
+    return {
+        "chart_type": chart_type,
+        "title": chart.title,
+        "base64_image": chart.base64_image,
+        "width": width,
+        "height": height,
+    }
+
+
+def chart_series_payload(
+    restaurants_df: pd.DataFrame,
+    chart_type: str,
+    *,
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Any]:
+    """Return the compact series a client needs to draw ``chart_type`` itself."""
+    if chart_type == "restaurant-types-pie":
+        types_result = get_restaurant_type_summary_cached(
+            restaurants_df, deadline=deadline
+        )
+        return {
+            "chart_type": chart_type,
+            "title": "Restaurant Types",
+            "labels": [r.restaurant_type for r in types_result.restaurant_types],
+            "values": [float(r.count) for r in types_result.restaurant_types],
+            "layout": {
+                "kind": "pie",
+                "value_label": "Restaurants",
+                "show_percentages": True,
+            },
+        }
+    if chart_type == "top-restaurants-bar":
+        top_result = get_top_restaurants_cached(restaurants_df, deadline=deadline)
+        return {
+            "chart_type": chart_type,
+            "title": "Top Restaurants",
+            "labels": [f"#{r.rank} {r.name}" for r in top_result.top_restaurants],
+            "values": [float(r.votes) for r in top_result.top_restaurants],
+            "layout": {
+                "kind": "barh",
+                "value_label": "Votes",
+                "show_percentages": False,
+            },
+        }
+    if chart_type == "foodie-areas-bar":
+        areas_result = get_foodie_areas_cached(restaurants_df, deadline=deadline)
+        return {
+            "chart_type": chart_type,
+            "title": "Foodie Areas",
+            "labels": [a.area for a in areas_result.foodie_areas],
+            "values": [float(a.restaurant_count) for a in areas_result.foodie_areas],
+            "layout": {
+                "kind": "barh",
+                "value_label": "Restaurants",
+                "show_percentages": False,
+            },
+        }
+    raise ValueError(f"Chart type '{chart_type}' not found")
+
+
+def parse_chart_warmup(spec: Optional[str]) -> List[ChartSpec]:
+    """Parse ``"restaurant-types-pie:900x420,foodie-areas-bar:640x320"``.
+
+    ``None`` selects the default list; an empty string disables warm-up.
+    Sizes the chart route would reject are rejected here too, since their
+    renders could never be served.
+    """
+    if spec is None:
+        return list(DEFAULT_CHART_WARMUP)
+
+    specs: List[ChartSpec] = []
+    for raw in spec.split(","):
+        item = raw.strip()
+        if not item:
+            continue
+        chart_type, _, size = item.partition(":")
+        width_raw, _, height_raw = size.partition("x")
+        try:
+            width = int(width_raw)
+            height = int(height_raw)
+        except ValueError:
+            raise ValueError(f"Invalid chart warm-up entry: {item!r}") from None
+        if chart_type not in CHART_TYPES or not chart_size_in_range(width, height):
+            raise ValueError(f"Invalid chart warm-up entry: {item!r}")
+        specs.append((chart_type, width, height))
+    return specs
+
+
+class PinnedChartStore:
+    """Chart payloads rendered ahead of time for a single dataset version.
+
+    Entries are not subject to the API cache TTL; they are dropped only when a
+    different dataset version is warmed up.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._items: Dict[ChartSpec, Dict[str, Any]] = {}
+
+    def get(
+        self, version: str, chart_type: str, width: int, height: int
+    ) -> Dict[str, Any] | None:
+        with self._lock:
+            if version != self._version:
+                return None
+            return self._items.get((chart_type, width, height))
+
+    def items(self) -> Dict[ChartSpec, Dict[str, Any]]:
+        with self._lock:
+            return dict(self._items)
+
+    def warm(self, restaurants_df: pd.DataFrame, specs: List[ChartSpec]) -> int:
+        version = dataset_version(restaurants_df)
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._items = {}
+
+        rendered = 0
+        for chart_type, width, height in specs:
+            try:
+                payload = render_chart_payload(
+                    restaurants_df, chart_type, width=width, height=height
+                )
+            except Exception as exc:
+                logging.getLogger(__name__).warning(
+                    "Chart warm-up failed for %s %sx%s: %s",
+                    chart_type,
+                    width,
+                    height,
+                    exc,
+                )
+                continue
+            with self._lock:
+                if version != self._version:
+                    return rendered
+                self._items[(chart_type, width, height)] = payload
+            rendered += 1
+        return rendered
+
+    def start_warmup(
+        self, restaurants_df: pd.DataFrame, specs: List[ChartSpec]
+    ) -> threading.Thread:
+        thread = threading.Thread(
+            target=self.warm,
+            args=(restaurants_df, specs),
+            name="chart-warmup",
+            daemon=True,
+        )
+        thread.start()
+        return thread
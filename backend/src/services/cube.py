@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.services.dataset import VersionedRegistry
+from src.services.indexes import RowFilter, get_dataset_index
+from src.services.restaurants import unit_frame
+
+DIMENSIONS = ("location", "restaurant_type", "cuisine")
+
+MEASURES = (
+    "count",
+    "rating_sum",
+    "rating_count",
+    "cost_sum",
+    "cost_count",
+    "votes_sum",
+)
+
+_CODE_COLUMNS = {"location": "l", "restaurant_type": "t"}
+
+
+def _parse_combo(combo: str) -> List[str]:
+    return [part.strip() for part in combo.split(",") if part.strip()]
+
+
+def expand_cuisine_lists(
+    combos: Iterable[object],
+) -> Tuple[np.ndarray, pd.DataFrame, int]:
+    """Sparse list -> cuisine incidence for distinct comma-separated cuisine lists.
+
+    Returns the cuisine labels (in first-seen order), a frame with one row per
+    (list ``c``, cuisine ``k``) holding ``mentions`` (times listed) and
+    ``offset`` (first position in the list), and the longest list length.
+    """
+    vocabulary: Dict[str, int] = {}
+    exp_combo: List[int] = []
+    exp_cuisine: List[int] = []
+    exp_mentions: List[int] = []
+    exp_offset: List[int] = []
+    widest = 1
+    for combo_code, combo in enumerate(combos):
+        parts = _parse_combo(str(combo))
+        widest = max(widest, len(parts))
+        seen: Dict[str, int] = {}
+        for offset, part in enumerate(parts):
+            if part in seen:
+                exp_mentions[seen[part]] += 1
+                continue
+            seen[part] = len(exp_combo)
+            exp_combo.append(combo_code)
+            exp_cuisine.append(vocabulary.setdefault(part, len(vocabulary)))
+            exp_mentions.append(1)
+            exp_offset.append(offset)
+    expansion = pd.DataFrame(
+        {
+            "c": np.asarray(exp_combo, dtype=np.int64),
+            "k": np.asarray(exp_cuisine, dtype=np.int64),
+            "mentions": np.asarray(exp_mentions, dtype=np.int64),
+            "offset": np.asarray(exp_offset, dtype=np.int64),
+        }
+    )
+    return np.asarray(list(vocabulary), dtype=object), expansion, widest
+
+
+class RollupCube:
+    """Pre-aggregated measures per (location, restaurant type, cuisine list) cell.
+
+    A restaurant belongs to exactly one cell, keyed by its full cuisine list,
+    so rollups over location and restaurant type are plain sums. The cuisine
+    dimension is answered by expanding each cell into the individual cuisines
+    of its list: grouping by cuisine counts a restaurant under every cuisine
+    it serves, and filtering by cuisine keeps the cells whose list contains it.
+
+    Every cell also records the first row it saw; ``first_seen`` in rollups
+    orders groups by first appearance in the frame (and, for cuisines, by
+    position within the list), which is how ``value_counts`` breaks ties.
+
+    The cube keeps each row's cell and measures, so ``restrict`` can answer
+    a subset of rows (rating and cost ranges) by re-summing them into the
+    existing cells, reusing the labels and the cuisine-list expansion.
+    """
+
+    def __init__(self, restaurants_df: pd.DataFrame) -> None:
+        rows = len(restaurants_df)
+
+        def column(name: str, default: object) -> pd.Series:
+            if name in restaurants_df.columns:
+                return restaurants_df[name]
+            return pd.Series([default] * rows, index=restaurants_df.index, dtype=object)
+
+        loc_codes, locations = pd.factorize(
+            column("location", "Unknown").fillna("Unknown").astype(str)
+        )
+        type_codes, types = pd.factorize(
+            column("restaurant_type", "Unknown").fillna("Unknown").astype(str)
+        )
+        combo_codes, combos = pd.factorize(
+            column("cuisines", "").fillna("").astype(str)
+        )
+        self.labels: Dict[str, np.ndarray] = {
+            "location": np.asarray(locations, dtype=object),
+            "restaurant_type": np.asarray(types, dtype=object),
+        }
+
+        rating = pd.to_numeric(column("rating", np.nan), errors="coerce").to_numpy(
+            dtype=float
+        )
+        cost = pd.to_numeric(
+            column("approx_cost_for_two", np.nan), errors="coerce"
+        ).to_numpy(dtype=float)
+        votes = (
+            pd.to_numeric(column("votes", 0), errors="coerce")
+            .fillna(0)
+            .to_numpy(dtype=float)
+        )
+
+        frame = pd.DataFrame(
+            {
+                "l": loc_codes,
+                "t": type_codes,
+                "c": combo_codes,
+                "rating": rating,
+                "cost": cost,
+                "votes": votes,
+                "row": np.arange(rows, dtype=np.int64),
+            }
+        )
+        grouped = frame.groupby(["l", "t", "c"], sort=False)
+        self.cells = grouped.agg(
+            count=("row", "size"),
+            rating_sum=("rating", "sum"),
+            rating_count=("rating", "count"),
+            cost_sum=("cost", "sum"),
+            cost_count=("cost", "count"),
+            votes_sum=("votes", "sum"),
+            first_row=("row", "min"),
+        ).reset_index()
+        # Numbered like ``cells``: both follow first appearance.
+        self._row_cell = grouped.ngroup().to_numpy(dtype=np.int64)
+        self._rating, self._cost, self._votes = rating, cost, votes
+
+        self.labels["cuisine"], self.expansion, widest = expand_cuisine_lists(combos)
+        self._stride = widest
+        self.rows = rows
+
+    def restrict(self, positions: np.ndarray) -> "RollupCube":
+        """The cube over just the rows at ``positions`` (sorted).
+
+        Cuisines are not re-expanded. Cells keep their codes and
+        first-appearance order; ``first_row`` stays a position in the full
+        frame, which orders groups the same.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        cell = self._row_cell[positions]
+        size = len(self.cells)
+        rating, cost = self._rating[positions], self._cost[positions]
+        rated, costed = ~np.isnan(rating), ~np.isnan(cost)
+
+        present, first = np.unique(cell, return_index=True)
+        present = present[np.argsort(first, kind="stable")]
+        first_row = np.full(size, -1, dtype=np.int64)
+        first_row[cell[first]] = positions[first]
+
+        def total(mask: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+            return np.bincount(
+                cell[mask],
+                weights=None if weights is None else weights[mask],
+                minlength=size,
+            )
+
+        everything = np.ones(len(positions), dtype=bool)
+        cells = self.cells[["l", "t", "c"]].take(present).reset_index(drop=True)
+        measures = {
+            "count": total(everything),
+            "rating_sum": total(rated, rating).astype(float),
+            "rating_count": total(rated),
+            "cost_sum": total(costed, cost).astype(float),
+            "cost_count": total(costed),
+            "votes_sum": total(everything, self._votes[positions]).astype(float),
+            "first_row": first_row,
+        }
+        for name, values in measures.items():
+            cells[name] = values[present]
+
+        cube = RollupCube.__new__(RollupCube)
+        cube.labels = self.labels
+        cube.cells = cells
+        cube.expansion = self.expansion
+        cube._stride = self._stride
+        cube.rows = len(positions)
+        cube._row_cell = cell
+        cube._rating, cube._cost, cube._votes = rating, cost, self._votes[positions]
+        return cube
+
+    def _codes_matching(self, dimension: str, value: str) -> np.ndarray:
+        wanted = value.strip().lower()
+        labels = self.labels[dimension]
+        return np.flatnonzero(
+            [str(label).strip().lower() == wanted for label in labels]
+        )
+
+    def _selected_cells(self, where: Mapping[str, str]) -> pd.DataFrame:
+        cells = self.cells
+        mask = np.ones(len(cells), dtype=bool)
+        for dimension, value in where.items():
+            if dimension not in DIMENSIONS:
+                raise ValueError(f"Unknown cube dimension: {dimension}")
+            codes = self._codes_matching(dimension, value)
+            if dimension == "cuisine":
+                combos = self.expansion.loc[
+                    self.expansion["k"].isin(codes), "c"
+                ].unique()
+                mask &= cells["c"].isin(combos).to_numpy()
+            else:
+                mask &= cells[_CODE_COLUMNS[dimension]].isin(codes).to_numpy()
+        return cells[mask]
+
+    def rollup(
+        self, group_by: Sequence[str] = (), where: Optional[Mapping[str, str]] = None
+    ) -> pd.DataFrame:
+        """Sum cell measures per ``group_by`` combination, over ``where`` matches.
+
+        Returns one row per group with the dimension labels, the summed
+        measures, ``avg_rating``/``avg_cost_for_two`` (NaN without data) and
+        ``first_seen``. Grouping by cuisine adds ``mentions``, the number of
+        times the cuisine is listed across the group's restaurants.
+        """
+        for dimension in group_by:
+            if dimension not in DIMENSIONS:
+                raise ValueError(f"Unknown cube dimension: {dimension}")
+        cells = self._selected_cells(where or {})
+        frame = cells.assign(first_seen=cells["first_row"] * self._stride)
+        sums = list(MEASURES)
+        code_columns = [_CODE_COLUMNS.get(d, "k") for d in group_by]
+
+        if "cuisine" in group_by:
+            # Collapse cells to one row per cuisine list (and other group key)
+            # first, so the expansion runs over lists rather than cells.
+            keys = [column for column in code_columns if column != "k"] + ["c"]
+            grouped = frame.groupby(keys, sort=False)
+            frame = (
+                grouped[list(MEASURES)]
+                .sum()
+                .join(grouped["first_seen"].min())
+                .reset_index()
+            )
+            frame = frame.merge(self.expansion, on="c", how="inner")
+            frame["first_seen"] = frame["first_seen"] + frame["offset"]
+            frame["mentions"] = frame["mentions"] * frame["count"]
+            sums.append("mentions")
+
+        if code_columns:
+            grouped = frame.groupby(code_columns, sort=False)
+            result = grouped[sums].sum().join(grouped["first_seen"].min()).reset_index()
+        else:
+            totals = {name: [frame[name].sum()] for name in sums}
+            totals["first_seen"] = [frame["first_seen"].min() if len(frame) else 0]
+            result = pd.DataFrame(totals)
+
+        for dimension, code_column in zip(group_by, code_columns):
+            result[dimension] = self.labels[dimension][result[code_column].to_numpy()]
+        result = result.drop(columns=code_columns)
+
+        rating_count = result["rating_count"].to_numpy(dtype=float)
+        cost_count = result["cost_count"].to_numpy(dtype=float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result["avg_rating"] = np.where(
+                rating_count > 0, result["rating_sum"] / rating_count, np.nan
+            )
+            result["avg_cost_for_two"] = np.where(
+                cost_count > 0, result["cost_sum"] / cost_count, np.nan
+            )
+        for name in ("count", "rating_count", "cost_count"):
+            result[name] = result[name].astype(np.int64)
+        return result[
+            [*group_by, *sums, "avg_rating", "avg_cost_for_two", "first_seen"]
+        ]
+
+    def cooccurrence(self, where: Optional[Mapping[str, str]] = None) -> pd.DataFrame:
+        """Restaurants serving each pair of cuisines, as a sparse pair list.
+
+        This is the incidence product ``X.T @ X`` for the restaurant x cuisine
+        matrix ``X``, evaluated on cuisine lists rather than rows: each
+        distinct list contributes its restaurant count to every pair it
+        contains, so the cost depends on the number of lists, not rows.
+        Returns ``cuisine_a``, ``cuisine_b`` (``a`` first seen before ``b``)
+        and ``count``; pairs that never co-occur are absent.
+        """
+        cells = self._selected_cells(where or {})
+        per_combo = (
+            cells.groupby("c", sort=False)["count"].sum().rename("weight").reset_index()
+        )
+        members = self.expansion[["c", "k"]].merge(per_combo, on="c", how="inner")
+        pairs = members.merge(members[["c", "k"]], on="c", suffixes=("_a", "_b"))
+        pairs = pairs[pairs["k_a"] < pairs["k_b"]]
+        counts = pairs.groupby(["k_a", "k_b"], sort=False)["weight"].sum().reset_index()
+        labels = self.labels["cuisine"]
+        return pd.DataFrame(
+            {
+                "cuisine_a": labels[counts["k_a"].to_numpy()],
+                "cuisine_b": labels[counts["k_b"].to_numpy()],
+                "count": counts["weight"].to_numpy(dtype=np.int64),
+            }
+        )
+
+
+def cube_filter(filters: Optional[RowFilter]) -> Optional[Dict[str, str]]:
+    """The cube ``where`` for ``filters``, or ``None`` if it needs row-level ranges."""
+    if filters is None:
+        return {}
+    ranges = (
+        filters.min_rating,
+        filters.max_rating,
+        filters.min_cost,
+        filters.max_cost,
+    )
+    if any(v is not None for v in ranges):
+        return None
+    return {
+        d: getattr(filters, d) for d in DIMENSIONS if getattr(filters, d) is not None
+    }
+
+
+def cube_for(
+    restaurants_df: pd.DataFrame, filters: Optional[RowFilter], unit: str = "listings"
+) -> Tuple[RollupCube, Dict[str, str]]:
+    """The cube and ``where`` that answer ``filters``, counted by ``unit``.
+
+    Categorical filters use the load-time cube. Rating and cost ranges cannot
+    be answered from cube cells, so those select their rows through the
+    filter index and re-sum just the matches into the load-time cube's cells.
+    """
+    cube = get_rollup_cube(restaurants_df, unit)
+    where = cube_filter(filters)
+    if where is not None:
+        return cube, where
+    assert filters is not None
+    return cube.restrict(get_dataset_index(restaurants_df, unit).select(filters)), {}
+
+
+_CUBES: VersionedRegistry[str, RollupCube] = VersionedRegistry()
+
+
+def rollup_cube_entries() -> Dict[str, RollupCube]:
+    """Snapshot of the cached rollup cubes per unit, for the memory report."""
+    return _CUBES.entries()
+
+
+def get_rollup_cube(restaurants_df: pd.DataFrame, unit: str = "listings") -> RollupCube:
+    """Return the cube over ``unit_frame(restaurants_df, unit)`` for this frame."""
+    return _CUBES.get(
+        restaurants_df,
+        unit,
+        lambda _previous: RollupCube(unit_frame(restaurants_df, unit)),
+    )
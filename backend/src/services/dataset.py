@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+import pandas as pd
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def dataset_version(restaurants_df: pd.DataFrame) -> str:
+    """Identify a loaded frame the same way the analytics cache keys do."""
+    return f"{id(restaurants_df)}:{len(restaurants_df)}"
+
+
+class VersionedRegistry(Generic[K, V]):
+    """Load-time structures built from one loaded frame, one per key.
+
+    Only the most recent frame's entries are kept: asking for a different
+    frame drops them. The frame is held next to its entries and matched by
+    identity, so a new frame that reuses a freed frame's ``id`` can never be
+    served structures built from the old one. Builds are serialised, so
+    concurrent first requests do not each pay for them.
+    """
+
+    def __init__(self) -> None:
+        self._state: Tuple[Optional[pd.DataFrame], Dict[K, V]] = (None, {})
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        restaurants_df: pd.DataFrame,
+        key: K,
+        build: Callable[[Optional[V]], V],
+    ) -> V:
+        """Return the entry for ``key``, building it on first use.
+
+        ``build`` receives the entry the replaced frame had under ``key``
+        (or ``None``) when this call is the one that switches frames, so a
+        structure can be derived incrementally from its predecessor.
+        """
+        frame, entries = self._state
+        if frame is restaurants_df and key in entries:
+            return entries[key]
+        with self._lock:
+            frame, entries = self._state
+            previous: Optional[V] = None
+            if frame is not restaurants_df:
+                previous = entries.get(key)
+                entries = {}
+                self._state = (restaurants_df, entries)
+            if key not in entries:
+                entries[key] = build(previous)
+            return entries[key]
+
+    def entries(self) -> Dict[K, V]:
+        """Snapshot of the current frame's entries, for the memory report."""
+        return dict(self._state[1])
+
+
+_FINGERPRINTS: VersionedRegistry[None, str] = VersionedRegistry()
+
+
+def _fingerprint(restaurants_df: pd.DataFrame) -> str:
+    rows = pd.util.hash_pandas_object(restaurants_df, index=False).to_numpy()
+    digest = hashlib.blake2b(rows.tobytes(), digest_size=8)
+    digest.update(",".join(map(str, restaurants_df.columns)).encode())
+    return digest.hexdigest()
+
+
+def dataset_fingerprint(restaurants_df: pd.DataFrame) -> str:
+    """Opaque content hash of a loaded frame, for API responses.
+
+    ``dataset_version`` holds a memory address and changes on every
+    restart; the fingerprint only changes with the data. It is hashed once
+    per loaded frame.
+    """
+    return _FINGERPRINTS.get(
+        restaurants_df, None, lambda _previous: _fingerprint(restaurants_df)
+    )
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    def __init__(self, stage: str) -> None:
+        super().__init__(f"Request deadline exceeded during {stage}")
+        self.stage = stage
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    """A point in ``perf_counter`` time after which work should be abandoned.
+
+    Long computations call :meth:`check` between stages; there is no
+    preemption, so a stage that has started always runs to completion.
+    """
+
+    expires_at: float
+
+    @classmethod
+    def after_ms(cls, milliseconds: float) -> Deadline:
+        return cls(expires_at=perf_counter() + milliseconds / 1000.0)
+
+    def remaining_seconds(self) -> float:
+        return max(0.0, self.expires_at - perf_counter())
+
+    def expired(self) -> bool:
+        return perf_counter() >= self.expires_at
+
+    def check(self, stage: str) -> None:
+        if self.expired():
+            raise DeadlineExceeded(stage)
+
+
+def check_deadline(deadline: Optional[Deadline], stage: str) -> None:
+    if deadline is not None:
+        deadline.check(stage)
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from src.services.dataset import VersionedRegistry
+from src.services.restaurants import unit_frame
+
+T = TypeVar("T")
+
+FILTER_PARAMS = (
+    "location",
+    "restaurant_type",
+    "cuisine",
+    "min_rating",
+    "max_rating",
+    "min_cost",
+    "max_cost",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RowFilter:
+    """Row predicates shared by the analytics endpoints; ``None`` means unconstrained.
+
+    Categorical values match case-insensitively; ranges are inclusive and
+    exclude rows with no rating / cost.
+    """
+
+    location: Optional[str] = None
+    restaurant_type: Optional[str] = None
+    cuisine: Optional[str] = None
+    min_rating: Optional[float] = None
+    max_rating: Optional[float] = None
+    min_cost: Optional[int] = None
+    max_cost: Optional[int] = None
+
+    def is_empty(self) -> bool:
+        return all(getattr(self, f.name) is None for f in fields(self))
+
+    def cache_key(self) -> str:
+        return ",".join(
+            f"{f.name}={getattr(self, f.name)}"
+            for f in fields(self)
+            if getattr(self, f.name) is not None
+        )
+
+
+def _parse_number(
+    params: Mapping[str, Any], name: str, cast: Callable[[str], T]
+) -> Optional[T]:
+    raw = params.get(name)
+    if raw is None or raw == "":
+        return None
+    try:
+        return cast(str(raw))
+    except ValueError:
+        raise ValueError(f"Invalid parameter: {name} must be a number") from None
+
+
+def parse_row_filter(params: Mapping[str, Any]) -> RowFilter:
+    """Build a filter from query-string (or batch ``params``) values."""
+
+    def text(name: str) -> Optional[str]:
+        raw = params.get(name)
+        value = "" if raw is None else str(raw).strip()
+        return value or None
+
+    row_filter = RowFilter(
+        location=text("location"),
+        restaurant_type=text("restaurant_type"),
+        cuisine=text("cuisine"),
+        min_rating=_parse_number(params, "min_rating", float),
+        max_rating=_parse_number(params, "max_rating", float),
+        min_cost=_parse_number(params, "min_cost", int),
+        max_cost=_parse_number(params, "max_cost", int),
+    )
+    for low, high in (("min_rating", "max_rating"), ("min_cost", "max_cost")):
+        lo, hi = getattr(row_filter, low), getattr(row_filter, high)
+        if lo is not None and hi is not None and lo > hi:
+            raise ValueError(f"Invalid parameter: {low} must not exceed {high}")
+    return row_filter
+
+
+def _normalise(value: object) -> str:
+    return str(value).strip().lower()
+
+
+def _code_postings(codes: np.ndarray, size: int) -> List[np.ndarray]:
+    """Sorted row positions for each code in ``range(size)``, skipping ``-1``."""
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(size + 1), side="left")
+    return [
+        order[bounds[i] : bounds[i + 1]].astype(np.int64, copy=False)
+        for i in range(size)
+    ]
+
+
+def _value_postings(series: pd.Series) -> Dict[str, np.ndarray]:
+    """Map each normalised value to the sorted row positions holding it.
+
+    Values are factorised first, so string normalisation runs once per
+    distinct value and the sort is over integer codes.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    keys, key_of_unique = np.unique(
+        [_normalise(u) for u in uniques], return_inverse=True
+    )
+    key_codes = np.full(len(codes), -1, dtype=np.int64)
+    present = codes >= 0
+    key_codes[present] = key_of_unique[codes[present]]
+    postings = _code_postings(key_codes, len(keys))
+    return {str(key): positions for key, positions in zip(keys, postings)}
+
+
+def _cuisine_postings(series: pd.Series) -> Dict[str, np.ndarray]:
+    """Postings per individual cuisine from comma-separated cuisine lists."""
+    codes, combos = pd.factorize(series, use_na_sentinel=True)
+    combo_postings = _code_postings(codes, len(combos))
+    combos_by_cuisine: Dict[str, List[int]] = {}
+    for combo_code, combo in enumerate(combos):
+        for part in {_normalise(p) for p in str(combo).split(",")}:
+            if part:
+                combos_by_cuisine.setdefault(part, []).append(combo_code)
+    return {
+        cuisine: np.sort(np.concatenate([combo_postings[c] for c in combo_codes]))
+        for cuisine, combo_codes in combos_by_cuisine.items()
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class _RangeIndex:
+    values: np.ndarray  # per row, NaN when missing
+    order: np.ndarray  # row positions of non-missing values, sorted by value
+    sorted_values: np.ndarray
+
+    @classmethod
+    def build(cls, series: pd.Series) -> "_RangeIndex":
+        values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=float)
+        present = np.flatnonzero(~np.isnan(values))
+        order = present[np.argsort(values[present], kind="stable")]
+        return cls(values=values, order=order, sorted_values=values[order])
+
+    def positions(self, low: Optional[float], high: Optional[float]) -> np.ndarray:
+        start = (
+            0
+            if low is None
+            else int(np.searchsorted(self.sorted_values, low, side="left"))
+        )
+        stop = (
+            len(self.order)
+            if high is None
+            else int(np.searchsorted(self.sorted_values, high, side="right"))
+        )
+        return np.sort(self.order[start:stop])
+
+    def keep(
+        self, candidates: np.ndarray, low: Optional[float], high: Optional[float]
+    ) -> np.ndarray:
+        values = self.values[candidates]
+        mask = ~np.isnan(values)
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        kept: np.ndarray = candidates[mask]
+        return kept
+
+
+class DatasetIndex:
+    """Posting lists and sorted-value indexes over one loaded frame.
+
+    Categorical columns (location, restaurant type, each individual cuisine)
+    map a value to the sorted positions of its rows; rating and cost keep the
+    row positions ordered by value. A filter intersects the smallest posting
+    lists first and checks ranges only on the surviving candidates, so its
+    cost follows the number of matching rows rather than the frame size.
+    """
+
+    def __init__(self, restaurants_df: pd.DataFrame) -> None:
+        self.rows = len(restaurants_df)
+        self.categorical: Dict[str, Dict[str, np.ndarray]] = {}
+        for column in ("location", "restaurant_type"):
+            if column in restaurants_df.columns:
+                self.categorical[column] = _value_postings(restaurants_df[column])
+        if "cuisines" in restaurants_df.columns:
+            self.categorical["cuisine"] = _cuisine_postings(restaurants_df["cuisines"])
+
+        self.ranges: Dict[str, _RangeIndex] = {}
+        if "rating" in restaurants_df.columns:
+            self.ranges["rating"] = _RangeIndex.build(restaurants_df["rating"])
+        if "approx_cost_for_two" in restaurants_df.columns:
+            self.ranges["cost"] = _RangeIndex.build(
+                restaurants_df["approx_cost_for_two"]
+            )
+
+    def select(self, row_filter: RowFilter) -> np.ndarray:
+        """Sorted row positions matching ``row_filter``."""
+        lists: List[np.ndarray] = []
+        for column in ("location", "restaurant_type", "cuisine"):
+            value = getattr(row_filter, column)
+            if value is None:
+                continue
+            postings = self.categorical.get(column, {})
+            lists.append(
+                postings.get(value.strip().lower(), np.empty(0, dtype=np.int64))
+            )
+
+        ranges: List[Tuple[str, Optional[float], Optional[float]]] = [
+            (name, low, high)
+            for name, low, high in (
+                ("rating", row_filter.min_rating, row_filter.max_rating),
+                ("cost", row_filter.min_cost, row_filter.max_cost),
+            )
+            if (low is not None or high is not None) and name in self.ranges
+        ]
+
+        if lists:
+            lists.sort(key=len)
+            candidates = lists[0]
+            for other in lists[1:]:
+                if len(candidates) == 0:
+                    break
+                candidates = np.intersect1d(candidates, other, assume_unique=True)
+        elif ranges:
+            name, low, high = ranges.pop(0)
+            candidates = self.ranges[name].positions(low, high)
+        else:
+            return np.arange(self.rows)
+
+        for name, low, high in ranges:
+            candidates = self.ranges[name].keep(candidates, low, high)
+        return candidates
+
+    def apply(
+        self, restaurants_df: pd.DataFrame, row_filter: RowFilter
+    ) -> pd.DataFrame:
+        if row_filter.is_empty():
+            return restaurants_df
+        return restaurants_df.take(self.select(row_filter))
+
+
+_INDEXES: VersionedRegistry[str, DatasetIndex] = VersionedRegistry()
+
+
+def dataset_index_entries() -> Dict[str, DatasetIndex]:
+    """Snapshot of the cached filter indexes per unit, for the memory report."""
+    return _INDEXES.entries()
+
+
+def get_dataset_index(
+    restaurants_df: pd.DataFrame, unit: str = "listings"
+) -> DatasetIndex:
+    """Return the index over ``unit_frame(restaurants_df, unit)``.
+
+    The index is built on first use. Only the current frame is kept (one
+    index per unit).
+    """
+    return _INDEXES.get(
+        restaurants_df,
+        unit,
+        lambda _previous: DatasetIndex(unit_frame(restaurants_df, unit)),
+    )
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+_MB = 1024 * 1024
+
+
+def process_rss_bytes() -> int:
+    """Current resident set size, or 0 where the platform does not expose it."""
+    try:
+        with open("/proc/self/statm", "rb") as fh:
+            resident_pages = int(fh.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return peak_rss_bytes()
+    return resident_pages * _page_size()
+
+
+def peak_rss_bytes() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def _page_size() -> int:
+    if resource is None:  # pragma: no cover
+        return 4096
+    return resource.getpagesize()
+
+
+_NUMBER_TYPES = frozenset({int, float, bool, type(None)})
+
+
+def _sizeof_items(items: Any, seen: Set[int]) -> int:
+    """``deep_sizeof`` summed over ``items``, with scalars handled inline.
+
+    Id-keyed tables hold a string and an int per restaurant; a call per
+    item made walking them take seconds. Numbers are small and not worth
+    deduplicating, so only strings and containers go through ``seen``.
+    """
+    total = 0
+    for item in items:
+        kind = type(item)
+        if kind in _NUMBER_TYPES:
+            total += sys.getsizeof(item)
+            continue
+        key = id(item)
+        if key in seen:
+            continue
+        if kind is str or kind is bytes:
+            seen.add(key)
+            total += sys.getsizeof(item)
+        else:
+            total += deep_sizeof(item, seen)
+    return total
+
+
+def deep_sizeof(obj: Any, _seen: Optional[Set[int]] = None) -> int:
+    """Approximate the bytes held by ``obj`` and everything it references.
+
+    Shared objects are counted once. DataFrames and Series are measured with
+    ``memory_usage(deep=True)`` rather than walked; arrays count their buffer
+    (once, through the array owning it) and, for object arrays, their items.
+    """
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        size = sys.getsizeof(obj)
+        if obj.base is not None:
+            size += deep_sizeof(obj.base, seen)
+        if obj.dtype == object:
+            size += sum(map(sys.getsizeof, obj.ravel().tolist()))
+        return size
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, Mapping):
+        return (
+            size + _sizeof_items(obj.keys(), seen) + _sizeof_items(obj.values(), seen)
+        )
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + _sizeof_items(obj, seen)
+    if isinstance(obj, BaseModel):
+        return size + sum(
+            deep_sizeof(getattr(obj, name), seen) for name in type(obj).model_fields
+        )
+    if dataclasses.is_dataclass(obj):
+        return size + sum(
+            deep_sizeof(getattr(obj, f.name), seen) for f in dataclasses.fields(obj)
+        )
+    if hasattr(obj, "__dict__"):
+        return size + deep_sizeof(vars(obj), seen)
+    return size
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryReport:
+    sampled_at: float
+    dataset_bytes: int
+    dataset_columns: Dict[str, int]
+    caches: Dict[str, Dict[str, int]]
+    precomputed: Dict[str, int]
+
+
+def cache_namespace_sizes(
+    cache_name: str, entries: Mapping[str, Any]
+) -> Dict[str, Dict[str, int]]:
+    """Group cache entries by the key prefix before the first ``:``."""
+    sizes: Dict[str, Dict[str, int]] = {}
+    for key, value in entries.items():
+        namespace = f"{cache_name}.{key.split(':', 1)[0]}"
+        stats = sizes.setdefault(namespace, {"entries": 0, "bytes": 0})
+        stats["entries"] += 1
+        stats["bytes"] += deep_sizeof(value)
+    return dict(sorted(sizes.items()))
+
+
+class MemorySampler:
+    """Keep the last memory breakdown and refresh it in the background.
+
+    Walking the dataset and caches costs tens of milliseconds on the full
+    Zomato file, so ``/api/health`` only reads the last report and asks for a
+    new sample once it is older than ``interval_seconds``.
+    """
+
+    def __init__(
+        self, collect: Callable[[], MemoryReport], *, interval_seconds: float = 60.0
+    ) -> None:
+        self.collect = collect
+        self.interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+        self._report: Optional[MemoryReport] = None
+        self._sampling = False
+
+    def sample(self) -> MemoryReport:
+        report = self.collect()
+        with self._lock:
+            self._report = report
+        return report
+
+    def latest(self) -> Optional[MemoryReport]:
+        """Return the last report; start a background sample if it is missing or old."""
+        with self._lock:
+            report = self._report
+            due = (
+                report is None
+                or time.time() - report.sampled_at >= self.interval_seconds
+            )
+            if not due or self._sampling:
+                return report
+            self._sampling = True
+
+        def target() -> None:
+            try:
+                self.sample()
+            except Exception as exc:
+                logging.getLogger(__name__).warning("Memory sampling failed: %s", exc)
+            finally:
+                with self._lock:
+                    self._sampling = False
+
+        threading.Thread(target=target, name="memory-sampler", daemon=True).start()
+        return report
+
+
+def collect_memory_report(
+    restaurants_df: Optional[pd.DataFrame],
+    caches: Mapping[str, Mapping[str, Any]],
+    precomputed: Mapping[str, Any],
+) -> MemoryReport:
+    dataset_columns: Dict[str, int] = {}
+    if restaurants_df is not None:
+        usage = restaurants_df.memory_usage(deep=True)
+        dataset_columns = {str(name): int(size) for name, size in usage.items()}
+
+    cache_sizes: Dict[str, Dict[str, int]] = {}
+    for cache_name, entries in caches.items():
+        cache_sizes.update(cache_namespace_sizes(cache_name, entries))
+
+    # Precomputed structures share parts (the restaurant table behind the
+    # indexes, the dataset itself); each is counted under the first entry
+    # that holds it.
+    seen: Set[int] = set() if restaurants_df is None else {id(restaurants_df)}
+
+    return MemoryReport(
+        sampled_at=time.time(),
+        dataset_bytes=sum(dataset_columns.values()),
+        dataset_columns=dataset_columns,
+        caches=cache_sizes,
+        precomputed={
+            name: deep_sizeof(value, seen) for name, value in precomputed.items()
+        },
+    )
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.models.analytics import RestaurantRecord
+from src.services.dataset import VersionedRegistry
+
+# What the analytics count: every listing row, or each (name, location) once.
+UNITS = ("listings", "restaurants")
+
+
+def _parse_cuisine_list(value: str) -> List[str]:
+    parts: List[str] = []
+    for part in value.split(","):
+        part = part.strip()
+        if part and part not in parts:
+            parts.append(part)
+    return parts
+
+
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype="S1")
+_NIBBLE_SHIFTS = np.arange(60, -4, -4, dtype=np.uint64)
+
+
+def restaurant_ids(names: pd.Series, locations: pd.Series) -> np.ndarray:
+    """Stable 16-hex-digit ids for (name, location) pairs.
+
+    The id depends only on the pair, so it survives reloads and can be
+    computed for a handful of rows without building the full table.
+    """
+    keys = pd.DataFrame(
+        {
+            "name": names.astype(str).to_numpy(),
+            "location": locations.astype(str).to_numpy(),
+        }
+    )
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy(dtype=np.uint64)
+    nibbles = (hashes[:, None] >> _NIBBLE_SHIFTS) & np.uint64(0xF)
+    ids: np.ndarray = _HEX_DIGITS[nibbles].view("S16").ravel().astype(str)
+    return ids.astype(object)
+
+
+class RestaurantTable:
+    """One row per (name, location): the listings of a restaurant merged.
+
+    The merge rules are the ones the top restaurants are ranked by: the most frequent
+    restaurant type (first listed wins ties), the highest rating and vote
+    count, and the cuisines of all listings in first-seen order. Cost is the
+    first listed non-missing value. Every rule is a vectorised groupby; only
+    restaurants listed with different cuisine strings merge lists in Python.
+
+    ``frame`` is sorted by (name, location) and ``row_restaurant`` maps each
+    listing row of the source frame to its restaurant's position.
+    """
+
+    def __init__(self, restaurants_df: pd.DataFrame) -> None:
+        rows = len(restaurants_df)
+
+        def column(name: str, default: object) -> pd.Series:
+            if name in restaurants_df.columns:
+                return restaurants_df[name].reset_index(drop=True)
+            return pd.Series([default] * rows, dtype=object)
+
+        names = column("name", "Unknown").astype(str)
+        locations = column("location", "Unknown").astype(str)
+        listings = pd.DataFrame(
+            {
+                "name": names,
+                "location": locations,
+                "restaurant_type": column("restaurant_type", "Unknown").astype(str),
+                "cuisines": column("cuisines", "").fillna("").astype(str),
+                "rating": pd.to_numeric(column("rating", np.nan), errors="coerce"),
+                "votes": pd.to_numeric(column("votes", 0), errors="coerce")
+                .fillna(0)
+                .astype(np.int64),
+                "approx_cost_for_two": pd.to_numeric(
+                    column("approx_cost_for_two", np.nan), errors="coerce"
+                ),
+                "row": np.arange(rows, dtype=np.int64),
+            }
+        )
+
+        grouped = listings.groupby(["name", "location"], sort=True)
+        self.row_restaurant: np.ndarray = grouped.ngroup().to_numpy(dtype=np.int64)
+        frame = grouped.agg(
+            rating=("rating", "max"),
+            votes=("votes", "max"),
+            approx_cost_for_two=("approx_cost_for_two", "first"),
+            listings=("row", "size"),
+        ).reset_index()
+        listings["r"] = self.row_restaurant
+
+        frame["restaurant_type"] = self._pick_types(listings, len(frame))
+        frame["cuisines"] = self._merge_cuisines(listings, len(frame))
+        ids = restaurant_ids(frame["name"], frame["location"])
+        frame.insert(0, "restaurant_id", ids)
+        self.frame = frame
+        self.positions: Dict[str, int] = dict(zip(ids.tolist(), range(len(ids))))
+
+    @staticmethod
+    def _pick_types(listings: pd.DataFrame, size: int) -> np.ndarray:
+        types = np.full(size, "Unknown", dtype=object)
+        if size == 0:
+            return types
+        counts = (
+            listings.groupby(["r", "restaurant_type"], sort=False)
+            .agg(n=("row", "size"), first=("row", "min"))
+            .reset_index()
+            .sort_values(by=["r", "n", "first"], ascending=[True, False, True])
+            .drop_duplicates("r")
+        )
+        types[counts["r"].to_numpy()] = counts["restaurant_type"].to_numpy()
+        return types
+
+    @staticmethod
+    def _merge_cuisines(listings: pd.DataFrame, size: int) -> np.ndarray:
+        merged = np.full(size, "", dtype=object)
+        if size == 0:
+            return merged
+        combo_codes, combos = pd.factorize(listings["cuisines"])
+        parsed = [_parse_cuisine_list(str(c)) for c in combos]
+        cleaned = np.array([", ".join(parts) for parts in parsed], dtype=object)
+
+        seen = (
+            pd.DataFrame(
+                {
+                    "r": listings["r"].to_numpy(),
+                    "c": combo_codes,
+                    "row": listings["row"].to_numpy(),
+                }
+            )
+            .groupby(["r", "c"], sort=False)["row"]
+            .min()
+            .reset_index()
+            .sort_values(by=["r", "row"])
+        )
+        r_sorted = seen["r"].to_numpy()
+        c_sorted = seen["c"].to_numpy()
+        starts = np.flatnonzero(np.r_[True, r_sorted[1:] != r_sorted[:-1]])
+        merged[r_sorted[starts]] = cleaned[c_sorted[starts]]
+
+        # Restaurants listed with more than one cuisine string.
+        ends = np.r_[starts[1:], len(r_sorted)]
+        for start, end in zip(
+            starts[ends - starts > 1].tolist(), ends[ends - starts > 1].tolist()
+        ):
+            parts: List[str] = []
+            for code in c_sorted[start:end].tolist():
+                for part in parsed[code]:
+                    if part not in parts:
+                        parts.append(part)
+            merged[r_sorted[start]] = ", ".join(parts)
+        return merged
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def record(self, position: int) -> RestaurantRecord:
+        row = self.frame.iloc[position]
+        return RestaurantRecord(
+            restaurant_id=str(row["restaurant_id"]),
+            name=str(row["name"]),
+            location=str(row["location"]),
+            restaurant_type=str(row["restaurant_type"]),
+            cuisines=_parse_cuisine_list(str(row["cuisines"])),
+            rating=None if pd.isna(row["rating"]) else float(row["rating"]),
+            votes=int(row["votes"]),
+            approx_cost_for_two=None
+            if pd.isna(row["approx_cost_for_two"])
+            else int(row["approx_cost_for_two"]),
+            listings=int(row["listings"]),
+        )
+
+    def records(self, positions: Sequence[int]) -> List[RestaurantRecord]:
+        """Records for many ``positions``, from one ``take`` rather than ``iloc``s."""
+        rows = self.frame.take(np.asarray(positions, dtype=np.int64))
+        ratings = rows["rating"].to_numpy(dtype=float)
+        costs = rows["approx_cost_for_two"].to_numpy(dtype=float)
+        columns = zip(
+            rows["restaurant_id"].tolist(),
+            rows["name"].tolist(),
+            rows["location"].tolist(),
+            rows["restaurant_type"].tolist(),
+            rows["cuisines"].tolist(),
+            ratings.tolist(),
+            rows["votes"].tolist(),
+            costs.tolist(),
+            rows["listings"].tolist(),
+        )
+        return [
+            RestaurantRecord(
+                restaurant_id=str(restaurant_id),
+                name=str(name),
+                location=str(location),
+                restaurant_type=str(restaurant_type),
+                cuisines=_parse_cuisine_list(str(cuisines)),
+                rating=None if np.isnan(rating) else float(rating),
+                votes=int(votes),
+                approx_cost_for_two=None if np.isnan(cost) else int(cost),
+                listings=int(listings),
+            )
+            for (
+                restaurant_id,
+                name,
+                location,
+                restaurant_type,
+                cuisines,
+                rating,
+                votes,
+                cost,
+                listings,
+            ) in columns
+        ]
+
+    def lookup(self, restaurant_ids: Iterable[str]) -> List[Optional[int]]:
+        """Positions of ``restaurant_ids`` (``None`` for unknown ids), by id hash."""
+        return [self.positions.get(restaurant_id) for restaurant_id in restaurant_ids]
+
+
+def parse_unit(raw: Optional[str]) -> str:
+    """Validate the ``unit`` parameter; empty means ``listings``."""
+    unit = (raw or "").strip() or "listings"
+    if unit not in UNITS:
+        raise ValueError(f"Invalid parameter: unit must be one of: {', '.join(UNITS)}")
+    return unit
+
+
+_TABLES: VersionedRegistry[None, RestaurantTable] = VersionedRegistry()
+
+
+def restaurant_table_entries() -> Dict[None, RestaurantTable]:
+    """Snapshot of the cached restaurant table, for the memory report."""
+    return _TABLES.entries()
+
+
+def get_restaurant_table(restaurants_df: pd.DataFrame) -> RestaurantTable:
+    """Return the deduplicated table for this frame, building it on first use."""
+    return _TABLES.get(
+        restaurants_df, None, lambda _previous: RestaurantTable(restaurants_df)
+    )
+
+
+def unit_frame(restaurants_df: pd.DataFrame, unit: str = "listings") -> pd.DataFrame:
+    """The rows analytics run over for ``unit``.
+
+    That is the listings, or the load-time restaurant table.
+    """
+    if unit == "restaurants":
+        return get_restaurant_table(restaurants_df).frame
+    return restaurants_df
+
+
+def get_restaurant(
+    restaurants_df: pd.DataFrame, restaurant_id: str
+) -> Optional[RestaurantRecord]:
+    """The deduplicated record for ``restaurant_id``, or ``None`` if unknown."""
+    table = get_restaurant_table(restaurants_df)
+    position = table.positions.get(restaurant_id)
+    return None if position is None else table.record(position)
+
+
+def lookup_restaurants(
+    restaurants_df: pd.DataFrame,
+    ids: Sequence[str] = (),
+    keys: Sequence[Tuple[str, str]] = (),
+) -> List[Optional[RestaurantRecord]]:
+    """Records for ``ids`` then for (name, location) ``keys``, ``None`` where unknown.
+
+    Keys are hashed to ids, so both kinds resolve through the same id index.
+    """
+    table = get_restaurant_table(restaurants_df)
+    wanted = list(ids)
+    if keys:
+        names, locations = zip(*keys)
+        wanted.extend(restaurant_ids(pd.Series(names), pd.Series(locations)).tolist())
+    positions = table.lookup(wanted)
+    records = iter(table.records([p for p in positions if p is not None]))
+    return [None if position is None else next(records) for position in positions]
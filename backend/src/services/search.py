@@ -0,0 +1,474 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.models.analytics import RestaurantRecord
+from src.services.dataset import VersionedRegistry
+from src.services.restaurants import RestaurantTable, get_restaurant_table
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+_KEY_SHIFT = np.int64(32)
+_OWNER_MASK = np.int64(0xFFFFFFFF)
+
+# Best names kept for each one-letter prefix (the widest name ranges).
+_INITIAL_TOP = 64
+
+# Fuzzy matches are ranked by trigram similarity rounded to 1/_SIMILARITY_STEPS.
+_SIMILARITY_STEPS = 10_000
+
+# Trigrams held by at least 1/_DENSE_FRACTION of the names get a bitmap too.
+_DENSE_FRACTION = 64
+
+
+def normalize_name(value: str) -> str:
+    """Lower-case ``value`` and collapse punctuation and spacing to single spaces."""
+    return _NON_WORD.sub(" ", str(value).lower()).strip()
+
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    values = np.sort(values)
+    return values[np.r_[True, values[1:] != values[:-1]]] if len(values) else values
+
+
+def _trigram_keys(names: List[str], owners: np.ndarray) -> np.ndarray:
+    """Sorted, distinct ``trigram << 32 | owner`` keys of the space-padded ``names``.
+
+    Trigrams are taken over UTF-8 bytes; the padding makes word starts and
+    ends trigrams of their own (" pi", "za "), so two-letter queries can
+    match word prefixes.
+    """
+    if not names:
+        return np.empty(0, dtype=np.int64)
+    raw = np.frombuffer(
+        "\0".join(f" {name} " for name in names).encode("utf-8"), dtype=np.uint8
+    )
+    data = raw.astype(np.int64)
+    grams = (data[:-2] << 16) | (data[1:-1] << 8) | data[2:]
+    valid = (raw[:-2] != 0) & (raw[1:-1] != 0) & (raw[2:] != 0)
+    owner = owners[np.cumsum(raw == 0)[:-2]]
+    return _sorted_unique((grams[valid] << _KEY_SHIFT) | owner[valid])
+
+
+def _query_trigrams(query: str) -> List[int]:
+    data = query.encode("utf-8")
+    return list(
+        dict.fromkeys(
+            (data[i] << 16) | (data[i + 1] << 8) | data[i + 2]
+            for i in range(len(data) - 2)
+        )
+    )
+
+
+class SearchIndex:
+    """Typo-tolerant name search over the deduplicated restaurants.
+
+    Names are normalised (lower case, punctuation to spaces) and the distinct
+    ones kept in sorted order, so a prefix is a contiguous range of name ids.
+    A trigram inverted index maps each trigram to the sorted ids of the
+    names containing it. Matches are ranked in tiers, each by votes:
+
+    1. exact name
+    2. name prefix (a binary search over the sorted names)
+    3. substring (intersection of the query's trigram postings, rarest
+       first, then confirmed with ``in``)
+    4. fuzzy: names sharing enough of the query's trigrams to be within a
+       few typos; each edit breaks at most three trigrams. Ranked by trigram
+       similarity, then votes.
+
+    Later tiers are only evaluated when the earlier ones return fewer than
+    ``limit`` restaurants.
+    """
+
+    def __init__(
+        self, table: RestaurantTable, *, previous: Optional["SearchIndex"] = None
+    ) -> None:
+        frame = table.frame
+        self.table = table
+        self._votes = frame["votes"].to_numpy(dtype=np.int64)
+
+        codes, uniques = pd.factorize(
+            self._normalized_names(frame["name"].astype(str), previous)
+        )
+        order = sorted(range(len(uniques)), key=uniques.__getitem__)
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        self.names: List[str] = [uniques[i] for i in order]
+        self.restaurant_name = rank[codes]
+
+        # Restaurants grouped by name, most voted first.
+        self._order = np.lexsort((-self._votes, self.restaurant_name))
+        self._name_starts = np.searchsorted(
+            self.restaurant_name[self._order], np.arange(len(self.names) + 1)
+        )
+        self._name_votes = np.full(len(self.names), -1, dtype=np.int64)
+        np.maximum.at(self._name_votes, self.restaurant_name, self._votes)
+        self._max_votes = int(self._name_votes.max(initial=0))
+
+        location_codes, locations = pd.factorize(
+            frame["location"].astype(str).str.lower()
+        )
+        self._location_codes = {str(name): code for code, name in enumerate(locations)}
+        self._restaurant_location = location_codes
+        self._location_order = np.argsort(location_codes, kind="stable")
+        self._location_starts = np.searchsorted(
+            location_codes[self._location_order], np.arange(len(locations) + 1)
+        )
+
+        # One-letter queries would rank the widest prefix ranges, so their
+        # best names are ranked once here.
+        self._initials: Dict[str, np.ndarray] = {}
+        for initial in sorted({name[:1] for name in self.names if name}):
+            lo, hi = self._prefix_range(initial)
+            lo += self.names[lo] == initial
+            self._initials[initial] = self._best(
+                np.arange(lo, hi), self._name_votes[lo:hi], _INITIAL_TOP
+            )
+
+        keys = self._build_keys(previous)
+        grams = keys >> _KEY_SHIFT
+        self._postings = (keys & _OWNER_MASK).astype(np.int32)
+        starts = (
+            np.flatnonzero(np.r_[True, grams[1:] != grams[:-1]])
+            if len(grams)
+            else np.empty(0, np.int64)
+        )
+        self._grams = grams[starts]
+        self._gram_starts = np.append(starts, len(grams))
+        self._name_grams = np.bincount(self._postings, minlength=len(self.names))
+
+        # Trigrams held by many names also get a bitmap, so probing them is
+        # a lookup rather than a binary search over a long posting list.
+        dense = np.flatnonzero(
+            np.diff(self._gram_starts) * _DENSE_FRACTION >= len(self.names)
+        )
+        self._bitmaps: Dict[int, np.ndarray] = {}
+        for at in dense.tolist():
+            members = np.zeros(len(self.names), dtype=bool)
+            members[
+                self._postings[self._gram_starts[at] : self._gram_starts[at + 1]]
+            ] = True
+            self._bitmaps[at] = np.packbits(members, bitorder="little")
+
+    @staticmethod
+    def _normalized_names(
+        names: pd.Series, previous: Optional["SearchIndex"]
+    ) -> np.ndarray:
+        if previous is None:
+            return np.asarray(
+                [normalize_name(name) for name in names.tolist()], dtype=object
+            )
+        # Names the previous version already normalised are looked up.
+        known = pd.Series(
+            np.asarray(previous.names, dtype=object)[previous.restaurant_name],
+            index=previous.table.frame["name"].astype(str).to_numpy(),
+        )
+        normalized = names.map(known[~known.index.duplicated()]).to_numpy(dtype=object)
+        missing = np.flatnonzero(pd.isna(normalized))
+        normalized[missing] = [
+            normalize_name(name) for name in names.to_numpy()[missing].tolist()
+        ]
+        return normalized
+
+    def _build_keys(self, previous: Optional["SearchIndex"]) -> np.ndarray:
+        ids = np.arange(len(self.names), dtype=np.int64)
+        if previous is None or not previous.names:
+            return _trigram_keys(self.names, ids)
+
+        # Names kept from the previous index reuse its trigram keys: both
+        # name lists are sorted, so renumbering preserves the key order and
+        # only the names new in this version are split into trigrams.
+        renumber = pd.Index(self.names).get_indexer(pd.Index(previous.names))
+        kept = renumber >= 0
+
+        old_keys = (
+            np.repeat(previous._grams, np.diff(previous._gram_starts)) << _KEY_SHIFT
+        ) | previous._postings
+        old_owner = renumber[old_keys & _OWNER_MASK]
+        reused = ((old_keys >> _KEY_SHIFT) << _KEY_SHIFT) | old_owner
+        reused = reused[old_owner >= 0]
+
+        added = np.ones(len(self.names), dtype=bool)
+        added[renumber[kept]] = False
+        fresh = _trigram_keys(
+            [self.names[i] for i in np.flatnonzero(added).tolist()], ids[added]
+        )
+        return np.sort(np.concatenate([reused, fresh]), kind="stable")
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def _lookup(
+        self, grams: List[int]
+    ) -> List[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """(posting, bitmap or ``None``) for each of ``grams``, rarest first."""
+        found: List[Tuple[np.ndarray, Optional[np.ndarray]]] = []
+        for gram in grams:
+            at = int(np.searchsorted(self._grams, gram))
+            if at == len(self._grams) or self._grams[at] != gram:
+                found.append((self._postings[:0], None))
+            else:
+                posting = self._postings[
+                    self._gram_starts[at] : self._gram_starts[at + 1]
+                ]
+                found.append((posting, self._bitmaps.get(at)))
+        return sorted(found, key=lambda item: len(item[0]))
+
+    @staticmethod
+    def _contains(
+        posting: np.ndarray, bitmap: Optional[np.ndarray], names: np.ndarray
+    ) -> np.ndarray:
+        if bitmap is not None:
+            bits: np.ndarray = bitmap[names >> 3] >> (names & 7).astype(np.uint8)
+            return (bits & 1).astype(bool)
+        if not len(posting):
+            return np.zeros(len(names), dtype=bool)
+        at = np.minimum(np.searchsorted(posting, names), len(posting) - 1)
+        found: np.ndarray = posting[at] == names
+        return found
+
+    def _all_of(
+        self, lists: List[Tuple[np.ndarray, Optional[np.ndarray]]]
+    ) -> np.ndarray:
+        """Names in every list, sorted."""
+        if lists[0][1] is not None:
+            # Only common trigrams: AND the bitmaps.
+            merged = np.bitwise_and.reduce(
+                [bitmap for _, bitmap in lists if bitmap is not None]
+            )
+            return np.flatnonzero(
+                np.unpackbits(merged, count=len(self.names), bitorder="little")
+            )
+        names = lists[0][0]
+        for posting, bitmap in lists[1:]:
+            if not len(names):
+                break
+            names = names[self._contains(posting, bitmap, names)]
+        return names
+
+    def _closest(
+        self, lists: List[Tuple[np.ndarray, Optional[np.ndarray]]], min_hits: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Names in at least ``min_hits`` of the lists, with their hit counts.
+
+        ``lists`` are ordered rarest first.
+        """
+        sparse = [posting for posting, bitmap in lists if bitmap is None]
+        bitmaps = [bitmap for _, bitmap in lists if bitmap is not None]
+        if bitmaps:
+            # Common trigrams: add up the unpacked bitmaps, then the rest.
+            counts: np.ndarray = np.zeros(
+                len(self.names), dtype=np.uint8 if len(lists) < 256 else np.uint16
+            )
+            for bitmap in bitmaps:
+                counts += np.unpackbits(
+                    bitmap, count=len(self.names), bitorder="little"
+                )
+            for posting in sparse:
+                counts[posting] += 1
+            names = np.flatnonzero(counts >= min_hits)
+            return names, counts[names].astype(np.int64)
+
+        # A qualifying name is in one of the rarest ``len - min_hits + 1``
+        # lists. One sort counts every list and flags members of those.
+        sources = len(lists) - min_hits + 1
+        tagged = [
+            posting.astype(np.int64) * 2 + (i >= sources)
+            for i, posting in enumerate(sparse)
+        ]
+        merged = np.sort(np.concatenate(tagged))
+        starts = np.flatnonzero(np.diff(merged >> 1, prepend=-1))
+        hits = np.diff(np.r_[starts, len(merged)])
+        keep = ((merged[starts] & 1) == 0) & (hits >= min_hits)
+        return merged[starts][keep] >> 1, hits[keep]
+
+    def _prefix_range(self, query: str) -> Tuple[int, int]:
+        lo = bisect_left(self.names, query)
+        hi = bisect_left(self.names, query + "\U0010ffff", lo)
+        return lo, hi
+
+    def _name_votes_in(self, location: Optional[int]) -> np.ndarray:
+        """Best votes per name, within ``location`` when given.
+
+        Names without a restaurant there get -1.
+        """
+        if location is None:
+            return self._name_votes
+        members = self._location_order[
+            self._location_starts[location] : self._location_starts[location + 1]
+        ]
+        votes = np.full(len(self.names), -1, dtype=np.int64)
+        np.maximum.at(votes, self.restaurant_name[members], self._votes[members])
+        return votes
+
+    def _expand(self, name_ids: List[int], location: Optional[int]) -> List[int]:
+        """Restaurants of ``name_ids``, in that order, most voted first per name."""
+        positions: List[int] = []
+        for name_id in name_ids:
+            members = self._order[
+                self._name_starts[name_id] : self._name_starts[name_id + 1]
+            ]
+            if location is not None:
+                members = members[self._restaurant_location[members] == location]
+            positions.extend(members.tolist())
+        return positions
+
+    def _by_votes(
+        self, name_ids: List[int], location: Optional[int], count: int
+    ) -> List[int]:
+        # The ``count`` most-voted restaurants of a tier all belong to its
+        # ``count`` names with the most-voted restaurants.
+        positions = self._expand(name_ids, location)
+        positions.sort(key=lambda p: (-self._votes[p], self.restaurant_name[p]))
+        return positions[:count]
+
+    def _best(self, names: np.ndarray, score: np.ndarray, count: int) -> np.ndarray:
+        """The ``count`` highest-scoring ``names``, best first.
+
+        Ties go to the earlier name.
+        """
+        key = score * len(self.names) + (len(self.names) - 1 - names)
+        if len(names) > count:
+            top = np.argpartition(-key, count - 1)[:count]
+            names, key = names[top], key[top]
+        return names[np.argsort(-key, kind="stable")]
+
+    def search(
+        self, query: str, *, limit: int = 10, location: Optional[str] = None
+    ) -> List[int]:
+        """Positions in the restaurant table of the best matches for ``query``."""
+        query = normalize_name(query)
+        code = None
+        if location is not None:
+            code = self._location_codes.get(location.strip().lower())
+            if code is None:
+                return []
+        if not query:
+            return []
+        votes = self._name_votes_in(code)
+
+        results: List[int] = []
+        lo, hi = self._prefix_range(query)
+        exact = lo < hi and self.names[lo] == query
+        if exact:
+            results.extend(self._by_votes([lo], code, limit))
+        if len(results) < limit and lo + exact < hi:
+            need = limit - len(results)
+            if code is None and len(query) == 1 and need <= _INITIAL_TOP:
+                names = self._initials[query][:need]
+            else:
+                names = np.arange(lo + exact, hi)
+                names = names[votes[names] >= 0]
+                names = self._best(names, votes[names], need)
+            results.extend(self._by_votes(names.tolist(), code, need))
+        if len(results) >= limit or len(query) < 2:
+            return results[:limit]
+
+        # Two-letter queries match word prefixes through the " xy" trigram.
+        needle = query if len(query) >= 3 else f" {query}"
+        grams = _query_trigrams(needle)
+        lists = self._lookup(grams)
+
+        # Substring: names holding every query trigram, confirmed with ``in``,
+        # most-voted first in growing batches until ``need`` are confirmed.
+        candidates = self._all_of(lists)
+        candidates = candidates[
+            ((candidates < lo) | (candidates >= hi)) & (votes[candidates] >= 0)
+        ]
+        matched: List[int] = []
+        need = limit - len(results)
+        batch = 4 * need
+        while len(matched) < need and len(candidates):
+            checked = self._best(candidates, votes[candidates], batch)
+            for name_id in checked.tolist():
+                if needle in f" {self.names[name_id]}":
+                    matched.append(name_id)
+                    if len(matched) == need:
+                        break
+            candidates = candidates[~np.isin(candidates, checked)]
+            batch *= 4
+        results.extend(self._by_votes(matched, code, need))
+        if len(results) >= limit or len(query) < 4:
+            return results[:limit]
+
+        # Fuzzy: each typo breaks at most three of the query's trigrams, so a
+        # name within ``typos`` edits still shares ``min_hits`` of them.
+        # The padded query also matches on word starts and ends.
+        typos = 1 if len(query) < 8 else 2
+        grams = _query_trigrams(f" {query} ")
+        min_hits = max((len(grams) + 1) // 2, len(grams) - 3 * typos)
+        names, hits = self._closest(self._lookup(grams), min_hits)
+        keep = (
+            ((names < lo) | (names >= hi))
+            & (votes[names] >= 0)
+            & ~np.isin(names, matched)
+        )
+        names, hits = names[keep], hits[keep]
+
+        # Rank by trigram similarity (shared / all distinct trigrams of the
+        # two), then votes. Every remaining name has a restaurant in scope,
+        # so ``need`` names suffice.
+        need = limit - len(results)
+        similarity = hits / (len(grams) + self._name_grams[names] - hits)
+        score = (
+            np.round(similarity * _SIMILARITY_STEPS).astype(np.int64)
+            * (self._max_votes + 1)
+            + votes[names]
+        )
+        for name_id in self._best(names, score, need).tolist():
+            results.extend(self._expand([name_id], code))
+        return results[:limit]
+
+
+_INDEXES: VersionedRegistry[None, SearchIndex] = VersionedRegistry()
+
+
+def search_index_entries() -> Dict[None, SearchIndex]:
+    """Snapshot of the cached search index, for the memory report."""
+    return _INDEXES.entries()
+
+
+def get_search_index(restaurants_df: pd.DataFrame) -> SearchIndex:
+    """Return the search index for this frame.
+
+    A new frame is indexed incrementally from the previous one: only names
+    that were not in the previous frame are split into trigrams.
+    """
+    return _INDEXES.get(
+        restaurants_df,
+        None,
+        lambda previous: SearchIndex(
+            get_restaurant_table(restaurants_df), previous=previous
+        ),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class RestaurantSearchResult:
+    restaurants: List[RestaurantRecord]
+    processing_time_ms: int
+
+
+def find_restaurants(
+    restaurants_df: pd.DataFrame,
+    query: str,
+    *,
+    limit: int = 10,
+    location: Optional[str] = None,
+) -> RestaurantSearchResult:
+    """Restaurants whose name best matches ``query``, optionally within ``location``."""
+    start = perf_counter()
+    index = get_search_index(restaurants_df)
+    positions = index.search(query, limit=limit, location=location)
+    restaurants = [index.table.record(p) for p in positions]
+    processing_time_ms = int((perf_counter() - start) * 1000)
+    return RestaurantSearchResult(
+        restaurants=restaurants, processing_time_ms=processing_time_ms
+    )
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.models.analytics import RestaurantRecord, SimilarRestaurant
+from src.services.cube import expand_cuisine_lists
+from src.services.dataset import VersionedRegistry
+from src.services.restaurants import RestaurantTable, get_restaurant_table
+
+# Upper bounds of the cost-for-two bands; the last band is open-ended.
+COST_BAND_EDGES = (300, 500, 800, 1200, 2000)
+
+# Weights of the feature groups in the similarity score (they sum to 1).
+WEIGHTS = {"cuisines": 0.5, "restaurant_type": 0.2, "cost": 0.15, "rating": 0.15}
+
+_MEMO_SIZE = 4096
+
+
+class SimilarityIndex:
+    """Nearest-neighbour lookups over the deduplicated restaurants.
+
+    Each restaurant is a sparse feature vector: its cuisine set (multi-hot),
+    a one-hot restaurant type, a cost band and a half-star rating bucket.
+    Restaurants with identical features share a *profile*, and similarity
+    only depends on the profile, so a lookup scores profiles rather than
+    restaurants:
+
+    - cuisines: cosine of the multi-hot vectors, from the sparse list ->
+      cuisine incidence (overlap counts come from the query's cuisines only)
+    - restaurant type: 1 when equal
+    - cost: 1 for the same band, 0.5 for an adjacent one
+    - rating: 1 - |difference| in stars, floored at 0
+
+    Neighbour lists are memoised per profile, so repeated lookups for the
+    restaurants of one profile do not rescore.
+    """
+
+    def __init__(self, table: RestaurantTable) -> None:
+        frame = table.frame
+        self.table = table
+        self._votes = frame["votes"].to_numpy()
+
+        combo_codes, combos = pd.factorize(frame["cuisines"])
+        _, expansion, _ = expand_cuisine_lists(combos)
+        # Expansion rows are grouped by cuisine list; also index them by cuisine.
+        self._exp_combo = expansion["c"].to_numpy()
+        self._exp_cuisine = expansion["k"].to_numpy()
+        self._combo_starts = np.searchsorted(
+            self._exp_combo, np.arange(len(combos) + 1)
+        )
+        self._by_cuisine = np.argsort(self._exp_cuisine, kind="stable")
+        self._cuisine_starts = np.searchsorted(
+            self._exp_cuisine[self._by_cuisine],
+            np.arange(int(self._exp_cuisine.max(initial=-1)) + 2),
+        )
+        self._combo_sizes = np.diff(self._combo_starts).astype(float)
+
+        type_codes, _ = pd.factorize(frame["restaurant_type"])
+        cost = frame["approx_cost_for_two"].to_numpy(dtype=float)
+        bands = np.where(
+            np.isnan(cost), -1, np.searchsorted(COST_BAND_EDGES, cost, side="right")
+        )
+        rating = frame["rating"].to_numpy(dtype=float)
+        buckets = np.where(
+            np.isnan(rating), -1, np.round(np.nan_to_num(rating) * 2)
+        ).astype(np.int64)
+
+        # Unique rows come back sorted, so profiles are grouped by cuisine list.
+        features = np.stack([combo_codes, type_codes, bands, buckets], axis=1).astype(
+            np.int64
+        )
+        profiles, inverse = np.unique(features, axis=0, return_inverse=True)
+        self.restaurant_profile = inverse.ravel()
+        self._p_combo, self._p_type, self._p_band, self._p_bucket = profiles.T
+        self._profile_starts = np.searchsorted(
+            self._p_combo, np.arange(len(combos) + 1)
+        )
+
+        # Restaurants grouped by profile, most voted first.
+        self._order = np.lexsort((-self._votes, self.restaurant_profile))
+        self._starts = np.searchsorted(
+            self.restaurant_profile[self._order], np.arange(len(profiles) + 1)
+        )
+        self._sizes = np.diff(self._starts)
+
+        self._memo: "OrderedDict[Tuple[int, int], List[Tuple[int, float]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def _other_features(self, profile: int, candidates: np.ndarray) -> np.ndarray:
+        type_sim = (self._p_type[candidates] == self._p_type[profile]).astype(float)
+
+        bands = self._p_band[candidates]
+        band = self._p_band[profile]
+        band_gap = np.abs(bands - band)
+        cost_sim = np.where(band_gap == 0, 1.0, np.where(band_gap == 1, 0.5, 0.0))
+        cost_sim[(bands < 0) | (band < 0)] = 0.0
+
+        buckets = self._p_bucket[candidates]
+        bucket = self._p_bucket[profile]
+        rating_sim = np.clip(1.0 - np.abs(buckets - bucket) / 2.0, 0.0, None)
+        rating_sim[(buckets < 0) | (bucket < 0)] = 0.0
+
+        features: np.ndarray = (
+            WEIGHTS["restaurant_type"] * type_sim
+            + WEIGHTS["cost"] * cost_sim
+            + WEIGHTS["rating"] * rating_sim
+        )
+        return features
+
+    def _cuisine_cosine(self, profile: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Cuisine lists sharing a cuisine with ``profile``'s, best cosine first."""
+        combo = self._p_combo[profile]
+        query = self._exp_cuisine[
+            self._combo_starts[combo] : self._combo_starts[combo + 1]
+        ]
+        if len(query) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        postings = [
+            self._by_cuisine[self._cuisine_starts[k] : self._cuisine_starts[k + 1]]
+            for k in query
+        ]
+        overlap = np.bincount(
+            self._exp_combo[np.concatenate(postings)], minlength=len(self._combo_sizes)
+        )
+        combos = np.flatnonzero(overlap)
+        cosine = overlap[combos] / np.sqrt(self._combo_sizes[combos] * len(query))
+        order = np.argsort(-cosine, kind="stable")
+        return combos[order], cosine[order]
+
+    def _profiles_of(
+        self, combos: np.ndarray, cosine: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        first = self._profile_starts[combos]
+        lengths = self._profile_starts[combos + 1] - first
+        offsets = np.arange(lengths.sum()) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+        return np.repeat(first, lengths) + offsets, np.repeat(cosine, lengths)
+
+    def _rank(
+        self, scores: np.ndarray, candidates: np.ndarray, count: int
+    ) -> List[Tuple[int, float]]:
+        if len(scores) > count:
+            # Only profiles scoring at least the count-th best can contribute.
+            threshold = np.partition(scores, len(scores) - count)[len(scores) - count]
+            keep = scores >= threshold
+            scores, candidates = scores[keep], candidates[keep]
+        order = np.lexsort(
+            (-self._votes[self._order[self._starts[candidates]]], -scores)
+        )
+        picked: List[Tuple[int, float, int]] = []
+        covered = 0
+        for i in order.tolist():
+            if covered >= count and scores[i] < picked[-1][1]:
+                break
+            candidate = int(candidates[i])
+            members = self._order[
+                self._starts[candidate] : self._starts[candidate + 1]
+            ][:count]
+            score = float(scores[i])
+            picked.extend(
+                (int(position), score, int(self._votes[position]))
+                for position in members
+            )
+            covered += len(members)
+        picked.sort(key=lambda item: (-item[1], -item[2]))
+        return [(position, score) for position, score, _ in picked[:count]]
+
+    def _neighbours_of_profile(
+        self, profile: int, count: int
+    ) -> List[Tuple[int, float]]:
+        combos, cosine = self._cuisine_cosine(profile)
+
+        # Best-first over cuisine lists: a profile whose list has cosine c
+        # scores at most w * c + (1 - w), so once enough scored restaurants
+        # beat that bound for the next unscored list, the rest can be skipped.
+        weight = WEIGHTS["cuisines"]
+        scored: List[Tuple[np.ndarray, np.ndarray]] = []
+        done, chunk = 0, 64
+        while done < len(combos):
+            upto = min(len(combos), done + chunk)
+            candidates, cos = self._profiles_of(combos[done:upto], cosine[done:upto])
+            scored.append(
+                (weight * cos + self._other_features(profile, candidates), candidates)
+            )
+            done, chunk = upto, chunk * 2
+
+            bound = (
+                weight * cosine[done] + (1.0 - weight)
+                if done < len(combos)
+                else 1.0 - weight
+            )
+            scores = np.concatenate([s for s, _ in scored])
+            candidates = np.concatenate([c for _, c in scored])
+            above = scores > bound
+            if self._sizes[candidates[above]].sum() >= count:
+                return self._rank(scores[above], candidates[above], count)
+
+        # Too few good matches among lists sharing a cuisine: score everything.
+        everything = np.arange(len(self._p_combo))
+        scores = self._other_features(profile, everything)
+        if len(combos):
+            candidates, cos = self._profiles_of(combos, cosine)
+            scores[candidates] += weight * cos
+        return self._rank(scores, everything, count)
+
+    def neighbours(self, position: int, k: int) -> List[Tuple[int, float]]:
+        """The ``k`` restaurants most like the one at ``position``, with scores."""
+        profile = int(self.restaurant_profile[position])
+        key = (profile, k)
+        with self._lock:
+            found = self._memo.get(key)
+            if found is not None:
+                self._memo.move_to_end(key)
+        if found is None:
+            # One extra, since the restaurant itself is in its own profile.
+            found = self._neighbours_of_profile(profile, k + 1)
+            with self._lock:
+                self._memo[key] = found
+                while len(self._memo) > _MEMO_SIZE:
+                    self._memo.popitem(last=False)
+        return [(p, score) for p, score in found if p != position][:k]
+
+
+_INDEXES: VersionedRegistry[None, SimilarityIndex] = VersionedRegistry()
+
+
+def similarity_index_entries() -> Dict[None, SimilarityIndex]:
+    """Snapshot of the cached similarity index, for the memory report."""
+    return _INDEXES.entries()
+
+
+def get_similarity_index(restaurants_df: pd.DataFrame) -> SimilarityIndex:
+    """Return the similarity index for this frame, building it on first use."""
+    return _INDEXES.get(
+        restaurants_df,
+        None,
+        lambda _previous: SimilarityIndex(get_restaurant_table(restaurants_df)),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SimilarRestaurantsResult:
+    restaurant: RestaurantRecord
+    similar: List[SimilarRestaurant]
+    processing_time_ms: int
+
+
+def find_similar_restaurants(
+    restaurants_df: pd.DataFrame, restaurant_id: str, *, limit: int = 10
+) -> Optional[SimilarRestaurantsResult]:
+    """The ``limit`` restaurants most like ``restaurant_id``.
+
+    Returns ``None`` if the id is unknown.
+    """
+    start = perf_counter()
+    index = get_similarity_index(restaurants_df)
+    position = index.table.positions.get(restaurant_id)
+    if position is None:
+        return None
+    similar = [
+        SimilarRestaurant(restaurant=index.table.record(p), similarity=round(score, 4))
+        for p, score in index.neighbours(position, limit)
+    ]
+    processing_time_ms = int((perf_counter() - start) * 1000)
+    return SimilarRestaurantsResult(
+        restaurant=index.table.record(position),
+        similar=similar,
+        processing_time_ms=processing_time_ms,
+    )
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, cast
+
+from src.services.deadline import Deadline, DeadlineExceeded
+from src.utils.timing import stage
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _Call:
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Collapse concurrent computations of the same key into one execution.
+
+    The first caller for a key runs the computation; callers that arrive while
+    it is in flight wait for and share its result (or its exception).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def _begin(self, key: str) -> Tuple[_Call, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                return call, False
+            call = _Call()
+            self._calls[key] = call
+            return call, True
+
+    def _run(self, key: str, call: _Call, fn: Callable[[], Any]) -> None:
+        try:
+            call.value = fn()
+        except BaseException as exc:
+            call.error = exc
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def do(
+        self, key: str, fn: Callable[[], T], *, deadline: Optional[Deadline] = None
+    ) -> T:
+        """Run or join the computation for ``key``.
+
+        A waiter stops waiting at its own ``deadline``. If the computation it
+        joined was abandoned because the leader's deadline passed, the waiter
+        takes over rather than failing with someone else's timeout.
+        """
+        while True:
+            call, leader = self._begin(key)
+            if leader:
+                self._run(key, call, fn)
+            else:
+                with stage("wait"):
+                    timeout = None if deadline is None else deadline.remaining_seconds()
+                    finished = call.done.wait(timeout)
+                if not finished:
+                    raise DeadlineExceeded(f"wait for {key}")
+
+            if call.error is not None:
+                if not leader and isinstance(call.error, DeadlineExceeded):
+                    continue
+                raise call.error
+            return cast(T, call.value)
+
+    def refresh(self, key: str, fn: Callable[[], Any]) -> bool:
+        """Run ``fn`` in a background thread unless ``key`` is already in flight."""
+        call, leader = self._begin(key)
+        if not leader:
+            return False
+
+        def target() -> None:
+            self._run(key, call, fn)
+            if call.error is not None:
+                logging.getLogger(__name__).warning(
+                    "Background refresh of %s failed: %s", key, call.error
+                )
+
+        threading.Thread(target=target, name=f"refresh:{key}", daemon=True).start()
+        return True
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
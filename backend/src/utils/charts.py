@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import base64
 import io
+import threading
 from dataclasses import dataclass
-from typing import List
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 from src.models.analytics import FoodieArea, RestaurantTypeSummary, TopRestaurant
+from src.utils.timing import stage
 
 
 @dataclass(frozen=True, slots=True)
@@ -14,14 +16,25 @@ class ChartImage:
     base64_image: str
 
 
-def restaurant_types_pie_chart(
-    restaurant_types: List[RestaurantTypeSummary], *, width: int = 800, height: int = 400
-) -> ChartImage:
-    try:
-        import matplotlib
+# Subplot margins computed by ``tight_layout``, keyed by everything that sizes
+# the tick labels and title: chart, labels, value range and figure size.
+# Re-rendering the same chart (TTL expiry, warm-up, new workers) reuses the
+# margins instead of paying for another layout pass. Request threads render
+# concurrently, so the dict is only touched under the lock.
+_LAYOUT_TEMPLATES: Dict[Tuple[Any, ...], Dict[str, float]] = {}
+_LAYOUT_TEMPLATES_MAX = 256
+_LAYOUT_LOCK = threading.Lock()
+
 
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
+def layout_templates() -> Dict[Tuple[Any, ...], Dict[str, float]]:
+    with _LAYOUT_LOCK:
+        return dict(_LAYOUT_TEMPLATES)
+
+
+def _new_figure(width: int, height: int) -> Tuple[Any, Any]:
+    try:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
     except Exception as exc:  # pragma: no cover
         raise RuntimeError(
             "Chart generation requires matplotlib. Install it in your environment to use charts."
@@ -30,104 +43,119 @@ def restaurant_types_pie_chart(
     fig_w = max(3.0, width / 100.0)
     fig_h = max(2.0, height / 100.0)
 
-    fig, ax = plt.subplots(figsize=(fig_w, fig_h), dpi=100)
+    fig = Figure(figsize=(fig_w, fig_h), dpi=100)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    return fig, ax
 
-    title = "Restaurant Types"
-    ax.set_title(title)
 
-    if not restaurant_types:
-        ax.text(0.5, 0.5, "No data", ha="center", va="center")
-        ax.set_axis_off()
-    else:
-        labels = [r.restaurant_type for r in restaurant_types]
-        sizes = [r.count for r in restaurant_types]
-        ax.pie(sizes, labels=labels, autopct="%1.1f%%", startangle=90)
-        ax.axis("equal")
+def _apply_layout(fig: Any, template_key: Tuple[Any, ...]) -> None:
+    with _LAYOUT_LOCK:
+        params = _LAYOUT_TEMPLATES.get(template_key)
+    if params is not None:
+        fig.subplots_adjust(**params)
+        return
 
-    buf = io.BytesIO()
+    # The layout pass runs outside the lock; two threads racing on a new key
+    # both compute it and store the same margins.
     fig.tight_layout()
-    fig.savefig(buf, format="png")
-    plt.close(fig)
+    sp = fig.subplotpars
+    params = {"left": sp.left, "right": sp.right, "bottom": sp.bottom, "top": sp.top}
+    with _LAYOUT_LOCK:
+        if len(_LAYOUT_TEMPLATES) >= _LAYOUT_TEMPLATES_MAX:
+            _LAYOUT_TEMPLATES.clear()
+        _LAYOUT_TEMPLATES[template_key] = params
 
-    b64 = base64.b64encode(buf.getvalue()).decode("ascii")
-    return ChartImage(title=title, base64_image=b64)
 
-
-def foodie_areas_bar_chart(
-    foodie_areas: List[FoodieArea], *, width: int = 800, height: int = 400
+def _encode_png(fig: Any) -> str:
+    buf = io.BytesIO()
+    with stage("render"):
+        fig.savefig(buf, format="png")
+    with stage("encode"):
+        return base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def _render(
+    title: str,
+    labels: Sequence[str],
+    draw: Callable[[Any], None],
+    *,
+    layout_key: Tuple[Any, ...],
+    width: int,
+    height: int,
 ) -> ChartImage:
-    try:
-        import matplotlib
+    with stage("render"):
+        fig, ax = _new_figure(width, height)
+        ax.set_title(title)
 
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except Exception as exc:  # pragma: no cover
-        raise RuntimeError(
-            "Chart generation requires matplotlib. Install it in your environment to use charts."
-        ) from exc
+        if not labels:
+            ax.text(0.5, 0.5, "No data", ha="center", va="center")
+            ax.set_axis_off()
+        else:
+            draw(ax)
 
-    fig_w = max(3.0, width / 100.0)
-    fig_h = max(2.0, height / 100.0)
+        _apply_layout(fig, (*layout_key, width, height))
+    return ChartImage(title=title, base64_image=_encode_png(fig))
 
-    fig, ax = plt.subplots(figsize=(fig_w, fig_h), dpi=100)
 
-    title = "Foodie Areas"
-    ax.set_title(title)
+def restaurant_types_pie_chart(
+    restaurant_types: List[RestaurantTypeSummary],
+    *,
+    width: int = 800,
+    height: int = 400,
+) -> ChartImage:
+    labels = [r.restaurant_type for r in restaurant_types]
+    sizes = [r.count for r in restaurant_types]
 
-    if not foodie_areas:
-        ax.text(0.5, 0.5, "No data", ha="center", va="center")
-        ax.set_axis_off()
-    else:
-        areas = [f"{a.area}" for a in foodie_areas]
-        counts = [a.restaurant_count for a in foodie_areas]
+    def draw(ax: Any) -> None:
+        ax.pie(sizes, labels=labels, autopct="%1.1f%%", startangle=90)
+        ax.axis("equal")
 
+    # Pie label placement depends on the slice sizes, so both go into the key.
+    layout_key = ("restaurant-types-pie", tuple(labels), tuple(sizes))
+    return _render(
+        "Restaurant Types",
+        labels,
+        draw,
+        layout_key=layout_key,
+        width=width,
+        height=height,
+    )
+
+
+def foodie_areas_bar_chart(
+    foodie_areas: List[FoodieArea], *, width: int = 800, height: int = 400
+) -> ChartImage:
+    areas = [f"{a.area}" for a in foodie_areas]
+    counts = [a.restaurant_count for a in foodie_areas]
+
+    def draw(ax: Any) -> None:
         ax.barh(areas[::-1], counts[::-1])
         ax.set_xlabel("Restaurants")
 
-    buf = io.BytesIO()
-    fig.tight_layout()
-    fig.savefig(buf, format="png")
-    plt.close(fig)
-
-    b64 = base64.b64encode(buf.getvalue()).decode("ascii")
-    return ChartImage(title=title, base64_image=b64)
+    # The value axis ticks (and so the bottom margin) follow the largest bar.
+    layout_key = ("foodie-areas-bar", tuple(areas), max(counts, default=0))
+    return _render(
+        "Foodie Areas", areas, draw, layout_key=layout_key, width=width, height=height
+    )
 
 
 def top_restaurants_bar_chart(
     top_restaurants: List[TopRestaurant], *, width: int = 800, height: int = 400
 ) -> ChartImage:
-    try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except Exception as exc:  # pragma: no cover
-        raise RuntimeError(
-            "Chart generation requires matplotlib. Install it in your environment to use charts."
-        ) from exc
-
-    fig_w = max(3.0, width / 100.0)
-    fig_h = max(2.0, height / 100.0)
-
-    fig, ax = plt.subplots(figsize=(fig_w, fig_h), dpi=100)
-
-    title = "Top Restaurants"
-    ax.set_title(title)
-
-    if not top_restaurants:
-        ax.text(0.5, 0.5, "No data", ha="center", va="center")
-        ax.set_axis_off()
-    else:
-        names = [f"#{r.rank} {r.name}" for r in top_restaurants]
-        votes = [r.votes for r in top_restaurants]
+    names = [f"#{r.rank} {r.name}" for r in top_restaurants]
+    votes = [r.votes for r in top_restaurants]
 
+    def draw(ax: Any) -> None:
         ax.barh(names[::-1], votes[::-1])
         ax.set_xlabel("Votes")
 
-    buf = io.BytesIO()
-    fig.tight_layout()
-    fig.savefig(buf, format="png")
-    plt.close(fig)
-
-    b64 = base64.b64encode(buf.getvalue()).decode("ascii")
-    return ChartImage(title=title, base64_image=b64)
+    layout_key = ("top-restaurants-bar", tuple(names), max(votes, default=0))
+    return _render(
+        "Top Restaurants",
+        names,
+        draw,
+        layout_key=layout_key,
+        width=width,
+        height=height,
+    )
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+from typing import Any, Dict, Optional
+
+
+class JsonEvent:
+    """A structured log message that is serialised only when it is formatted.
+
+    Passing one to ``logger.info`` keeps ``json.dumps`` off the calling thread
+    when the record is handed to a :class:`DeferredQueueHandler`.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self.payload = payload
+
+    def __str__(self) -> str:
+        return json.dumps(self.payload)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records without formatting them first.
+
+    The stock ``QueueHandler.prepare`` formats every record on the logging
+    thread so it can be pickled; records here never leave the process, so
+    formatting is left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """A ``QueueListener`` whose ``stop`` may be called more than once."""
+
+    _stopped = False
+
+    def stop(self) -> None:
+        if not self._stopped:
+            self._stopped = True
+            super().stop()
+
+
+def start_async_logging(
+    root: logging.Logger, handler: logging.Handler
+) -> logging.handlers.QueueListener:
+    """Route ``root`` through a queue drained by ``handler`` on a background thread."""
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = _QueueListener(log_queue, handler, respect_handler_level=True)
+    root.addHandler(DeferredQueueHandler(log_queue))
+    listener.start()
+    # Flush whatever is still queued when the process exits.
+    atexit.register(listener.stop)
+    return listener
+
+
+def sampled(rate: float, rng: Optional[random.Random] = None) -> bool:
+    """Return True for roughly ``rate`` of calls (1 = always, 0 = never)."""
+    if rate >= 1:
+        return True
+    if rate <= 0:
+        return False
+    return (rng or random).random() < rate
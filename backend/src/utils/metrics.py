@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import itertools
+import math
+import threading
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_SHARD_COUNT = 16
+
+# Thread idents are aligned addresses, so ``get_ident() % n`` puts every
+# thread on one shard; each thread instead takes the next shard on first use.
+_NEXT_SHARD = itertools.count()
+_THREAD_SHARD = threading.local()
+
+
+def _shard_index() -> int:
+    index = getattr(_THREAD_SHARD, "index", None)
+    if index is None:
+        index = _THREAD_SHARD.index = next(_NEXT_SHARD) % _SHARD_COUNT
+    return index
+
+
+class _ShardedValues:
+    """Per-key floats spread over independently locked shards.
+
+    Writers only lock the shard assigned to their thread, so concurrent
+    request threads rarely contend; readers sum the shards at scrape time.
+    """
+
+    def __init__(self) -> None:
+        self._locks = [threading.Lock() for _ in range(_SHARD_COUNT)]
+        self._shards: List[Dict[Tuple[LabelValues, int], float]] = [
+            {} for _ in range(_SHARD_COUNT)
+        ]
+
+    def add(self, labels: LabelValues, slot: int, amount: float) -> None:
+        index = _shard_index()
+        key = (labels, slot)
+        with self._locks[index]:
+            shard = self._shards[index]
+            shard[key] = shard.get(key, 0.0) + amount
+
+    def totals(self) -> Dict[Tuple[LabelValues, int], float]:
+        merged: Dict[Tuple[LabelValues, int], float] = {}
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                items = list(shard.items())
+            for key, value in items:
+                merged[key] = merged.get(key, 0.0) + value
+        return merged
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def format_metric(
+    name: str,
+    kind: str,
+    help_text: str,
+    samples: Iterable[Tuple[Dict[str, str], float]],
+) -> List[str]:
+    """Render one metric family in the Prometheus text exposition format."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        rendered = _format_labels(list(labels), list(labels.values()))
+        lines.append(f"{name}{rendered} {_format_number(value)}")
+    return lines
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(
+        self, name: str, help_text: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = _ShardedValues()
+
+    def _labels(self, labels: Sequence[str]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(v) for v in labels)
+
+    def render(self) -> List[str]:
+        totals = self._values.totals()
+        samples = [
+            (dict(zip(self.labelnames, labels)), value)
+            for (labels, _), value in sorted(totals.items())
+        ]
+        return format_metric(self.name, self.kind, self.help_text, samples)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values.add(self._labels(labels), 0, amount)
+
+
+class Gauge(_Metric):
+    """A gauge summed from sharded increments; tracking it takes no global lock."""
+
+    kind = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values.add(self._labels(labels), 0, amount)
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self._values.add(self._labels(labels), 0, -amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._labels(labels)
+        slot = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                slot = i
+                break
+        self._values.add(key, slot, 1.0)
+        # Slots past the buckets hold the running sum.
+        self._values.add(key, len(self.buckets) + 1, value)
+
+    def render(self) -> List[str]:
+        totals = self._values.totals()
+        series: Dict[LabelValues, Dict[int, float]] = {}
+        for (labels, slot), value in totals.items():
+            series.setdefault(labels, {})[slot] = value
+
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels in sorted(series):
+            slots = series[labels]
+            names = list(self.labelnames)
+            cumulative = 0.0
+            for i, bound in enumerate(self.buckets):
+                cumulative += slots.get(i, 0.0)
+                le = _format_labels(
+                    names + ["le"], list(labels) + [_format_number(bound)]
+                )
+                lines.append(f"{self.name}_bucket{le} {_format_number(cumulative)}")
+            cumulative += slots.get(len(self.buckets), 0.0)
+            le = _format_labels(names + ["le"], list(labels) + ["+Inf"])
+            lines.append(f"{self.name}_bucket{le} {_format_number(cumulative)}")
+            plain = _format_labels(names, labels)
+            total = slots.get(len(self.buckets) + 1, 0.0)
+            lines.append(f"{self.name}_sum{plain} {_format_number(total)}")
+            lines.append(f"{self.name}_count{plain} {_format_number(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(
+                        f"Metric {metric.name} already registered as {existing.kind}"
+                    )
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(
+        self, name: str, help_text: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+CACHE_EVENTS = REGISTRY.counter(
+    "restaurant_eda_cache_events_total",
+    "Cache lookups by cache and outcome (hit, miss, stale, eviction).",
+    ("cache", "event"),
+)
+REQUEST_LATENCY = REGISTRY.histogram(
+    "restaurant_eda_request_duration_seconds",
+    "Request latency by route, method and status code.",
+    ("route", "method", "status"),
+)
+REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "restaurant_eda_requests_in_flight",
+    "Requests currently being handled, by route.",
+    ("route",),
+)
+CHART_RENDER_SECONDS = REGISTRY.histogram(
+    "restaurant_eda_chart_render_seconds",
+    "matplotlib render time per chart type.",
+    ("chart_type",),
+)
+DATASET_LOAD_SECONDS = REGISTRY.histogram(
+    "restaurant_eda_dataset_load_seconds",
+    "Time spent loading the dataset at startup.",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
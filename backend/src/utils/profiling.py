@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import cProfile
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROFILE_MODES = ("cprofile", "sample")
+
+_SAFE_PROFILE_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+def is_safe_profile_id(profile_id: str) -> bool:
+    return bool(_SAFE_PROFILE_ID.match(profile_id))
+
+
+def parse_profile_mode(raw: Optional[str]) -> Optional[str]:
+    """Map the ``X-Profile`` header / ``profile`` query value to a mode."""
+    if raw is None:
+        return None
+    value = raw.strip().lower()
+    if value in {"", "0", "false", "no", "off"}:
+        return None
+    if value in {"1", "true", "yes", "on"}:
+        return "cprofile"
+    if value not in PROFILE_MODES:
+        raise ValueError(
+            f"Invalid profile mode: must be one of: {', '.join(PROFILE_MODES)}"
+        )
+    return value
+
+
+def _frame_label(frame) -> str:  # type: ignore[no-untyped-def]
+    code = frame.f_code
+    return f"{Path(code.co_filename).name}:{code.co_name}"
+
+
+class StackSampler:
+    """Sample one thread's stack on a timer and count collapsed stacks.
+
+    The output is the ``root;caller;callee count`` format that flamegraph.pl
+    and speedscope read.
+    """
+
+    def __init__(self, thread_id: int, *, interval_seconds: float = 0.005) -> None:
+        self.thread_id = thread_id
+        self.interval_seconds = interval_seconds
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            frame = sys._current_frames().get(self.thread_id)
+            labels: List[str] = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def collapsed(self) -> str:
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+
+class RequestProfile:
+    """A profiler attached to the current thread for the span of one request."""
+
+    def __init__(self, mode: str, *, sample_interval_seconds: float = 0.005) -> None:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.mode = mode
+        self._profiler: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+        if mode == "cprofile":
+            self._profiler = cProfile.Profile()
+        else:
+            self._sampler = StackSampler(
+                threading.get_ident(), interval_seconds=sample_interval_seconds
+            )
+        self._running = False
+
+    def start(self) -> None:
+        if self._profiler is not None:
+            self._profiler.enable()
+        elif self._sampler is not None:
+            self._sampler.start()
+        self._running = True
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        if self._profiler is not None:
+            self._profiler.disable()
+        elif self._sampler is not None:
+            self._sampler.stop()
+
+    def save(self, directory: Path, profile_id: str) -> Path:
+        """Write the profile to ``<profile_id>.pstats`` or ``.collapsed``."""
+        if not is_safe_profile_id(profile_id):
+            raise ValueError(f"Invalid profile id: {profile_id!r}")
+        self.stop()
+        directory.mkdir(parents=True, exist_ok=True)
+        if self._profiler is not None:
+            path = directory / f"{profile_id}.pstats"
+            self._profiler.dump_stats(str(path))
+        else:
+            assert self._sampler is not None
+            path = directory / f"{profile_id}.collapsed"
+            path.write_text(self._sampler.collapsed(), encoding="utf-8")
+        return path
+
+
+def find_profile(directory: Path, profile_id: str) -> Optional[Path]:
+    if not is_safe_profile_id(profile_id):
+        return None
+    for suffix in (".pstats", ".collapsed"):
+        path = directory / f"{profile_id}{suffix}"
+        if path.is_file():
+            return path
+    return None
+
+
+def prune_profiles(directory: Path, *, keep: int) -> None:
+    """Delete all but the ``keep`` most recent profiles in ``directory``."""
+    paths: Dict[Path, float] = {}
+    for path in directory.glob("*"):
+        if path.suffix in {".pstats", ".collapsed"}:
+            try:
+                paths[path] = path.stat().st_mtime
+            except OSError:
+                continue
+    for path in sorted(paths, key=paths.__getitem__, reverse=True)[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import Dict, Iterator, Optional
+
+
+class StageTimings:
+    """Accumulated wall time per named stage for one request."""
+
+    def __init__(self) -> None:
+        self._seconds: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self._seconds[name] = self._seconds.get(name, 0.0) + seconds
+
+    def as_ms(self) -> Dict[str, float]:
+        return {
+            name: round(seconds * 1000, 3) for name, seconds in self._seconds.items()
+        }
+
+    def server_timing(self, total_seconds: Optional[float] = None) -> str:
+        """Format the stages as a ``Server-Timing`` header value."""
+        entries = [f"{name};dur={ms}" for name, ms in self.as_ms().items()]
+        if total_seconds is not None:
+            entries.append(f"total;dur={round(total_seconds * 1000, 3)}")
+        return ", ".join(entries)
+
+
+_CURRENT: ContextVar[Optional[StageTimings]] = ContextVar("stage_timings", default=None)
+
+
+def begin_request_timings() -> Token[Optional[StageTimings]]:
+    return _CURRENT.set(StageTimings())
+
+
+def end_request_timings(token: Token[Optional[StageTimings]]) -> None:
+    _CURRENT.reset(token)
+
+
+def current_timings() -> Optional[StageTimings]:
+    return _CURRENT.get()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Add the time spent in the block to ``name`` on the current request.
+
+    Outside a request (background refreshes, warm-up, benchmarks) this only
+    costs a context variable lookup.
+    """
+    timings = _CURRENT.get()
+    if timings is None:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, perf_counter() - start)
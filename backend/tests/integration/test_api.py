@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 
 def test_health_endpoint(client):
     resp = client.get("/api/health")
@@ -27,3 +29,139 @@ def test_restaurant_types_success(app, client, sample_restaurants_df):
     assert body["success"] is True
     assert body["data"]["total_types"] == 2
     assert len(body["data"]["restaurant_types"]) == 2
+
+
+def test_request_deadline_exceeded_returns_504(app, client, sample_restaurants_df):
+    from src.services import analytics
+
+    analytics._ANALYTICS_CACHE.clear()
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    app.config["REQUEST_DEADLINE_MS"] = 0
+
+    resp = client.get("/api/foodie-areas")
+    assert resp.status_code == 504
+    body = resp.get_json()
+    assert body["success"] is False
+    assert "deadline" in body["error"]
+
+
+def test_request_deadline_header_validation(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+
+    resp = client.get(
+        "/api/restaurant-types", headers={"X-Request-Deadline-Ms": "soon"}
+    )
+    assert resp.status_code == 400
+
+    resp = client.get("/api/restaurant-types?deadline_ms=5000")
+    assert resp.status_code == 200
+
+
+def test_metrics_endpoint_reports_requests_and_cache_events(
+    app, client, sample_restaurants_df
+):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    client.get("/api/top-restaurants")
+    client.get("/api/charts/foodie-areas-bar/data")
+    client.get("/api/charts/foodie-areas-bar/data")
+
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.content_type.startswith("text/plain")
+    text = resp.get_data(as_text=True)
+    assert (
+        'restaurant_eda_request_duration_seconds_count{route="/api/top-restaurants",method="GET",status="200"}'
+        in text
+    )
+    assert 'restaurant_eda_cache_events_total{cache="api",event="hit"}' in text
+    assert 'restaurant_eda_cache_events_total{cache="analytics",event="miss"}' in text
+    assert 'restaurant_eda_requests_in_flight{route="/metrics"} 1' in text
+    assert (
+        'restaurant_eda_admission_admitted_total{endpoint="api.get_top_restaurants"}'
+        in text
+    )
+
+
+def test_health_reports_memory_breakdown(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    client.get("/api/restaurant-types")
+    client.get("/api/charts/foodie-areas-bar/data")
+
+    body = client.get("/api/health").get_json()
+    assert body["data"]["memory_usage_mb"] > 0
+    assert body["data"]["peak_memory_usage_mb"] >= body["data"]["memory_usage_mb"]
+
+    app.extensions["memory_sampler"].sample()
+    memory = client.get("/api/health").get_json()["data"]["memory"]
+    assert memory["dataset_columns"]["rating"] > 0
+    assert memory["caches"]["api.chart-data"]["entries"] == 1
+    assert memory["caches"]["analytics.restaurant-types"]["bytes"] > 0
+    assert "pinned_charts" in memory["precomputed"]
+
+
+def test_health_reports_load_time_structures(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    client.get("/api/top-restaurants?unit=restaurants")
+    client.get("/api/top-restaurants?sort_by=weighted_rating")
+
+    app.extensions["memory_sampler"].sample()
+    precomputed = client.get("/api/health").get_json()["data"]["memory"]["precomputed"]
+    assert precomputed["restaurant_tables"] > 0
+    assert precomputed["filter_indexes"] > 0
+    assert precomputed["rollup_cubes"] > 0
+    assert precomputed["weighted_ratings"] > 0
+    assert {"similarity_indexes", "search_indexes", "chain_indexes"} <= set(precomputed)
+
+
+def test_profiling_is_opt_in_and_keyed_by_request_id(
+    app, client, sample_restaurants_df, tmp_path
+):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+
+    resp = client.get(
+        "/api/foodie-areas", headers={"X-Profile": "1", "X-Request-ID": "prof-1"}
+    )
+    assert "X-Profile-Id" not in resp.headers  # profiling disabled by default
+
+    app.config.update(PROFILING_ENABLED=True, PROFILE_DIR=tmp_path)
+    resp = client.get(
+        "/api/foodie-areas?profile=cprofile", headers={"X-Request-ID": "prof-2"}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["X-Profile-Id"] == "prof-2"
+    assert (tmp_path / "prof-2.pstats").is_file()
+
+    resp = client.get("/api/profiles/prof-2")
+    assert resp.status_code == 200
+    assert resp.headers["Content-Disposition"].endswith("prof-2.pstats")
+
+    assert client.get("/api/profiles/missing").status_code == 404
+    assert client.get("/api/foodie-areas?profile=perf").status_code == 400
+
+
+def test_request_start_logging_can_be_skipped(app, client, caplog):
+    app.config["LOG_REQUEST_START_SAMPLE_RATE"] = 0
+    with caplog.at_level("INFO"):
+        client.get("/api/health")
+
+    events = [
+        json.loads(r.getMessage())["event"]
+        for r in caplog.records
+        if r.name == "src.app"
+    ]
+    assert events == ["request.end"]
+
+
+def test_api_cache_is_bounded(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    app.config["API_CACHE"] = {}
+    app.config["CACHE_MAX_ENTRIES"] = 2
+
+    for width in (400, 500, 600):
+        assert (
+            client.get(
+                f"/api/charts/foodie-areas-bar?width={width}&height=300"
+            ).status_code
+            == 200
+        )
+    assert [key.split(":")[2] for key in app.config["API_CACHE"]] == ["500", "600"]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from src.api.admission import AdmissionController, AdmissionPolicy
+
+
+def _saturate(app, endpoint):
+    policy = AdmissionPolicy(
+        max_in_flight=1, max_latency_ms=1000, retry_after_seconds=3
+    )
+    controller = AdmissionController({endpoint: policy})
+    assert controller.try_acquire(endpoint)
+    app.config["ADMISSION"] = controller
+    return controller
+
+
+def test_over_budget_request_is_rejected_with_retry_after(
+    app, client, sample_restaurants_df
+):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    controller = _saturate(app, "api.get_top_restaurants")
+
+    resp = client.get("/api/top-restaurants")
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "3"
+    assert resp.get_json()["success"] is False
+    assert controller.snapshot()["api.get_top_restaurants"]["rejected"] == 1
+
+
+def test_over_budget_chart_is_served_stale(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    assert client.get("/api/charts/foodie-areas-bar/data").status_code == 200
+    for item in app.config["API_CACHE"].values():
+        item["ts"] = 0  # long expired
+
+    controller = _saturate(app, "api.get_chart_data")
+    resp = client.get("/api/charts/foodie-areas-bar/data")
+    assert resp.status_code == 200
+    assert resp.get_json()["data"]["labels"] == ["BTM", "HSR"]
+    assert controller.snapshot()["api.get_chart_data"]["served_stale"] == 1
+
+    resp = client.get("/api/charts/top-restaurants-bar/data")
+    assert resp.status_code == 503
+
+
+def test_admission_stats_endpoint(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    client.get("/api/restaurant-types")
+
+    resp = client.get("/api/admission")
+    assert resp.status_code == 200
+    stats = resp.get_json()["data"]["endpoints"]["api.get_restaurant_types"]
+    assert stats["admitted"] == 1
+    assert stats["in_flight"] == 0
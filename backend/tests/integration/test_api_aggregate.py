@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+
+def test_aggregate_requires_loaded_data(app, client):
+    app.config["RESTAURANTS_DF"] = None
+    resp = client.get("/api/aggregate?group_by=location")
+    assert resp.status_code == 500
+
+
+def test_aggregate_success(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+
+    resp = client.get(
+        "/api/aggregate?group_by=location&metrics=count,avg_rating,sum_votes"
+    )
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["success"] is True
+    assert body["data"]["total_groups"] == 2
+    assert body["data"]["rows"][0] == {
+        "location": "BTM",
+        "count": 2,
+        "avg_rating": 3.5,
+        "sum_votes": 15,
+    }
+    assert body["data"]["rows"][1]["avg_rating"] is None
+
+
+def test_aggregate_invalid_group_by(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    resp = client.get("/api/aggregate?group_by=votes")
+    assert resp.status_code == 400
+    assert resp.get_json()["error"].startswith("Invalid parameter")
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+
+def test_dashboard_returns_all_sections(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+
+    resp = client.get("/api/dashboard")
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["success"] is True
+
+    results = body["data"]["results"]
+    assert set(results) == {
+        "restaurant-types",
+        "top-restaurants",
+        "foodie-areas",
+        "restaurant-types-pie",
+        "top-restaurants-bar",
+        "foodie-areas-bar",
+    }
+    assert all(item["success"] for item in results.values())
+    assert results["restaurant-types"]["data"]["total_types"] == 2
+    assert results["foodie-areas-bar"]["data"]["labels"] == ["BTM", "HSR"]
+    assert body["data"]["dataset_version"]
+
+
+def test_batch_reports_per_query_errors(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+
+    resp = client.post(
+        "/api/batch",
+        json={
+            "queries": [
+                {
+                    "id": "top",
+                    "endpoint": "top-restaurants",
+                    "params": {"limit": 2, "sort_by": "rating"},
+                },
+                {
+                    "id": "bad-limit",
+                    "endpoint": "foodie-areas",
+                    "params": {"limit": "100"},
+                },
+                {
+                    "id": "bad-chart",
+                    "endpoint": "chart-data",
+                    "params": {"chart_type": "nope"},
+                },
+            ]
+        },
+    )
+    assert resp.status_code == 200
+    results = resp.get_json()["data"]["results"]
+    assert results["top"]["success"] is True
+    assert len(results["top"]["data"]["top_restaurants"]) == 2
+    assert results["bad-limit"]["status_code"] == 400
+    assert results["bad-chart"]["status_code"] == 404
+
+
+def test_batch_rejects_invalid_body(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+
+    resp = client.post(
+        "/api/batch", json={"queries": [{"id": "x", "endpoint": "unknown"}]}
+    )
+    assert resp.status_code == 400
+    assert resp.get_json()["success"] is False
+
+    resp = client.post(
+        "/api/batch",
+        json={
+            "queries": [
+                {"id": "x", "endpoint": "restaurant-types"},
+                {"id": "x", "endpoint": "foodie-areas"},
+            ]
+        },
+    )
+    assert resp.status_code == 400
+
+
+def test_dashboard_requires_loaded_data(app, client):
+    app.config["RESTAURANTS_DF"] = None
+    resp = client.get("/api/dashboard")
+    assert resp.status_code == 500
+
+
+def test_batch_passes_filters_through(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    resp = client.post(
+        "/api/batch",
+        json={
+            "queries": [
+                {"id": "all", "endpoint": "top-restaurants"},
+                {
+                    "id": "hsr",
+                    "endpoint": "top-restaurants",
+                    "params": {"location": "HSR"},
+                },
+                {
+                    "id": "bad",
+                    "endpoint": "foodie-areas",
+                    "params": {"min_rating": "x"},
+                },
+            ]
+        },
+    )
+    results = resp.get_json()["data"]["results"]
+    assert len(results["all"]["data"]["top_restaurants"]) == 3
+    assert [r["name"] for r in results["hsr"]["data"]["top_restaurants"]] == ["C"]
+    assert results["bad"]["success"] is False
+
+
+def test_batch_publishes_a_content_fingerprint(app, client, sample_restaurants_df):
+    def version(df):
+        app.config["RESTAURANTS_DF"] = df
+        return client.get("/api/dashboard").get_json()["data"]["dataset_version"]
+
+    first = version(sample_restaurants_df)
+    assert str(id(sample_restaurants_df)) not in first
+    assert version(sample_restaurants_df.copy()) == first
+
+    changed = sample_restaurants_df.copy()
+    changed.loc[0, "votes"] = 11
+    assert version(changed) != first
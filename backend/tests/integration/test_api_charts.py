@@ -26,3 +26,103 @@ def test_charts_size_validation(app, client, sample_restaurants_df):
 
     resp = client.get("/api/charts/restaurant-types-pie?width=1&height=1")
     assert resp.status_code == 400
+
+
+def test_charts_served_from_pinned_warmup(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    app.config["PINNED_CHARTS"].warm(
+        sample_restaurants_df, [("foodie-areas-bar", 900, 420)]
+    )
+    app.config["API_CACHE"] = {}
+
+    resp = client.get("/api/charts/foodie-areas-bar?width=900&height=420")
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["data"]["chart_type"] == "foodie-areas-bar"
+    assert body["data"]["base64_image"]
+    assert "chart:foodie-areas-bar:900:420" not in app.config["API_CACHE"]
+
+
+def test_chart_data_returns_series_and_layout(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+
+    resp = client.get("/api/charts/restaurant-types-pie/data")
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["success"] is True
+    assert body["data"]["labels"] == ["Quick Bites", "Cafe"]
+    assert body["data"]["values"] == [2.0, 1.0]
+    assert body["data"]["layout"]["kind"] == "pie"
+
+
+def test_chart_data_bar_series(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+
+    resp = client.get("/api/charts/foodie-areas-bar/data")
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["data"]["labels"] == ["BTM", "HSR"]
+    assert body["data"]["values"] == [2.0, 1.0]
+    assert body["data"]["layout"]["kind"] == "barh"
+    assert body["data"]["layout"]["value_label"] == "Restaurants"
+
+
+def test_chart_data_invalid_type(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+
+    resp = client.get("/api/charts/invalid/data")
+    assert resp.status_code == 404
+    assert resp.get_json()["success"] is False
+
+
+def test_chart_data_concurrent_misses_compute_once(
+    app, sample_restaurants_df, monkeypatch
+):
+    import threading
+    import time
+
+    from src.api import routes
+
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    calls = []
+    original = routes.chart_series_payload
+
+    def slow_series(df, chart_type, **kwargs):
+        calls.append(chart_type)
+        time.sleep(0.2)
+        return original(df, chart_type, **kwargs)
+
+    monkeypatch.setattr(routes, "chart_series_payload", slow_series)
+
+    statuses = []
+
+    def fetch():
+        statuses.append(
+            app.test_client().get("/api/charts/top-restaurants-bar/data").status_code
+        )
+
+    threads = [threading.Thread(target=fetch) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+
+    assert statuses == [200] * 5
+    assert calls == ["top-restaurants-bar"]
+
+
+def test_chart_response_has_server_timing_stages(client, app, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+
+    resp = client.get("/api/charts/foodie-areas-bar?width=640&height=360")
+    assert resp.status_code == 200
+    stages = {
+        entry.split(";")[0] for entry in resp.headers["Server-Timing"].split(", ")
+    }
+    assert {"cache", "render", "encode", "validate", "serialize", "total"} <= stages
+
+    resp = client.get("/api/charts/foodie-areas-bar?width=640&height=360")
+    stages = {
+        entry.split(";")[0] for entry in resp.headers["Server-Timing"].split(", ")
+    }
+    assert "render" not in stages  # served from the API cache
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+
+def test_cuisines_endpoint(app, client, sample_restaurants_df):
+    df = sample_restaurants_df.copy()
+    df["cuisines"] = ["North Indian, Chinese", "Chinese", "Cafe"]
+    app.config["RESTAURANTS_DF"] = df
+
+    resp = client.get("/api/cuisines")
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["data"]["total_cuisines"] == 3
+    first = body["data"]["cuisines"][0]
+    assert first == {
+        "cuisine": "Chinese",
+        "restaurant_count": 2,
+        "avg_rating": 3.5,
+        "avg_cost_for_two": 350,
+        "top_areas": ["BTM"],
+    }
+
+
+def test_cuisine_cooccurrence_endpoint(app, client, sample_restaurants_df):
+    df = sample_restaurants_df.copy()
+    df["cuisines"] = ["North Indian, Chinese", "Chinese", "Cafe"]
+    app.config["RESTAURANTS_DF"] = df
+
+    resp = client.get("/api/cuisines/co-occurrence?cuisine=chinese")
+    assert resp.status_code == 200
+    data = resp.get_json()["data"]
+    assert data["pairs"] == [
+        {"cuisine_a": "North Indian", "cuisine_b": "Chinese", "count": 1}
+    ]
+
+    assert client.get("/api/cuisines/co-occurrence?limit=0").status_code == 400
@@ -33,3 +33,17 @@ def test_foodie_areas_limit_validation(app, client, sample_restaurants_df):
 
     resp = client.get("/api/foodie-areas?limit=999")
     assert resp.status_code == 400
+
+
+def test_foodie_areas_filtered_by_cuisine(app, client, sample_restaurants_df):
+    df = sample_restaurants_df.copy()
+    df["cuisines"] = ["A, B", "A", "B"]
+    app.config["RESTAURANTS_DF"] = df
+
+    resp = client.get("/api/foodie-areas?cuisine=b")
+    assert resp.status_code == 200
+    areas = {
+        a["area"]: a["restaurant_count"]
+        for a in resp.get_json()["data"]["foodie_areas"]
+    }
+    assert areas == {"BTM": 1, "HSR": 1}
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+
+def _with_cuisines(df):
+    df = df.copy()
+    df["cuisines"] = ["North Indian, Chinese", "Chinese", "Cafe"]
+    return df
+
+
+def test_similar_restaurants(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = _with_cuisines(sample_restaurants_df)
+
+    top = client.get("/api/top-restaurants").get_json()["data"]["top_restaurants"]
+    restaurant_id = top[0]["restaurant_id"]
+    assert top[0]["name"] == "A"
+
+    resp = client.get(f"/api/restaurants/{restaurant_id}/similar?limit=2")
+    assert resp.status_code == 200
+    data = resp.get_json()["data"]
+    assert data["restaurant"]["name"] == "A"
+    assert [r["name"] for r in data["similar"]] == ["B", "C"]
+    assert data["similar"][0]["similarity"] > data["similar"][1]["similarity"]
+
+
+def test_similar_restaurants_unknown_id(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = _with_cuisines(sample_restaurants_df)
+    resp = client.get("/api/restaurants/0000000000000000/similar")
+    assert resp.status_code == 404
+    assert resp.get_json()["success"] is False
+
+
+def test_restaurant_detail(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = _with_cuisines(sample_restaurants_df)
+    top = client.get("/api/top-restaurants").get_json()["data"]["top_restaurants"]
+
+    resp = client.get(f"/api/restaurants/{top[0]['restaurant_id']}")
+    assert resp.status_code == 200
+    data = resp.get_json()["data"]
+    assert (data["name"], data["location"], data["votes"]) == ("A", "BTM", 10)
+
+    missing = client.get("/api/restaurants/0000000000000000")
+    assert missing.status_code == 404
+    assert missing.get_json()["error"] == "Restaurant '0000000000000000' not found"
+
+
+def test_restaurant_lookup(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = _with_cuisines(sample_restaurants_df)
+    top = client.get("/api/top-restaurants").get_json()["data"]["top_restaurants"]
+
+    resp = client.post(
+        "/api/restaurants/lookup",
+        json={
+            "ids": [top[1]["restaurant_id"], "0000000000000000"],
+            "keys": [
+                {"name": "C", "location": "HSR"},
+                {"name": "C", "location": "BTM"},
+            ],
+        },
+    )
+    assert resp.status_code == 200
+    data = resp.get_json()["data"]
+    assert data["found"] == 2
+    assert [r and r["name"] for r in data["restaurants"]] == ["B", None, "C", None]
+
+    assert client.post("/api/restaurants/lookup", json={}).status_code == 400
+    assert (
+        client.post("/api/restaurants/lookup", json={"ids": ["x"] * 501}).status_code
+        == 400
+    )
+    assert (
+        client.post(
+            "/api/restaurants/lookup", json={"keys": [{"name": "C"}]}
+        ).status_code
+        == 400
+    )
+
+
+def test_search_restaurants(app, client, sample_restaurants_df):
+    df = _with_cuisines(sample_restaurants_df)
+    df["name"] = ["Truffles", "Truffle Hut", "Cafe Truffles"]
+    app.config["RESTAURANTS_DF"] = df
+
+    resp = client.get("/api/restaurants/search?q=truff")
+    assert resp.status_code == 200
+    data = resp.get_json()["data"]
+    assert data["query"] == "truff"
+    # Prefix matches by votes, then the substring match.
+    assert [r["name"] for r in data["restaurants"]] == [
+        "Truffles",
+        "Truffle Hut",
+        "Cafe Truffles",
+    ]
+
+    typo = client.get("/api/restaurants/search?q=trufles&limit=1").get_json()["data"][
+        "restaurants"
+    ]
+    assert [r["name"] for r in typo] == ["Truffles"]
+
+    located = client.get("/api/restaurants/search?q=truff&location=hsr").get_json()[
+        "data"
+    ]["restaurants"]
+    assert [r["name"] for r in located] == ["Cafe Truffles"]
+
+
+def test_search_restaurants_validation(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = _with_cuisines(sample_restaurants_df)
+    assert client.get("/api/restaurants/search").status_code == 400
+    assert client.get("/api/restaurants/search?q=a&limit=51").status_code == 400
+    assert client.get("/api/restaurants/search?q=" + "a" * 101).status_code == 400
+
+
+def test_chains(app, client, sample_restaurants_df):
+    df = _with_cuisines(sample_restaurants_df)
+    df["name"] = ["Cafe Coffee Day", "Cafe Cofee Day", "Truffles"]
+    df["location"] = ["BTM", "HSR", "HSR"]
+    app.config["RESTAURANTS_DF"] = df
+
+    resp = client.get("/api/chains")
+    assert resp.status_code == 200
+    data = resp.get_json()["data"]
+    assert data["total_chains"] == 1
+    chain = data["chains"][0]
+    assert (
+        chain["name"],
+        chain["outlets"],
+        chain["area_count"],
+        chain["avg_rating"],
+    ) == (
+        "Cafe Coffee Day",
+        2,
+        2,
+        3.5,
+    )
+    assert chain["name_variants"] == ["Cafe Coffee Day", "Cafe Cofee Day"]
+
+    assert client.get("/api/chains?min_outlets=3").get_json()["data"]["chains"] == []
+    assert client.get("/api/chains?min_outlets=1").status_code == 400
+    assert client.get("/api/chains?limit=201").status_code == 400
@@ -46,3 +46,87 @@ def test_top_restaurants_rating_sort(client, app, sample_restaurants_df):
     body = resp.get_json()
     assert body["success"] is True
     assert len(body["data"]["top_restaurants"]) == 2
+
+
+def test_top_restaurants_filters(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+
+    resp = client.get("/api/top-restaurants?location=btm&min_rating=3.5")
+    assert resp.status_code == 200
+    assert [r["name"] for r in resp.get_json()["data"]["top_restaurants"]] == ["A"]
+
+    resp = client.get("/api/restaurant-types?max_cost=350")
+    assert resp.status_code == 200
+    types = resp.get_json()["data"]["restaurant_types"]
+    assert [(t["restaurant_type"], t["count"]) for t in types] == [("Quick Bites", 1)]
+
+
+def test_top_restaurants_rejects_inverted_range(app, client, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    resp = client.get("/api/top-restaurants?min_cost=500&max_cost=100")
+    assert resp.status_code == 400
+    assert "min_cost" in resp.get_json()["error"]
+
+
+def test_unit_switch(app, client, sample_restaurants_df):
+    df = sample_restaurants_df.copy()
+    df.loc[len(df)] = {**df.iloc[0].to_dict(), "restaurant_type": "Cafe"}
+    app.config["RESTAURANTS_DF"] = df
+
+    listings = client.get("/api/restaurant-types").get_json()["data"][
+        "restaurant_types"
+    ]
+    restaurants = client.get("/api/restaurant-types?unit=restaurants").get_json()[
+        "data"
+    ]["restaurant_types"]
+    assert sum(t["count"] for t in listings) == 4
+    assert sum(t["count"] for t in restaurants) == 3
+
+    top = client.get("/api/top-restaurants?unit=restaurants").get_json()["data"]
+    assert top["total_restaurants"] == 3
+
+    rows = client.get("/api/aggregate?group_by=location&unit=restaurants").get_json()[
+        "data"
+    ]["rows"]
+    assert rows[0] == {"location": "BTM", "count": 2}
+
+    batch = client.post(
+        "/api/batch",
+        json={
+            "queries": [
+                {
+                    "id": "areas",
+                    "endpoint": "foodie-areas",
+                    "params": {"unit": "restaurants"},
+                }
+            ]
+        },
+    ).get_json()["data"]["results"]
+    assert batch["areas"]["data"]["foodie_areas"][0]["restaurant_count"] == 2
+
+    assert client.get("/api/foodie-areas?unit=rows").status_code == 400
+
+
+def test_top_restaurants_weighted_rating_sort(app, client, sample_restaurants_df):
+    df = sample_restaurants_df.copy()
+    df.loc[0, "votes"] = 1000
+    df.loc[len(df)] = {**df.iloc[0].to_dict(), "name": "D", "rating": 4.9, "votes": 1}
+    app.config["RESTAURANTS_DF"] = df
+
+    by_rating = client.get("/api/top-restaurants?sort_by=rating").get_json()["data"][
+        "top_restaurants"
+    ]
+    weighted = client.get("/api/top-restaurants?sort_by=weighted_rating").get_json()[
+        "data"
+    ]["top_restaurants"]
+    assert [r["name"] for r in by_rating] == ["D", "A", "B", "C"]
+    assert [r["name"] for r in weighted] == ["A", "D", "B", "C"]
+
+    filtered = client.get(
+        "/api/top-restaurants?sort_by=weighted_rating&location=BTM&unit=restaurants"
+    )
+    assert [r["name"] for r in filtered.get_json()["data"]["top_restaurants"]] == [
+        "A",
+        "D",
+        "B",
+    ]
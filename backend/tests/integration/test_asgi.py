@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.asgi import AsgiAdapter, classify_path, create, parse_concurrency_limits
+
+
+def _request(adapter, path, *, query=b"", method="GET", body=b""):
+    sent = []
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query,
+        "headers": [(b"content-type", b"application/json")],
+        "server": ("testserver", 80),
+    }
+    asyncio.run(adapter(scope, receive, send))
+    start, body_msg = sent
+    return start["status"], dict(start["headers"]), json.loads(body_msg["body"])
+
+
+def test_classify_path():
+    assert classify_path("/api/health") == "light"
+    assert classify_path("/") == "light"
+    assert classify_path("/api/top-restaurants") == "analytics"
+    assert classify_path("/api/charts/restaurant-types-pie/data") == "analytics"
+    assert classify_path("/api/charts/restaurant-types-pie") == "charts"
+
+
+def test_importing_asgi_does_not_build_the_app():
+    code = "import sys, src.asgi; sys.exit('src.app' in sys.modules)"
+    backend = Path(__file__).resolve().parents[2]
+    assert subprocess.run([sys.executable, "-c", code], cwd=backend).returncode == 0
+
+
+def test_asgi_factory_wraps_the_flask_app():
+    adapter = create()
+    try:
+        assert isinstance(adapter, AsgiAdapter)
+        assert adapter.wsgi_app.config["CONCURRENCY_LIMITS"] == adapter.limits
+    finally:
+        adapter.shutdown()
+
+
+def test_parse_concurrency_limits():
+    limits = parse_concurrency_limits("charts=1, analytics=8")
+    assert limits == {"light": 16, "analytics": 8, "charts": 1}
+    with pytest.raises(ValueError):
+        parse_concurrency_limits("charts=0")
+    with pytest.raises(ValueError):
+        parse_concurrency_limits("gpu=2")
+
+
+def test_asgi_adapter_serves_flask_routes(app, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    adapter = AsgiAdapter(app)
+    try:
+        status, headers, body = _request(adapter, "/api/health")
+        assert status == 200
+        assert body["data"]["status"] == "healthy"
+        assert b"x-request-id" in headers
+
+        status, _, body = _request(adapter, "/api/foodie-areas", query=b"limit=1")
+        assert status == 200
+        assert len(body["data"]["foodie_areas"]) == 1
+
+        status, _, body = _request(
+            adapter,
+            "/api/batch",
+            method="POST",
+            body=json.dumps(
+                {"queries": [{"id": "t", "endpoint": "restaurant-types"}]}
+            ).encode(),
+        )
+        assert status == 200
+        assert body["data"]["results"]["t"]["success"] is True
+    finally:
+        adapter.shutdown()
+
+
+def test_asgi_adapter_runs_charts_on_their_executor(app, sample_restaurants_df):
+    app.config["RESTAURANTS_DF"] = sample_restaurants_df
+    threads = []
+
+    @app.after_request
+    def _record_thread(response):
+        threads.append(threading.current_thread().name)
+        return response
+
+    adapter = AsgiAdapter(app, limits={"light": 2, "analytics": 2, "charts": 1})
+    try:
+        status, _, _ = _request(adapter, "/api/charts/foodie-areas-bar")
+        assert status == 200
+        _request(adapter, "/api/health")
+    finally:
+        adapter.shutdown()
+
+    assert threads[0].startswith("asgi-charts")
+    assert threads[1].startswith("asgi-light")
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.api.admission import (
+    AdmissionController,
+    AdmissionPolicy,
+    parse_admission_policies,
+)
+
+
+def test_admission_controller_limits_in_flight():
+    policy = AdmissionPolicy(max_in_flight=2, max_latency_ms=100)
+    controller = AdmissionController({"api.x": policy})
+
+    assert controller.try_acquire("api.x") is True
+    assert controller.try_acquire("api.x") is True
+    assert controller.try_acquire("api.x") is False
+
+    controller.release("api.x", 10)
+    assert controller.try_acquire("api.x") is True
+    assert controller.try_acquire("api.unlisted") is True
+
+
+def test_admission_controller_sheds_on_latency_only_when_busy():
+    policy = AdmissionPolicy(max_in_flight=10, max_latency_ms=100)
+    controller = AdmissionController({"api.x": policy})
+    assert controller.try_acquire("api.x") is True
+    controller.release("api.x", 500)
+
+    assert controller.try_acquire("api.x") is True  # idle endpoints always admit
+    assert controller.try_acquire("api.x") is False
+
+    stats = controller.snapshot()["api.x"]
+    assert stats["in_flight"] == 1
+    assert stats["admitted"] == 2
+    assert stats["latency_ms"] == 500
+
+
+def test_try_acquire_admits_at_most_max_in_flight_from_a_burst():
+    controller = AdmissionController(
+        {"api.x": AdmissionPolicy(max_in_flight=4, max_latency_ms=100)}
+    )
+    start = threading.Barrier(32)
+    admitted = []
+
+    def request():
+        start.wait()
+        admitted.append(controller.try_acquire("api.x"))
+
+    threads = [threading.Thread(target=request) for _ in range(32)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert admitted.count(True) == 4
+    assert controller.snapshot()["api.x"]["in_flight"] == 4
+    assert controller.try_acquire("api.unlisted") is True
+
+
+def test_parse_admission_policies():
+    policies = parse_admission_policies("api.get_chart=1:250:5")
+    assert policies["api.get_chart"] == AdmissionPolicy(
+        max_in_flight=1, max_latency_ms=250, retry_after_seconds=5
+    )
+    assert "api.get_top_restaurants" in policies
+
+    with pytest.raises(ValueError):
+        parse_admission_policies("api.get_chart=0:100")
+    with pytest.raises(ValueError):
+        parse_admission_policies("api.get_chart=4")
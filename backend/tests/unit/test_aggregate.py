@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from src.services.aggregate import compute_aggregate, parse_aggregate_plan
+
+
+@pytest.fixture()
+def frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "name": ["A", "B", "C", "D", "E"],
+            "location": ["BTM", "BTM", "HSR", "HSR", "BTM"],
+            "restaurant_type": ["Cafe", "Quick Bites", "Cafe", "Cafe", "Cafe"],
+            "cuisines": ["Cafe, Desserts", "North Indian", "Cafe", "", "Desserts"],
+            "rating": [4.0, 3.0, None, 5.0, 3.5],
+            "votes": [10, 5, 1, 20, 4],
+            "approx_cost_for_two": [400, 300, None, 800, 250],
+        }
+    )
+
+
+def test_group_by_matches_pandas_groupby(frame):
+    plan = parse_aggregate_plan(
+        {
+            "group_by": "location,restaurant_type",
+            "metrics": "count,avg_rating,avg_cost_for_two,sum_votes",
+        }
+    )
+    result = compute_aggregate(frame, plan)
+
+    expected = (
+        frame.groupby(["location", "restaurant_type"])
+        .agg(
+            count=("name", "size"),
+            avg_rating=("rating", "mean"),
+            sum_votes=("votes", "sum"),
+        )
+        .reset_index()
+    )
+    by_key = {(r["location"], r["restaurant_type"]): r for r in result.rows}
+    assert result.total_groups == len(expected)
+    for row in expected.itertuples(index=False):
+        got = by_key[(row.location, row.restaurant_type)]
+        assert got["count"] == row.count
+        assert got["sum_votes"] == row.sum_votes
+        assert got["avg_rating"] == pytest.approx(row.avg_rating)
+    assert [r["count"] for r in result.rows] == sorted(
+        (r["count"] for r in result.rows), reverse=True
+    )
+
+
+def test_group_by_cuisine_with_order_and_limit(frame):
+    plan = parse_aggregate_plan(
+        {
+            "group_by": "cuisine",
+            "metrics": "count,sum_votes",
+            "order_by": "cuisine",
+            "limit": "2",
+        }
+    )
+    result = compute_aggregate(frame, plan)
+    assert result.total_groups == 3
+    assert result.rows == [
+        {"cuisine": "Cafe", "count": 2, "sum_votes": 11},
+        {"cuisine": "Desserts", "count": 2, "sum_votes": 14},
+    ]
+
+
+def test_range_filters_aggregate_matching_rows_only(frame):
+    plan = parse_aggregate_plan(
+        {"group_by": "location", "metrics": "count,avg_rating", "min_rating": "3.5"}
+    )
+    rows = {r["location"]: r for r in compute_aggregate(frame, plan).rows}
+    assert rows["BTM"]["count"] == 2
+    assert rows["BTM"]["avg_rating"] == pytest.approx(3.75)
+    assert rows["HSR"]["count"] == 1
+
+
+def test_plans_are_reused():
+    params = {"group_by": "location", "metrics": "count"}
+    assert parse_aggregate_plan(params) is parse_aggregate_plan(dict(params))
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"group_by": "name"},
+        {"group_by": "location,location"},
+        {"group_by": "location", "metrics": "median_rating"},
+        {"group_by": "location", "order_by": "avg_rating"},
+        {"group_by": "location", "limit": "0"},
+    ],
+)
+def test_invalid_plans(params):
+    with pytest.raises(ValueError, match="Invalid parameter"):
+        parse_aggregate_plan(params)
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from src.services.analytics import compute_restaurant_type_summary
+import pandas as pd
+
+from src.services.analytics import (
+    compute_restaurant_type_summary,
+    get_foodie_areas_cached,
+    get_restaurant_type_summary_cached,
+    get_top_restaurants_cached,
+)
+from src.services.indexes import RowFilter
 
 
 def test_compute_restaurant_type_summary(sample_restaurants_df):
@@ -15,3 +23,63 @@ def test_compute_restaurant_type_summary(sample_restaurants_df):
     assert round(qb.percentage, 2) == round((2 / 3) * 100, 2)
     assert qb.avg_rating == 3.5
     assert qb.avg_cost_for_two == 350
+
+
+def _listed_twice(df):
+    # "A" also appears as a second listing with a higher rating.
+    return pd.concat([df, df.iloc[[0]].assign(rating=4.2, votes=12)], ignore_index=True)
+
+
+def test_restaurant_unit_counts_each_restaurant_once(sample_restaurants_df):
+    df = _listed_twice(sample_restaurants_df)
+
+    listings = get_restaurant_type_summary_cached(df)
+    restaurants = get_restaurant_type_summary_cached(df, unit="restaurants")
+    assert [(t.restaurant_type, t.count) for t in listings.restaurant_types] == [
+        ("Quick Bites", 3),
+        ("Cafe", 1),
+    ]
+    assert [(t.restaurant_type, t.count) for t in restaurants.restaurant_types] == [
+        ("Quick Bites", 2),
+        ("Cafe", 1),
+    ]
+    assert restaurants.restaurant_types[0].avg_rating == 3.6
+
+    # Cube and row-filter paths both see merged restaurants.
+    by_location = get_restaurant_type_summary_cached(
+        df, filters=RowFilter(location="btm"), unit="restaurants"
+    )
+    assert by_location.restaurant_types[0].count == 2
+    rated = get_restaurant_type_summary_cached(
+        df, filters=RowFilter(min_rating=4.1), unit="restaurants"
+    )
+    assert [(t.restaurant_type, t.count) for t in rated.restaurant_types] == [
+        ("Quick Bites", 1)
+    ]
+
+    areas = get_foodie_areas_cached(df, unit="restaurants")
+    assert [(a.area, a.restaurant_count) for a in areas.foodie_areas] == [
+        ("BTM", 2),
+        ("HSR", 1),
+    ]
+
+
+def test_top_restaurants_units(sample_restaurants_df):
+    df = _listed_twice(sample_restaurants_df)
+
+    listings = get_top_restaurants_cached(df)
+    restaurants = get_top_restaurants_cached(df, unit="restaurants")
+    assert listings.top_restaurants == restaurants.top_restaurants
+    assert (listings.total_restaurants, restaurants.total_restaurants) == (4, 3)
+    assert [(r.name, r.votes, r.rating) for r in restaurants.top_restaurants] == [
+        ("A", 12, 4.2),
+        ("B", 5, 3.0),
+        ("C", 1, None),
+    ]
+
+    # Listing filters merge only the matching listings.
+    filtered = get_top_restaurants_cached(df, filters=RowFilter(max_rating=4.0))
+    assert [(r.name, r.votes) for r in filtered.top_restaurants] == [
+        ("A", 10),
+        ("B", 5),
+    ]
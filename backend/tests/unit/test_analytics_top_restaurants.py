@@ -98,3 +98,45 @@ def test_compute_top_restaurants_deduplicates_by_name_location_type():
     result = compute_top_restaurants(df, limit=10, sort_by="votes")
     assert len(result.top_restaurants) == 2
     assert result.top_restaurants[0].name in {"Toit", "Truffles"}
+
+
+def test_compute_top_restaurants_merges_listings_and_breaks_ties_by_name():
+    df = pd.DataFrame(
+        [
+            {
+                "name": "B",
+                "location": "HSR",
+                "restaurant_type": "Cafe",
+                "rating": 4.0,
+                "votes": 50,
+            },
+            {
+                "name": "A",
+                "location": "BTM",
+                "restaurant_type": "Bar",
+                "rating": None,
+                "votes": 50,
+            },
+            {
+                "name": "A",
+                "location": "BTM",
+                "restaurant_type": "Pub",
+                "rating": 4.0,
+                "votes": 20,
+            },
+            {
+                "name": "C",
+                "location": "BTM",
+                "restaurant_type": "Pub",
+                "rating": 4.9,
+                "votes": 3,
+            },
+        ]
+    )
+
+    result = compute_top_restaurants(df, limit=2, sort_by="votes")
+    assert [(r.name, r.rating, r.restaurant_type) for r in result.top_restaurants] == [
+        ("A", 4.0, "Bar"),
+        ("B", 4.0, "Cafe"),
+    ]
+    assert result.total_restaurants == 4
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services import chains as chains_module
+from src.services.chains import (
+    ChainIndex,
+    connected_labels,
+    find_chains,
+    get_chain_index,
+)
+from src.services.restaurants import RestaurantTable
+from src.services.search import SearchIndex
+
+_WORDS = [
+    "Cafe",
+    "Coffee",
+    "Day",
+    "Pizza",
+    "Hut",
+    "Biryani",
+    "House",
+    "Empire",
+    "Truffles",
+    "Dosa",
+]
+
+
+def _frame(names, locations, votes=None) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "name": names,
+            "location": locations,
+            "restaurant_type": "Quick Bites",
+            "cuisines": "",
+            "rating": 4.0,
+            "votes": votes if votes is not None else 10,
+            "approx_cost_for_two": 300,
+        }
+    )
+
+
+def _trigrams(text: str) -> set:
+    data = f" {text} ".encode("utf-8")
+    return {data[i : i + 3] for i in range(len(data) - 2)}
+
+
+def test_spelling_variants_form_one_chain():
+    df = _frame(
+        ["Domino's Pizza", "Dominos Pizza", "Mc Donald's", "McDonald's"]
+        + ["Pizza Hut", "Pizza Hub", "Cafe", "Cafe Cafe"],
+        ["BTM", "HSR", "BTM", "HSR", "BTM", "HSR", "BTM", "HSR"],
+        votes=[100, 50, 200, 150, 30, 10, 5, 5],
+    )
+    chains, total = ChainIndex(SearchIndex(RestaurantTable(df))).chains(limit=10)
+
+    assert total == 2
+    assert [(c.name, c.outlets, c.area_count, c.total_votes) for c in chains] == [
+        ("Mc Donald's", 2, 2, 350),
+        ("Domino's Pizza", 2, 2, 150),
+    ]
+    assert chains[1].name_variants == ["Domino's Pizza", "Dominos Pizza"]
+    assert chains[1].top_areas == ["BTM", "HSR"]
+
+
+def test_blocking_finds_every_match_brute_force_finds(monkeypatch):
+    rng = np.random.default_rng(5)
+    names = []
+    for _ in range(300):
+        name = " ".join(rng.choice(_WORDS, size=rng.integers(2, 4)))
+        if rng.random() < 0.6:
+            at = int(rng.integers(0, len(name)))
+            name = name[:at] + name[at + 1 :]
+        names.append(name)
+    monkeypatch.setattr(chains_module, "_MAX_BLOCK", 10**6)
+    search = SearchIndex(
+        RestaurantTable(_frame(names, rng.choice(["BTM", "HSR"], len(names))))
+    )
+    index = ChainIndex(search)
+
+    left, right = [], []
+    for a, b in combinations(range(len(search.names)), 2):
+        x, y = search.names[a], search.names[b]
+        shared = len(_trigrams(x) & _trigrams(y))
+        jaccard = shared / len(_trigrams(x) | _trigrams(y))
+        similar = jaccard >= 0.8 - 1e-9 and SequenceMatcher(None, x, y).ratio() >= 0.8
+        if similar or (x.replace(" ", "") == y.replace(" ", "") and x.strip()):
+            left.append(a)
+            right.append(b)
+    expected = connected_labels(
+        len(search.names),
+        np.array(left, dtype=np.int64),
+        np.array(right, dtype=np.int64),
+    )
+    assert np.array_equal(index.restaurant_brand, expected[search.restaurant_name])
+
+
+def test_connected_labels():
+    labels = connected_labels(6, np.array([4, 1, 3]), np.array([5, 4, 0]))
+    assert labels.tolist() == [0, 1, 2, 0, 1, 1]
+
+
+@pytest.mark.parametrize("min_outlets, expected", [(2, 1), (3, 0)])
+def test_find_chains_is_cached_per_version(min_outlets, expected):
+    df = _frame(["Truffles", "Truffles", "Dosa"], ["BTM", "HSR", "BTM"])
+    assert get_chain_index(df) is get_chain_index(df)
+    result = find_chains(df, limit=5, min_outlets=min_outlets)
+    assert result.total_chains == expected
+    assert len(result.chains) == expected
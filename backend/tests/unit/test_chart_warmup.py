@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+from src.services.charts import (
+    DEFAULT_CHART_WARMUP,
+    PinnedChartStore,
+    parse_chart_warmup,
+)
+from src.services.dataset import dataset_version
+
+
+def test_parse_chart_warmup_default_and_disabled():
+    assert parse_chart_warmup(None) == DEFAULT_CHART_WARMUP == []
+    assert parse_chart_warmup("") == []
+
+
+def test_parse_chart_warmup_entries():
+    specs = parse_chart_warmup("restaurant-types-pie:900x420, foodie-areas-bar:640x320")
+    assert specs == [("restaurant-types-pie", 900, 420), ("foodie-areas-bar", 640, 320)]
+
+
+def test_parse_chart_warmup_rejects_invalid_entries():
+    with pytest.raises(ValueError):
+        parse_chart_warmup("unknown-chart:900x420")
+    with pytest.raises(ValueError):
+        parse_chart_warmup("restaurant-types-pie:big")
+    with pytest.raises(ValueError):
+        parse_chart_warmup("restaurant-types-pie:1600x420")  # the route caps at 1200
+
+
+def test_pinned_chart_store_is_scoped_to_dataset_version(sample_restaurants_df):
+    store = PinnedChartStore()
+    rendered = store.warm(sample_restaurants_df, [("restaurant-types-pie", 900, 420)])
+    assert rendered == 1
+
+    version = dataset_version(sample_restaurants_df)
+    pinned = store.get(version, "restaurant-types-pie", 900, 420)
+    assert pinned is not None
+    assert pinned["base64_image"]
+    assert store.get(version, "restaurant-types-pie", 800, 400) is None
+
+    other = sample_restaurants_df.copy()
+    store.warm(other, [])
+    assert store.get(version, "restaurant-types-pie", 900, 420) is None
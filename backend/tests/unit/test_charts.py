@@ -3,7 +3,12 @@ from __future__ import annotations
 import base64
 
 from src.models.analytics import FoodieArea, RestaurantTypeSummary, TopRestaurant
-from src.utils.charts import foodie_areas_bar_chart, restaurant_types_pie_chart, top_restaurants_bar_chart
+from src.utils.charts import (
+    foodie_areas_bar_chart,
+    layout_templates,
+    restaurant_types_pie_chart,
+    top_restaurants_bar_chart,
+)
 
 
 def _is_valid_png_base64(value: str) -> bool:
@@ -111,3 +116,45 @@ def test_top_restaurants_bar_chart_with_data():
 
     assert chart.title
     assert _is_valid_png_base64(chart.base64_image)
+
+
+def test_chart_layout_template_is_reused():
+    from src.utils import charts
+
+    areas = [
+        FoodieArea(
+            area="Koramangala 5th Block",
+            restaurant_count=3,
+            avg_rating=4.0,
+            top_cuisines=[],
+            restaurant_types=[],
+        )
+    ]
+
+    first = foodie_areas_bar_chart(areas, width=640, height=320)
+    key = ("foodie-areas-bar", ("Koramangala 5th Block",), 3, 640, 320)
+    assert key in charts._LAYOUT_TEMPLATES
+
+    second = foodie_areas_bar_chart(areas, width=640, height=320)
+    assert _is_valid_png_base64(second.base64_image)
+    assert second.base64_image == first.base64_image
+
+
+def test_bar_chart_layouts_are_keyed_by_value_range():
+    def areas(count):
+        return [
+            FoodieArea(
+                area="BTM",
+                restaurant_count=count,
+                avg_rating=None,
+                top_cuisines=[],
+                restaurant_types=[],
+            )
+        ]
+
+    foodie_areas_bar_chart(areas(3), width=640, height=320)
+    foodie_areas_bar_chart(areas(3_000_000), width=640, height=320)
+
+    templates = layout_templates()
+    assert ("foodie-areas-bar", ("BTM",), 3, 640, 320) in templates
+    assert ("foodie-areas-bar", ("BTM",), 3_000_000, 640, 320) in templates
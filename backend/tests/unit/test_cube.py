@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.analytics import (
+    compute_foodie_areas,
+    compute_foodie_areas_from_cube,
+    compute_restaurant_type_summary,
+    compute_restaurant_type_summary_from_cube,
+)
+from src.services.cube import RollupCube, cube_filter
+from src.services.indexes import DatasetIndex, RowFilter
+
+
+@pytest.fixture()
+def frame() -> pd.DataFrame:
+    # Few distinct values, so counts tie often and tie-breaking is exercised.
+    rng = np.random.default_rng(11)
+    rows = 1_500
+    cuisines = [
+        "North Indian",
+        "Chinese",
+        "Cafe",
+        "Biryani",
+        "South Indian",
+        "Desserts",
+    ]
+    return pd.DataFrame(
+        {
+            "name": [f"R{i}" for i in range(rows)],
+            "location": rng.choice(
+                ["BTM", "HSR", "Indiranagar", "Koramangala", "Jayanagar"], rows
+            ),
+            "restaurant_type": rng.choice(
+                ["Quick Bites", "Casual Dining", "Cafe", "Bakery"], rows
+            ),
+            "cuisines": [
+                ", ".join(rng.choice(cuisines, size=rng.integers(0, 4)))
+                for _ in range(rows)
+            ],
+            "rating": np.where(
+                rng.random(rows) < 0.2, np.nan, rng.uniform(1.0, 5.0, rows).round(1)
+            ),
+            "votes": rng.integers(0, 500, rows),
+            "approx_cost_for_two": np.where(
+                rng.random(rows) < 0.1, np.nan, rng.integers(1, 20, rows) * 100
+            ),
+        }
+    )
+
+
+def _type_rows(result):
+    return [
+        (t.restaurant_type, t.count, t.avg_cost_for_two)
+        for t in result.restaurant_types
+    ]
+
+
+WHERES = [
+    {},
+    {"location": "hsr"},
+    {"cuisine": "Chinese"},
+    {"location": "BTM", "restaurant_type": "Cafe"},
+]
+
+
+@pytest.mark.parametrize("where", WHERES)
+def test_restaurant_type_summary_parity(frame, where):
+    subset = DatasetIndex(frame).apply(frame, RowFilter(**where))
+    expected = compute_restaurant_type_summary(subset)
+    actual = compute_restaurant_type_summary_from_cube(RollupCube(frame), where=where)
+
+    assert _type_rows(actual) == _type_rows(expected)
+    for got, want in zip(actual.restaurant_types, expected.restaurant_types):
+        assert got.percentage == pytest.approx(want.percentage)
+        assert got.avg_rating == pytest.approx(want.avg_rating)
+
+
+@pytest.mark.parametrize("where", WHERES)
+def test_foodie_areas_parity(frame, where):
+    subset = DatasetIndex(frame).apply(frame, RowFilter(**where))
+    expected = compute_foodie_areas(subset, limit=3)
+    actual = compute_foodie_areas_from_cube(RollupCube(frame), limit=3, where=where)
+
+    assert actual.total_areas == expected.total_areas
+    assert len(actual.foodie_areas) == len(expected.foodie_areas)
+    for got, want in zip(actual.foodie_areas, expected.foodie_areas):
+        assert (got.area, got.restaurant_count) == (want.area, want.restaurant_count)
+        assert got.avg_rating == pytest.approx(want.avg_rating)
+        assert got.top_cuisines == want.top_cuisines
+        assert got.restaurant_types == want.restaurant_types
+
+
+def test_rollup_sums_cells_without_double_counting(frame):
+    cube = RollupCube(frame)
+
+    totals = cube.rollup()
+    assert int(totals["count"].iloc[0]) == len(frame)
+    assert int(totals["votes_sum"].iloc[0]) == int(frame["votes"].sum())
+    assert int(totals["rating_count"].iloc[0]) == int(frame["rating"].notna().sum())
+
+    by_cuisine = cube.rollup(("cuisine",)).set_index("cuisine")
+    serves_cafe = frame["cuisines"].str.split(", ").map(lambda parts: "Cafe" in parts)
+    assert by_cuisine.loc["Cafe", "count"] == serves_cafe.sum()
+    assert by_cuisine.loc["Cafe", "cost_sum"] == pytest.approx(
+        frame.loc[serves_cafe, "approx_cost_for_two"].sum()
+    )
+
+
+def test_rollup_rejects_unknown_dimension(frame):
+    with pytest.raises(ValueError):
+        RollupCube(frame).rollup(("name",))
+
+
+def test_cube_filter_needs_rows_for_ranges():
+    assert cube_filter(None) == {}
+    assert cube_filter(RowFilter(location="BTM")) == {"location": "BTM"}
+    assert cube_filter(RowFilter(location="BTM", min_rating=4.0)) is None
+
+
+@pytest.mark.parametrize(
+    "row_filter",
+    [
+        RowFilter(min_rating=3.5),
+        RowFilter(max_cost=600, location="btm"),
+        RowFilter(min_rating=4.0, max_rating=4.5, min_cost=300, cuisine="cafe"),
+        RowFilter(min_rating=9.0),
+    ],
+)
+def test_restricted_cube_matches_a_rebuilt_one(frame, row_filter):
+    positions = DatasetIndex(frame).select(row_filter)
+    restricted = RollupCube(frame).restrict(positions)
+    rebuilt = RollupCube(frame.take(positions))
+
+    for group_by in ([], ["location"], ["restaurant_type", "cuisine"]):
+        ours = (
+            restricted.rollup(group_by)
+            .sort_values("first_seen", kind="stable")
+            .drop(columns="first_seen")
+        )
+        theirs = (
+            rebuilt.rollup(group_by)
+            .sort_values("first_seen", kind="stable")
+            .drop(columns="first_seen")
+        )
+        pd.testing.assert_frame_equal(
+            ours.reset_index(drop=True), theirs.reset_index(drop=True)
+        )
+
+    # Pairs are oriented by first appearance in the whole frame, as with
+    # categorical filters.
+    def pairs(cube):
+        return {
+            (frozenset((r.cuisine_a, r.cuisine_b)), r.count)
+            for r in cube.cooccurrence().itertuples()
+        }
+
+    assert pairs(restricted) == pairs(rebuilt)
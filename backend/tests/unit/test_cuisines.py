@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.analytics import compute_cuisine_cooccurrence, compute_cuisine_summary
+from src.services.cube import RollupCube
+
+
+@pytest.fixture()
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    rows = 800
+    cuisines = [
+        "North Indian",
+        "Chinese",
+        "Cafe",
+        "Biryani",
+        "South Indian",
+        "Desserts",
+        "Pizza",
+    ]
+    return pd.DataFrame(
+        {
+            "name": [f"R{i}" for i in range(rows)],
+            "location": rng.choice(["BTM", "HSR", "Indiranagar", "Koramangala"], rows),
+            "restaurant_type": rng.choice(
+                ["Quick Bites", "Casual Dining", "Cafe"], rows
+            ),
+            "cuisines": [
+                ", ".join(rng.choice(cuisines, size=rng.integers(0, 4), replace=False))
+                for _ in range(rows)
+            ],
+            "rating": np.where(
+                rng.random(rows) < 0.2, np.nan, rng.uniform(1.0, 5.0, rows).round(1)
+            ),
+            "votes": rng.integers(0, 500, rows),
+            "approx_cost_for_two": rng.integers(1, 20, rows) * 100,
+        }
+    )
+
+
+def _incidence(frame: pd.DataFrame):
+    lists = frame["cuisines"].map(
+        lambda s: [p.strip() for p in s.split(",") if p.strip()]
+    )
+    vocabulary = sorted({c for parts in lists for c in parts})
+    matrix = np.zeros((len(frame), len(vocabulary)), dtype=np.int64)
+    for row, parts in enumerate(lists):
+        for part in parts:
+            matrix[row, vocabulary.index(part)] = 1
+    return vocabulary, matrix
+
+
+def test_cuisine_summary_matches_brute_force(frame):
+    vocabulary, matrix = _incidence(frame)
+    result = compute_cuisine_summary(RollupCube(frame), limit=100)
+
+    assert result.total_cuisines == len(vocabulary)
+    for item in result.cuisines:
+        serves = matrix[:, vocabulary.index(item.cuisine)].astype(bool)
+        assert item.restaurant_count == serves.sum()
+        assert item.avg_rating == pytest.approx(frame.loc[serves, "rating"].mean())
+        assert item.avg_cost_for_two == round(
+            frame.loc[serves, "approx_cost_for_two"].mean()
+        )
+        counts = frame.loc[serves, "location"].value_counts()
+        assert [counts[area] for area in item.top_areas] == sorted(
+            counts, reverse=True
+        )[:3]
+    assert [c.restaurant_count for c in result.cuisines] == sorted(
+        (c.restaurant_count for c in result.cuisines), reverse=True
+    )
+
+
+def test_cooccurrence_equals_incidence_product(frame):
+    vocabulary, matrix = _incidence(frame)
+    product = matrix.T @ matrix
+
+    result = compute_cuisine_cooccurrence(RollupCube(frame), limit=1000)
+    expected = {
+        frozenset((vocabulary[i], vocabulary[j])): int(product[i, j])
+        for i in range(len(vocabulary))
+        for j in range(i + 1, len(vocabulary))
+        if product[i, j]
+    }
+    assert {
+        frozenset((p.cuisine_a, p.cuisine_b)): p.count for p in result.pairs
+    } == expected
+    assert result.total_pairs == len(expected)
+
+
+def test_cooccurrence_for_one_cuisine(frame):
+    result = compute_cuisine_cooccurrence(
+        RollupCube(frame), cuisine="cafe", where={"cuisine": "cafe"}
+    )
+    assert result.pairs
+    assert all("Cafe" in (p.cuisine_a, p.cuisine_b) for p in result.pairs)
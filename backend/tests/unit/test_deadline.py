@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.services import analytics
+from src.services.aggregate import parse_aggregate_plan
+from src.services.analytics import (
+    compute_foodie_areas,
+    get_aggregate_cached,
+    get_restaurant_type_summary_cached,
+)
+from src.services.deadline import Deadline, DeadlineExceeded
+from src.services.single_flight import SingleFlight
+
+
+def test_deadline_check():
+    Deadline.after_ms(10_000).check("stage")
+    with pytest.raises(DeadlineExceeded) as info:
+        Deadline.after_ms(0).check("stage")
+    assert info.value.stage == "stage"
+    assert "stage" in str(info.value)
+
+
+def test_compute_abandons_work_past_deadline(sample_restaurants_df):
+    with pytest.raises(DeadlineExceeded):
+        compute_foodie_areas(sample_restaurants_df, deadline=Deadline.after_ms(0))
+
+
+def test_aggregate_abandons_work_past_deadline(sample_restaurants_df):
+    analytics._ANALYTICS_CACHE.clear()
+    plan = parse_aggregate_plan({"group_by": "location"})
+    with pytest.raises(DeadlineExceeded) as info:
+        get_aggregate_cached(sample_restaurants_df, plan, deadline=Deadline.after_ms(0))
+    assert info.value.stage.startswith("aggregate")
+    analytics._ANALYTICS_CACHE.clear()
+
+
+def test_expired_deadline_does_not_poison_cache(sample_restaurants_df):
+    analytics._ANALYTICS_CACHE.clear()
+    with pytest.raises(DeadlineExceeded):
+        get_restaurant_type_summary_cached(
+            sample_restaurants_df, deadline=Deadline.after_ms(0)
+        )
+
+    result = get_restaurant_type_summary_cached(
+        sample_restaurants_df, deadline=Deadline.after_ms(10_000)
+    )
+    assert len(result.restaurant_types) == 2
+    analytics._ANALYTICS_CACHE.clear()
+
+
+def test_single_flight_waiter_honours_its_own_deadline():
+    flight = SingleFlight()
+    release = threading.Event()
+    leader = threading.Thread(
+        target=lambda: flight.do("k", lambda: release.wait(timeout=5))
+    )
+    leader.start()
+    while flight.in_flight() == 0:
+        time.sleep(0.001)
+
+    with pytest.raises(DeadlineExceeded):
+        flight.do("k", lambda: "never", deadline=Deadline.after_ms(20))
+    release.set()
+    leader.join(timeout=5)
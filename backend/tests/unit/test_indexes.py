@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.indexes import (
+    DatasetIndex,
+    RowFilter,
+    get_dataset_index,
+    parse_row_filter,
+)
+
+
+@pytest.fixture()
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    rows = 2_000
+    cuisines = ["North Indian", "Chinese", "Cafe", "Biryani", "South Indian"]
+    return pd.DataFrame(
+        {
+            "name": [f"R{i}" for i in range(rows)],
+            "location": rng.choice(["BTM", "HSR", "Indiranagar", "Koramangala"], rows),
+            "restaurant_type": rng.choice(
+                ["Quick Bites", "Casual Dining", "Cafe"], rows
+            ),
+            "cuisines": [
+                ", ".join(rng.choice(cuisines, size=rng.integers(1, 4), replace=False))
+                for _ in range(rows)
+            ],
+            "rating": np.where(
+                rng.random(rows) < 0.1, np.nan, rng.uniform(1.0, 5.0, rows).round(1)
+            ),
+            "votes": rng.integers(0, 1000, rows),
+            "approx_cost_for_two": np.where(
+                rng.random(rows) < 0.05, np.nan, rng.integers(1, 30, rows) * 100
+            ),
+        }
+    )
+
+
+def _brute_force(df: pd.DataFrame, f: RowFilter) -> np.ndarray:
+    mask = pd.Series(True, index=df.index)
+    if f.location is not None:
+        mask &= df["location"].str.lower() == f.location.lower()
+    if f.restaurant_type is not None:
+        mask &= df["restaurant_type"].str.lower() == f.restaurant_type.lower()
+    if f.cuisine is not None:
+        wanted = f.cuisine.lower()
+        mask &= df["cuisines"].map(
+            lambda s: wanted in {p.strip().lower() for p in s.split(",")}
+        )
+    for column, low, high in (
+        ("rating", f.min_rating, f.max_rating),
+        ("approx_cost_for_two", f.min_cost, f.max_cost),
+    ):
+        if low is not None or high is not None:
+            mask &= df[column].notna()
+        if low is not None:
+            mask &= df[column] >= low
+        if high is not None:
+            mask &= df[column] <= high
+    return np.flatnonzero(mask.to_numpy())
+
+
+@pytest.mark.parametrize(
+    "row_filter",
+    [
+        RowFilter(location="btm"),
+        RowFilter(location="HSR", restaurant_type="Cafe"),
+        RowFilter(cuisine="chinese"),
+        RowFilter(cuisine="Biryani", min_rating=4.0),
+        RowFilter(min_rating=2.5, max_rating=3.5),
+        RowFilter(max_cost=800),
+        RowFilter(
+            location="Koramangala",
+            cuisine="Cafe",
+            min_cost=500,
+            max_cost=1500,
+            min_rating=3.0,
+        ),
+        RowFilter(location="Nowhere"),
+    ],
+)
+def test_select_matches_brute_force(frame, row_filter):
+    index = DatasetIndex(frame)
+    assert np.array_equal(index.select(row_filter), _brute_force(frame, row_filter))
+
+
+def test_apply_without_filter_returns_frame_unchanged(frame):
+    assert DatasetIndex(frame).apply(frame, RowFilter()) is frame
+
+
+def test_get_dataset_index_keeps_only_current_version(frame):
+    first = get_dataset_index(frame)
+    assert get_dataset_index(frame) is first
+    other = frame.head(10)
+    assert get_dataset_index(other) is not first
+
+
+def test_parse_row_filter():
+    parsed = parse_row_filter(
+        {"location": " BTM ", "min_rating": "3.5", "max_cost": "600", "cuisine": ""}
+    )
+    assert parsed == RowFilter(location="BTM", min_rating=3.5, max_cost=600)
+    assert parse_row_filter({}).is_empty()
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"min_rating": "high"},
+        {"max_cost": "1.5"},
+        {"min_rating": "4", "max_rating": "3"},
+    ],
+)
+def test_parse_row_filter_rejects_bad_values(params):
+    with pytest.raises(ValueError, match="Invalid parameter"):
+        parse_row_filter(params)
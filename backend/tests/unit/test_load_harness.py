@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import math
+
+from benchmarks.load_test import MIXES, cache_hit_rates, endpoint_label, percentile
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert math.isnan(percentile([], 50))
+
+
+def test_endpoint_label_drops_query():
+    assert (
+        endpoint_label("/api/charts/foodie-areas-bar?width=900&height=420")
+        == "/api/charts/foodie-areas-bar"
+    )
+    assert all(path.startswith("/api/") for mix in MIXES.values() for _, path in mix)
+
+
+def test_cache_hit_rates_use_deltas():
+    before = {("api", "hit"): 10.0, ("api", "miss"): 5.0}
+    after = {
+        ("api", "hit"): 40.0,
+        ("api", "miss"): 10.0,
+        ("api", "stale"): 5.0,
+        ("analytics", "miss"): 2.0,
+    }
+
+    rates = cache_hit_rates(before, after)
+    assert rates["api"] == {"lookups": 40.0, "hit_rate": 35.0 / 40.0}
+    assert rates["analytics"]["hit_rate"] == 0.0
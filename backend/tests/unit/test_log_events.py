@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import queue
+import random
+
+from src.utils.log_events import (
+    DeferredQueueHandler,
+    JsonEvent,
+    sampled,
+    start_async_logging,
+)
+
+
+def _isolated_logger(name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.handlers.clear()
+    return logger
+
+
+def test_enqueued_records_are_not_formatted_on_the_calling_thread():
+    logger = _isolated_logger("test_log_events.deferred")
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logger.addHandler(DeferredQueueHandler(log_queue))
+
+    logger.info(JsonEvent({"event": "request.end"}))
+    record = log_queue.get_nowait()
+    assert isinstance(record.msg, JsonEvent)
+    assert json.loads(record.getMessage()) == {"event": "request.end"}
+
+
+def test_async_logging_writes_through_the_listener():
+    logger = _isolated_logger("test_log_events.async")
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = start_async_logging(logger, handler)
+
+    logger.info(JsonEvent({"event": "request.end", "status_code": 200}))
+    listener.stop()
+    listener.stop()  # idempotent, so the atexit hook is safe after a manual stop
+    logger.handlers.clear()
+
+    assert json.loads(stream.getvalue()) == {"event": "request.end", "status_code": 200}
+
+
+def test_sampled_rates():
+    rng = random.Random(1)
+    assert sampled(1.0) is True
+    assert sampled(0.0) is False
+    hits = sum(sampled(0.25, rng) for _ in range(4000))
+    assert 800 < hits < 1200
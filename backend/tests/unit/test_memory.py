@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from src.services.memory import (
+    MemoryReport,
+    MemorySampler,
+    cache_namespace_sizes,
+    collect_memory_report,
+    deep_sizeof,
+    process_rss_bytes,
+)
+
+
+def test_deep_sizeof_counts_nested_and_shared_objects_once():
+    payload = "x" * 10_000
+    assert deep_sizeof({"a": payload}) > 10_000
+    assert deep_sizeof([payload, payload]) < 2 * 10_000
+
+
+def test_collect_memory_report_breaks_down_dataset_and_caches(sample_restaurants_df):
+    report = collect_memory_report(
+        sample_restaurants_df,
+        caches={
+            "api": {
+                "chart:a:1:1": {"value": "png"},
+                "chart:b:1:1": {"value": "png"},
+                "other:x": 1,
+            }
+        },
+        precomputed={"pinned_charts": {}},
+    )
+
+    assert set(report.dataset_columns) >= set(sample_restaurants_df.columns)
+    assert report.dataset_bytes == int(
+        sample_restaurants_df.memory_usage(deep=True).sum()
+    )
+    assert report.caches["api.chart"]["entries"] == 2
+    assert report.caches["api.other"]["entries"] == 1
+    assert "pinned_charts" in report.precomputed
+    assert cache_namespace_sizes("api", {}) == {}
+
+
+def test_precomputed_structures_count_shared_parts_once(sample_restaurants_df):
+    buffer = np.zeros(100_000)
+    words = np.array(["y" * 1_000] * 100, dtype=object)
+    report = collect_memory_report(
+        sample_restaurants_df,
+        caches={},
+        precomputed={"tables": {"v1": buffer}, "indexes": {"v1": [buffer[::2], words]}},
+    )
+
+    assert report.precomputed["tables"] >= buffer.nbytes
+    assert report.precomputed["indexes"] < buffer.nbytes
+    assert report.precomputed["indexes"] > 100 * 1_000
+
+
+def test_memory_sampler_refreshes_in_background_when_stale():
+    calls = []
+
+    def collect():
+        calls.append(1)
+        return MemoryReport(time.time(), 0, {}, {}, {})
+
+    sampler = MemorySampler(collect, interval_seconds=3600)
+    assert sampler.latest() is None  # first call only schedules a sample
+    for _ in range(100):
+        if sampler.latest() is not None:
+            break
+        time.sleep(0.01)
+    assert sampler.latest() is not None
+    assert len(calls) == 1
+
+
+def test_process_rss_is_reported():
+    assert process_rss_bytes() > 0
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.utils.metrics import MetricsRegistry
+
+
+def test_counter_sums_across_threads():
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits.", ("cache",))
+
+    def work():
+        for _ in range(1000):
+            counter.inc("api")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert 'hits_total{cache="api"} 8000' in registry.render()
+
+
+def test_threads_write_to_different_shards():
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits.", ("cache",))
+
+    threads = [threading.Thread(target=counter.inc, args=("api",)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: counter.inc("api"), range(16)))
+
+    used = [shard for shard in counter._values._shards if shard]
+    assert len(used) > 1
+    assert 'hits_total{cache="api"} 24' in registry.render()
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        "latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0)
+    )
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(5.0, "/a")
+
+    text = registry.render()
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_sum{route="/a"} 5.55' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+
+
+def test_gauge_and_label_validation():
+    registry = MetricsRegistry()
+    gauge = registry.gauge("in_flight", "In flight.", ("route",))
+    gauge.inc("/a")
+    gauge.inc("/a")
+    gauge.dec("/a")
+    assert 'in_flight{route="/a"} 1' in registry.render()
+
+    with pytest.raises(ValueError):
+        gauge.inc()
+    assert registry.gauge("in_flight", "In flight.", ("route",)) is gauge
+    with pytest.raises(ValueError):
+        registry.counter("in_flight", "Clash.")
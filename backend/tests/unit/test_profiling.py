@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import os
+import pstats
+import time
+
+import pytest
+
+from src.utils.profiling import (
+    RequestProfile,
+    find_profile,
+    parse_profile_mode,
+    prune_profiles,
+)
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+def test_parse_profile_mode():
+    assert parse_profile_mode(None) is None
+    assert parse_profile_mode("0") is None
+    assert parse_profile_mode("1") == "cprofile"
+    assert parse_profile_mode("Sample") == "sample"
+    with pytest.raises(ValueError):
+        parse_profile_mode("perf")
+
+
+def test_cprofile_profile_is_saved_as_pstats(tmp_path):
+    profile = RequestProfile("cprofile")
+    profile.start()
+    _busy(0.01)
+    path = profile.save(tmp_path, "req-1")
+
+    assert path.name == "req-1.pstats"
+    stats = pstats.Stats(str(path))
+    assert any(func[2] == "_busy" for func in stats.stats)  # type: ignore[attr-defined]
+    assert find_profile(tmp_path, "req-1") == path
+    assert find_profile(tmp_path, "../req-1") is None
+
+
+def test_sampling_profile_writes_collapsed_stacks(tmp_path):
+    profile = RequestProfile("sample", sample_interval_seconds=0.001)
+    profile.start()
+    _busy(0.05)
+    path = profile.save(tmp_path, "req-2")
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert any("test_profiling.py:_busy" in line for line in lines)
+
+
+def test_prune_profiles_keeps_newest(tmp_path):
+    for i in range(5):
+        path = tmp_path / f"p{i}.collapsed"
+        path.write_text("a 1\n", encoding="utf-8")
+        mtime = 1_000_000 + i
+        os.utime(path, (mtime, mtime))
+
+    prune_profiles(tmp_path, keep=2)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "p3.collapsed",
+        "p4.collapsed",
+    ]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services import ranking
+from src.services.analytics import compute_top_restaurants, get_top_restaurants_cached
+from src.services.ranking import (
+    RatingPrior,
+    WeightedRatings,
+    get_weighted_ratings,
+    parse_rating_prior,
+)
+
+
+def _listings(rows):
+    return pd.DataFrame(
+        [
+            {
+                "name": name,
+                "location": location,
+                "restaurant_type": "Cafe",
+                "rating": rating,
+                "votes": votes,
+                "approx_cost_for_two": 300,
+                "cuisines": "Cafe",
+            }
+            for name, location, rating, votes in rows
+        ]
+    )
+
+
+def test_few_votes_are_pulled_towards_the_mean():
+    df = _listings(
+        [
+            ("Hyped", "BTM", 4.9, 3),
+            ("Loved", "BTM", 4.6, 10_000),
+            ("Plain", "HSR", 3.5, 500),
+        ]
+    )
+
+    top = compute_top_restaurants(
+        df, limit=3, sort_by="weighted_rating"
+    ).top_restaurants
+    assert [r.name for r in top] == ["Loved", "Hyped", "Plain"]
+    assert [
+        r.name
+        for r in compute_top_restaurants(df, limit=3, sort_by="rating").top_restaurants
+    ][0] == "Hyped"
+
+
+def test_score_formula_and_unrated_last():
+    frame = pd.DataFrame(
+        {
+            "rating": [4.0, 2.0, np.nan],
+            "votes": [100, 0, 50],
+            "location": ["a", "a", "b"],
+            "restaurant_type": ["x"] * 3,
+        }
+    )
+    ratings = WeightedRatings(frame, RatingPrior(votes=100))
+
+    # Mean of the rated rows is 3.0.
+    assert ratings.scores[0] == pytest.approx((100 * 4.0 + 100 * 3.0) / 200)
+    assert ratings.scores[1] == pytest.approx(3.0)
+    assert np.isnan(ratings.scores[2])
+    assert ratings.order.tolist() == [0, 1, 2]
+
+
+def test_prior_per_group_uses_the_group_mean():
+    frame = pd.DataFrame(
+        {
+            "rating": [4.5, 4.5, 3.0, 3.0],
+            "votes": [1000, 0, 1000, 0],
+            "location": ["good", "good", "poor", "poor"],
+            "restaurant_type": ["x"] * 4,
+        }
+    )
+    scores = WeightedRatings(frame, RatingPrior(votes=10, by="location")).scores
+
+    assert scores[1] == pytest.approx(4.5)
+    assert scores[3] == pytest.approx(3.0)
+
+
+def test_order_matches_a_full_sort(monkeypatch):
+    rng = np.random.default_rng(3)
+    n = 2000
+    rating = np.round(rng.uniform(1, 5, n), 1)
+    rating[rng.random(n) < 0.1] = np.nan
+    votes = rng.integers(0, 500, n)
+    df = _listings((f"r{i}", f"l{i % 7}", rating[i], int(votes[i])) for i in range(n))
+    monkeypatch.setattr(ranking, "_PRIOR", RatingPrior(votes=25, by="location"))
+    ratings = get_weighted_ratings(df)
+    frame = ratings.frame
+
+    expected = sorted(
+        range(n),
+        key=lambda i: (
+            -np.nan_to_num(ratings.scores[i], nan=-1.0),
+            -frame["votes"].iloc[i],
+            i,
+        ),
+    )
+    assert ratings.order.tolist() == expected
+
+    result = get_top_restaurants_cached(df, limit=10, sort_by="weighted_rating", ttl=0)
+    assert [r.restaurant_id for r in result.top_restaurants] == frame[
+        "restaurant_id"
+    ].take(expected[:10]).tolist()
+
+
+def test_parse_rating_prior():
+    assert parse_rating_prior(None, None) == RatingPrior()
+    assert parse_rating_prior("25", " location ") == RatingPrior(
+        votes=25.0, by="location"
+    )
+    assert parse_rating_prior("", "") == RatingPrior()
+
+    with pytest.raises(ValueError, match="votes must be a number"):
+        parse_rating_prior("many", None)
+    with pytest.raises(ValueError, match="must not be negative"):
+        parse_rating_prior("-1", None)
+    with pytest.raises(ValueError, match="by must be one of"):
+        parse_rating_prior(None, "cuisine")
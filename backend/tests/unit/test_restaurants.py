@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import gc
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from src.services.analytics import compute_top_restaurants
+from src.services.chains import get_chain_index
+from src.services.cube import get_rollup_cube
+from src.services.indexes import get_dataset_index
+from src.services.ranking import get_weighted_ratings
+from src.services.restaurants import (
+    UNITS,
+    RestaurantTable,
+    get_restaurant,
+    get_restaurant_table,
+    lookup_restaurants,
+    restaurant_ids,
+)
+from src.services.search import get_search_index
+from src.services.similar import get_similarity_index
+
+
+def _listings() -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "name": "A",
+                "location": "BTM",
+                "restaurant_type": "Cafe",
+                "cuisines": "Cafe, Desserts",
+                "rating": 4.1,
+                "votes": 10,
+                "approx_cost_for_two": None,
+            },
+            {
+                "name": "A",
+                "location": "BTM",
+                "restaurant_type": "Quick Bites",
+                "cuisines": "Desserts, Pizza",
+                "rating": 4.3,
+                "votes": 12,
+                "approx_cost_for_two": 500,
+            },
+            {
+                "name": "A",
+                "location": "BTM",
+                "restaurant_type": "Quick Bites",
+                "cuisines": "Cafe, Desserts",
+                "rating": None,
+                "votes": 7,
+                "approx_cost_for_two": 450,
+            },
+            {
+                "name": "A",
+                "location": "HSR",
+                "restaurant_type": "Cafe",
+                "cuisines": "",
+                "rating": None,
+                "votes": 1,
+                "approx_cost_for_two": 300,
+            },
+            {
+                "name": "B",
+                "location": "BTM",
+                "restaurant_type": "Bar",
+                "cuisines": "Finger Food, Finger Food",
+                "rating": 3.5,
+                "votes": 40,
+                "approx_cost_for_two": 1200,
+            },
+        ]
+    )
+
+
+def test_listings_merge_per_name_and_location():
+    df = _listings()
+    table = RestaurantTable(df)
+    frame = table.frame.set_index(["name", "location"])
+
+    assert len(table) == 3
+    a = frame.loc[("A", "BTM")]
+    assert (a["restaurant_type"], a["rating"], a["votes"], a["listings"]) == (
+        "Quick Bites",
+        4.3,
+        12,
+        3,
+    )
+    assert a["cuisines"] == "Cafe, Desserts, Pizza"
+    assert a["approx_cost_for_two"] == 500
+    assert np.isnan(frame.loc[("A", "HSR"), "rating"])
+    assert frame.loc[("B", "BTM"), "cuisines"] == "Finger Food"
+    assert (
+        table.frame["name"].iloc[table.row_restaurant].tolist() == df["name"].tolist()
+    )
+
+
+def test_table_matches_top_restaurants_merge_rules():
+    df = _listings()
+    table = RestaurantTable(df)
+    for item in compute_top_restaurants(df, limit=10).top_restaurants:
+        record = table.record(table.positions[item.restaurant_id])
+        assert (record.name, record.location) == (item.name, item.location)
+        assert record.restaurant_type == item.restaurant_type
+        assert record.cuisines == item.cuisines
+        assert record.votes == item.votes
+        assert record.rating == item.rating
+
+
+def test_restaurant_ids_are_stable_per_pair():
+    names = pd.Series(["A", "A", "B"])
+    locations = pd.Series(["BTM", "HSR", "BTM"])
+    ids = restaurant_ids(names, locations)
+    assert len(set(ids)) == 3
+    assert all(len(i) == 16 for i in ids)
+    assert restaurant_ids(names[1:], locations[1:]).tolist() == ids[1:].tolist()
+
+
+def test_lookup_resolves_ids_and_keys_in_order():
+    df = _listings()
+    table = RestaurantTable(df)
+    a_hsr = table.frame.set_index(["name", "location"]).loc[
+        ("A", "HSR"), "restaurant_id"
+    ]
+
+    records = lookup_restaurants(
+        df, ids=[a_hsr, "0000000000000000"], keys=[("B", "BTM"), ("B", "HSR")]
+    )
+    assert [None if r is None else (r.name, r.location) for r in records] == [
+        ("A", "HSR"),
+        None,
+        ("B", "BTM"),
+        None,
+    ]
+    assert records[2] == table.record(table.positions[records[2].restaurant_id])
+    assert get_restaurant(df, a_hsr) == records[0]
+    assert get_restaurant(df, "0000000000000000") is None
+
+
+def test_records_match_single_record():
+    table = RestaurantTable(_listings())
+    assert table.records([2, 0, 2]) == [
+        table.record(2),
+        table.record(0),
+        table.record(2),
+    ]
+    assert table.records([]) == []
+
+
+def test_load_time_structures_build_from_zero_rows():
+    # A header-only CSV, or one whose rows are all dropped in cleaning.
+    df = _listings().iloc[0:0]
+
+    assert len(get_restaurant_table(df)) == 0
+    for unit in UNITS:
+        get_dataset_index(df, unit)
+        get_rollup_cube(df, unit)
+    assert len(get_weighted_ratings(df).order) == 0
+    get_similarity_index(df)
+    get_search_index(df)
+    assert len(get_chain_index(df)) == 0
+
+
+def test_table_is_not_served_to_a_new_frame_of_the_same_length():
+    first = _listings()
+    table = get_restaurant_table(first)
+    held = weakref.ref(first)
+    del first
+    gc.collect()
+    # The registry keeps the frame alive, so its id cannot be handed to another.
+    assert held() is not None
+
+    second = _listings().assign(name="B")
+    rebuilt = get_restaurant_table(second)
+    assert rebuilt is not table
+    assert set(rebuilt.frame["name"]) == {"B"}
+    assert get_restaurant_table(second) is rebuilt
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services import search as search_module
+from src.services.restaurants import RestaurantTable
+from src.services.search import SearchIndex, find_restaurants, normalize_name
+
+_WORDS = [
+    "Cafe",
+    "Coffee",
+    "Day",
+    "Pizza",
+    "Hut",
+    "Pizzeria",
+    "Biryani",
+    "House",
+    "Empire",
+    "Truffles",
+    "Dosa",
+    "Corner",
+]
+
+
+@pytest.fixture()
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    rows = 800
+    names = [" ".join(rng.choice(_WORDS, size=rng.integers(1, 4))) for _ in range(rows)]
+    names[:3] = ["Cafe Coffee Day", "Café-Coffee  day", "A2B"]
+    return pd.DataFrame(
+        {
+            "name": names,
+            "location": rng.choice(["BTM", "HSR", "Koramangala"], rows),
+            "restaurant_type": "Quick Bites",
+            "cuisines": "",
+            "rating": 4.0,
+            "votes": rng.integers(0, 50, rows),
+            "approx_cost_for_two": 300,
+        }
+    )
+
+
+def _trigrams(text: str) -> set:
+    data = text.encode("utf-8")
+    return {data[i : i + 3] for i in range(len(data) - 2)}
+
+
+def _brute_force(table: RestaurantTable, query: str, limit: int, location=None) -> list:
+    """Tiers of ``SearchIndex.search`` evaluated restaurant by restaurant."""
+    frame = table.frame
+    query = normalize_name(query)
+    names = [normalize_name(n) for n in frame["name"]]
+    name_ids = {n: i for i, n in enumerate(sorted(set(names)))}
+    votes = frame["votes"].tolist()
+    scope = [
+        p
+        for p in range(len(frame))
+        if location is None or frame["location"].iloc[p].lower() == location.lower()
+    ]
+    best = {}
+    for p in scope:
+        best[names[p]] = max(best.get(names[p], -1), votes[p])
+
+    def by_votes(members):
+        return sorted(members, key=lambda p: (-votes[p], name_ids[names[p]], p))
+
+    needle = query if len(query) >= 3 else f" {query}"
+    tiers = [
+        [p for p in scope if names[p] == query],
+        [p for p in scope if names[p] != query and names[p].startswith(query)],
+    ]
+    if len(query) >= 2:
+        tiers.append(
+            [
+                p
+                for p in scope
+                if not names[p].startswith(query) and needle in f" {names[p]}"
+            ]
+        )
+    results = [p for tier in tiers for p in by_votes(tier)]
+    if len(query) < 4 or len(results) >= limit:
+        return results[:limit]
+
+    grams = _trigrams(f" {query} ")
+    typos = 1 if len(query) < 8 else 2
+    min_hits = max((len(grams) + 1) // 2, len(grams) - 3 * typos)
+    seen = set(results)
+    close = {}
+    for p in scope:
+        own = _trigrams(f" {names[p]} ")
+        hits = len(grams & own)
+        if p not in seen and not names[p].startswith(query) and hits >= min_hits:
+            close[names[p]] = (round(hits / len(grams | own), 4), best[names[p]])
+    for name in sorted(close, key=lambda n: (-close[n][0], -close[n][1], name_ids[n])):
+        members = [p for p in scope if names[p] == name]
+        results.extend(sorted(members, key=lambda p: (-votes[p], p)))
+    return results[:limit]
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["Cafe", "cafe coffee day", "ca", "c", "zza h", "Pizza Hut Dosa", "ouse", "xyz"],
+)
+@pytest.mark.parametrize("dense", [True, False])
+def test_search_matches_brute_force(frame, monkeypatch, query, dense):
+    if not dense:
+        # No bitmaps: every trigram is probed through its posting list.
+        monkeypatch.setattr(search_module, "_DENSE_FRACTION", 0)
+    table = RestaurantTable(frame)
+    index = SearchIndex(table)
+    for limit, location in ((1, None), (10, None), (50, None), (20, "hsr")):
+        assert index.search(query, limit=limit, location=location) == _brute_force(
+            table, query, limit, location
+        )
+
+
+@pytest.mark.parametrize(
+    "query", ["Biryaniu", "Pizzq Hut", "Trufles Empire", "Cofee Dya"]
+)
+@pytest.mark.parametrize("dense", [True, False])
+def test_typos_match_brute_force(frame, monkeypatch, query, dense):
+    if not dense:
+        monkeypatch.setattr(search_module, "_DENSE_FRACTION", 0)
+    table = RestaurantTable(frame)
+    index = SearchIndex(table)
+    assert index.search(query, limit=15) == _brute_force(table, query, 15)
+
+
+def test_typo_finds_intended_name(frame):
+    table = RestaurantTable(frame)
+    index = SearchIndex(table)
+    found = [
+        table.frame["name"].iloc[p] for p in index.search("Truffels Empire", limit=5)
+    ]
+    assert found and normalize_name(found[0]) == "truffles empire"
+
+
+def test_normalisation_merges_spelling_variants(frame):
+    table = RestaurantTable(frame)
+    index = SearchIndex(table)
+    names = {
+        table.frame["name"].iloc[p] for p in index.search("CAFE coffee-day", limit=50)
+    }
+    assert {"Cafe Coffee Day", "Café-Coffee  day"} <= names
+    assert index.search("a2b", limit=1) == [
+        table.positions[table.frame.set_index("name").loc["A2B", "restaurant_id"]]
+    ]
+
+
+def test_unknown_location_and_empty_query(frame):
+    index = SearchIndex(RestaurantTable(frame))
+    assert index.search("cafe", location="Nowhere") == []
+    assert index.search("  --  ") == []
+
+
+def test_incremental_rebuild_matches_full_build(frame):
+    first = SearchIndex(RestaurantTable(frame))
+    changed = frame.copy()
+    changed.loc[::7, "name"] = changed.loc[::7, "name"] + " Express"
+    changed = changed.iloc[20:]
+    table = RestaurantTable(changed)
+
+    incremental = SearchIndex(table, previous=first)
+    full = SearchIndex(table)
+    assert incremental.names == full.names
+    assert np.array_equal(incremental._grams, full._grams)
+    assert np.array_equal(incremental._postings, full._postings)
+    for query in ["express", "cafe", "Pizza Hutt", "ex"]:
+        assert incremental.search(query, limit=20) == full.search(query, limit=20)
+
+
+def test_find_restaurants_returns_records(frame):
+    result = find_restaurants(frame, "biryani house", limit=3)
+    assert 0 < len(result.restaurants) <= 3
+    assert all("biryani house" in normalize_name(r.name) for r in result.restaurants)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.restaurants import RestaurantTable
+from src.services.similar import (
+    COST_BAND_EDGES,
+    WEIGHTS,
+    SimilarityIndex,
+    find_similar_restaurants,
+)
+
+
+@pytest.fixture()
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    rows = 600
+    cuisines = [
+        "North Indian",
+        "Chinese",
+        "Cafe",
+        "Biryani",
+        "South Indian",
+        "Desserts",
+        "Pizza",
+        "Italian",
+    ]
+    return pd.DataFrame(
+        {
+            "name": [f"R{i}" for i in range(rows)],
+            "location": rng.choice(["BTM", "HSR"], rows),
+            "restaurant_type": rng.choice(
+                ["Quick Bites", "Casual Dining", "Cafe"], rows
+            ),
+            "cuisines": [
+                ", ".join(rng.choice(cuisines, size=rng.integers(0, 4), replace=False))
+                for _ in range(rows)
+            ],
+            "rating": np.where(
+                rng.random(rows) < 0.2, np.nan, rng.uniform(2.0, 5.0, rows).round(1)
+            ),
+            "votes": rng.integers(0, 500, rows),
+            "approx_cost_for_two": np.where(
+                rng.random(rows) < 0.1, np.nan, rng.integers(1, 30, rows) * 100
+            ),
+        }
+    )
+
+
+def _brute_force_scores(table: RestaurantTable, position: int) -> np.ndarray:
+    frame = table.frame
+    sets = [set(filter(None, c.split(", "))) for c in frame["cuisines"]]
+    query = sets[position]
+    cost = frame["approx_cost_for_two"].to_numpy(dtype=float)
+    bands = np.where(
+        np.isnan(cost), -1, np.searchsorted(COST_BAND_EDGES, cost, side="right")
+    )
+    halves = np.where(
+        frame["rating"].isna(), -1, np.round(frame["rating"].fillna(0) * 2)
+    )
+
+    scores = np.zeros(len(frame))
+    for i in range(len(frame)):
+        cuisine = (
+            len(query & sets[i]) / np.sqrt(len(query) * len(sets[i]))
+            if query and sets[i]
+            else 0.0
+        )
+        same_type = (
+            frame["restaurant_type"].iloc[i] == frame["restaurant_type"].iloc[position]
+        )
+        gap = abs(bands[i] - bands[position])
+        cost_sim = (
+            0.0
+            if min(bands[i], bands[position]) < 0
+            else {0: 1.0, 1: 0.5}.get(gap, 0.0)
+        )
+        rating_sim = (
+            0.0
+            if min(halves[i], halves[position]) < 0
+            else max(0.0, 1 - abs(halves[i] - halves[position]) / 2)
+        )
+        scores[i] = (
+            WEIGHTS["cuisines"] * cuisine
+            + WEIGHTS["restaurant_type"] * same_type
+            + WEIGHTS["cost"] * cost_sim
+            + WEIGHTS["rating"] * rating_sim
+        )
+    return scores
+
+
+@pytest.mark.parametrize("position", [0, 17, 123, 599])
+def test_neighbours_match_brute_force(frame, position):
+    table = RestaurantTable(frame)
+    index = SimilarityIndex(table)
+    scores = _brute_force_scores(table, position)
+    scores[position] = -1.0
+    expected = np.sort(scores)[::-1][:8]
+
+    found = index.neighbours(position, 8)
+    assert [p for p, _ in found if p == position] == []
+    assert [s for _, s in found] == pytest.approx(expected.tolist())
+    for p, s in found:
+        assert s == pytest.approx(scores[p])
+
+
+def test_find_similar_restaurants_by_id(frame):
+    table = RestaurantTable(frame)
+    restaurant_id = table.frame["restaurant_id"].iloc[5]
+
+    result = find_similar_restaurants(frame, restaurant_id, limit=3)
+    assert result is not None
+    assert result.restaurant.restaurant_id == restaurant_id
+    assert len(result.similar) == 3
+    assert find_similar_restaurants(frame, "missing") is None
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.services import analytics
+from src.services.bounded_cache import BoundedCache
+from src.services.dataset import dataset_version
+from src.services.single_flight import SingleFlight
+
+
+def test_single_flight_runs_concurrent_calls_once():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(timeout=5)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", compute)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    while flight.in_flight() == 0:
+        time.sleep(0.001)
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert calls == [1]
+    assert results == ["value"] * 8
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_propagates_errors_and_recovers():
+    flight = SingleFlight()
+
+    def boom():
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        flight.do("k", boom)
+    assert flight.do("k", lambda: 1) == 1
+
+
+def test_single_flight_refresh_skips_key_in_flight():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    assert flight.refresh("k", lambda: release.wait(timeout=5)) is True
+    assert flight.refresh("k", lambda: None) is False
+    release.set()
+
+
+def test_analytics_serves_stale_entry_while_refreshing(sample_restaurants_df):
+    analytics._ANALYTICS_CACHE.clear()
+    analytics.set_stale_while_revalidate(60)
+    try:
+        first = analytics.get_restaurant_type_summary_cached(
+            sample_restaurants_df, ttl=0
+        )
+        time.sleep(0.01)
+        second = analytics.get_restaurant_type_summary_cached(
+            sample_restaurants_df, ttl=0
+        )
+        assert second is first
+
+        deadline = time.time() + 5
+        key = f"restaurant-types:{dataset_version(sample_restaurants_df)}"
+        while analytics._ANALYTICS_CACHE[key][2] is first and time.time() < deadline:
+            time.sleep(0.01)
+        assert analytics._ANALYTICS_CACHE[key][2] is not first
+    finally:
+        analytics.set_stale_while_revalidate(0)
+        analytics._ANALYTICS_CACHE.clear()
+
+
+def _evictions() -> float:
+    return analytics.CACHE_EVENTS._values.totals().get(
+        (("analytics", "eviction"), 0), 0.0
+    )
+
+
+def test_analytics_drops_expired_entries_when_read(sample_restaurants_df):
+    analytics._ANALYTICS_CACHE.clear()
+    try:
+        analytics.get_restaurant_type_summary_cached(sample_restaurants_df, ttl=0)
+        key = f"restaurant-types:{dataset_version(sample_restaurants_df)}"
+        analytics._ANALYTICS_CACHE[key] = (
+            time.time() - 10,
+            0,
+            analytics._ANALYTICS_CACHE[key][2],
+        )
+        before = _evictions()
+
+        analytics.get_restaurant_type_summary_cached(sample_restaurants_df, ttl=300)
+        # The expired entry was removed once, then replaced by the recomputed one.
+        assert _evictions() == before + 1
+        assert analytics._ANALYTICS_CACHE[key][1] == 300
+    finally:
+        analytics._ANALYTICS_CACHE.clear()
+
+
+def test_analytics_cache_is_bounded(sample_restaurants_df):
+    analytics._ANALYTICS_CACHE.clear()
+    analytics.set_cache_max_entries(2)
+    try:
+        before = _evictions()
+        for limit in (1, 2, 3):
+            analytics.get_cuisine_summary_cached(sample_restaurants_df, limit=limit)
+        assert len(analytics._ANALYTICS_CACHE) == 2
+        assert _evictions() == before + 1
+    finally:
+        analytics.set_cache_max_entries(1024)
+        analytics._ANALYTICS_CACHE.clear()
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    cache = BoundedCache(max_entries=2)
+    assert cache.put("a", 1) == 0
+    assert cache.put("b", 2) == 0
+    cache.touch("a")
+    assert cache.put("c", 3) == 1
+    assert list(cache) == ["a", "c"]
+
+    assert cache.discard("a", 2) == 0
+    assert cache.discard("a", 1) == 1
+    assert list(cache) == ["c"]
+
+
+def test_bounded_cache_snapshot_while_writing():
+    cache: BoundedCache[int, int] = BoundedCache(max_entries=64)
+    stop = threading.Event()
+
+    def write() -> None:
+        key = 0
+        while not stop.is_set():
+            cache.put(key, key)
+            cache.touch(key // 2)
+            key += 1
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        for _ in range(2000):
+            snapshot = cache.snapshot()
+            assert len(snapshot) <= 64
+    finally:
+        stop.set()
+        writer.join()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.bench_service import compare
+from benchmarks.synthetic import generate_zomato_frame, parse_sizes, synthetic_csv
+from src.services.data_loader import load_zomato_csv
+
+
+def test_synthetic_csv_loads_with_realistic_shape(tmp_path):
+    path = synthetic_csv(5_000, seed=1, data_dir=tmp_path)
+    df = load_zomato_csv(str(path)).restaurants_df
+
+    assert len(df) == 5_000
+    assert df["location"].nunique() == 93
+    assert 50 < df["restaurant_type"].nunique() <= 93
+    assert df["cuisines"].nunique() > 1_000
+    assert 0.05 < df["rating"].isna().mean() < 0.35
+    assert df["rating"].dropna().between(0, 5).all()
+    assert synthetic_csv(5_000, seed=1, data_dir=tmp_path) == path  # cached
+
+
+def test_generator_is_deterministic():
+    assert generate_zomato_frame(200, seed=3).equals(generate_zomato_frame(200, seed=3))
+
+
+def test_parse_sizes_and_compare():
+    assert parse_sizes("1k, 1m,2500") == [1_000, 1_000_000, 2_500]
+    with pytest.raises(ValueError):
+        parse_sizes("huge")
+
+    rows = compare(
+        {"1000": {"a": 0.3, "b": 0.1}}, {"1000": {"a": 0.2, "b": 0.1}}, threshold=1.25
+    )
+    assert [(name, regressed) for _, name, _, _, regressed in rows] == [
+        ("a", True),
+        ("b", False),
+    ]
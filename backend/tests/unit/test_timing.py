@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from src.utils.timing import (
+    begin_request_timings,
+    current_timings,
+    end_request_timings,
+    stage,
+)
+
+
+def test_stage_is_a_no_op_outside_a_request():
+    assert current_timings() is None
+    with stage("compute"):
+        pass
+    assert current_timings() is None
+
+
+def test_stages_accumulate_and_format_as_server_timing():
+    token = begin_request_timings()
+    try:
+        with stage("cache"):
+            pass
+        with stage("cache"):
+            pass
+        with stage("render"):
+            pass
+        timings = current_timings()
+        assert timings is not None
+        assert list(timings.as_ms()) == ["cache", "render"]
+        header = timings.server_timing(0.0125)
+        assert header.startswith("cache;dur=")
+        assert header.endswith("total;dur=12.5")
+    finally:
+        end_request_timings(token)
+    assert current_timings() is None
@@ -1,3 +1,32 @@
+function renderRestaurantTypes(gridEl, data) {
+  const items = data.restaurant_types;
+  for (const item of items) {
+    const col = document.createElement('div');
+    col.className = 'col-12 col-sm-6 col-lg-4 col-xl-3';
+
+    const avgRating = item.avg_rating == null ? 'N/A' : item.avg_rating.toFixed(2);
+    const avgCost = item.avg_cost_for_two == null ? 'N/A' : item.avg_cost_for_two;
+
+    col.innerHTML = `
+      <div class="card type-card h-100">
+        <div class="card-body">
+          <div class="d-flex justify-content-between align-items-start">
+            <h3 class="h6 mb-1">${item.restaurant_type}</h3>
+            <span class="badge text-bg-primary">${item.percentage.toFixed(1)}%</span>
+          </div>
+          <div class="display-6 fw-semibold">${item.count.toLocaleString()}</div>
+          <div class="meta mt-2">
+            <div>Avg rating: <span class="fw-medium">${avgRating}</span></div>
+            <div>Avg cost for two: <span class="fw-medium">${avgCost}</span></div>
+          </div>
+        </div>
+      </div>
+    `;
+
+    gridEl.appendChild(col);
+  }
+}
+
 async function loadRestaurantTypes() {
   const loadingEl = document.getElementById('restaurant-types-loading');
   const errorEl = document.getElementById('restaurant-types-error');
@@ -18,32 +47,7 @@ async function loadRestaurantTypes() {
       throw new Error(body && body.error ? body.error : `Request failed (${res.status})`);
     }
 
-    const items = body.data.restaurant_types;
-    for (const item of items) {
-      const col = document.createElement('div');
-      col.className = 'col-12 col-sm-6 col-lg-4 col-xl-3';
-
-      const avgRating = item.avg_rating == null ? 'N/A' : item.avg_rating.toFixed(2);
-      const avgCost = item.avg_cost_for_two == null ? 'N/A' : item.avg_cost_for_two;
-
-      col.innerHTML = `
-        <div class="card type-card h-100">
-          <div class="card-body">
-            <div class="d-flex justify-content-between align-items-start">
-              <h3 class="h6 mb-1">${item.restaurant_type}</h3>
-              <span class="badge text-bg-primary">${item.percentage.toFixed(1)}%</span>
-            </div>
-            <div class="display-6 fw-semibold">${item.count.toLocaleString()}</div>
-            <div class="meta mt-2">
-              <div>Avg rating: <span class="fw-medium">${avgRating}</span></div>
-              <div>Avg cost for two: <span class="fw-medium">${avgCost}</span></div>
-            </div>
-          </div>
-        </div>
-      `;
-
-      gridEl.appendChild(col);
-    }
+    renderRestaurantTypes(gridEl, body.data);
   } catch (err) {
     errorEl.textContent = err instanceof Error ? err.message : String(err);
     errorEl.classList.remove('d-none');
@@ -52,6 +56,36 @@ async function loadRestaurantTypes() {
   }
 }
 
+function renderFoodieAreas(gridEl, data) {
+  const items = data.foodie_areas;
+  for (const item of items) {
+    const col = document.createElement('div');
+    col.className = 'col-12 col-lg-6';
+
+    const rating = item.avg_rating == null ? 'N/A' : item.avg_rating.toFixed(2);
+    const cuisines = Array.isArray(item.top_cuisines) ? item.top_cuisines.join(', ') : '';
+    const types = Array.isArray(item.restaurant_types) ? item.restaurant_types.join(', ') : '';
+
+    col.innerHTML = `
+      <div class="card foodie-area-card h-100">
+        <div class="card-body">
+          <div class="d-flex justify-content-between align-items-start">
+            <h3 class="h6 mb-1">${item.area}</h3>
+            <span class="badge text-bg-secondary">${item.restaurant_count.toLocaleString()} restaurants</span>
+          </div>
+          <div class="meta mt-2">
+            <div>Avg rating: <span class="fw-medium">${rating}</span></div>
+            <div>Top cuisines: <span class="fw-medium">${cuisines}</span></div>
+            <div>Top types: <span class="fw-medium">${types}</span></div>
+          </div>
+        </div>
+      </div>
+    `;
+
+    gridEl.appendChild(col);
+  }
+}
+
 async function loadFoodieAreas() {
   const loadingEl = document.getElementById('foodie-areas-loading');
   const errorEl = document.getElementById('foodie-areas-error');
@@ -72,33 +106,7 @@ async function loadFoodieAreas() {
       throw new Error(body && body.error ? body.error : `Request failed (${res.status})`);
     }
 
-    const items = body.data.foodie_areas;
-    for (const item of items) {
-      const col = document.createElement('div');
-      col.className = 'col-12 col-lg-6';
-
-      const rating = item.avg_rating == null ? 'N/A' : item.avg_rating.toFixed(2);
-      const cuisines = Array.isArray(item.top_cuisines) ? item.top_cuisines.join(', ') : '';
-      const types = Array.isArray(item.restaurant_types) ? item.restaurant_types.join(', ') : '';
-
-      col.innerHTML = `
-        <div class="card foodie-area-card h-100">
-          <div class="card-body">
-            <div class="d-flex justify-content-between align-items-start">
-              <h3 class="h6 mb-1">${item.area}</h3>
-              <span class="badge text-bg-secondary">${item.restaurant_count.toLocaleString()} restaurants</span>
-            </div>
-            <div class="meta mt-2">
-              <div>Avg rating: <span class="fw-medium">${rating}</span></div>
-              <div>Top cuisines: <span class="fw-medium">${cuisines}</span></div>
-              <div>Top types: <span class="fw-medium">${types}</span></div>
-            </div>
-          </div>
-        </div>
-      `;
-
-      gridEl.appendChild(col);
-    }
+    renderFoodieAreas(gridEl, body.data);
   } catch (err) {
     errorEl.textContent = err instanceof Error ? err.message : String(err);
     errorEl.classList.remove('d-none');
@@ -107,6 +115,36 @@ async function loadFoodieAreas() {
   }
 }
 
+function renderTopRestaurants(gridEl, data) {
+  const items = data.top_restaurants;
+  for (const item of items) {
+    const col = document.createElement('div');
+    col.className = 'col-12 col-lg-6';
+
+    const rating = item.rating == null ? 'N/A' : item.rating.toFixed(2);
+    const cuisines = Array.isArray(item.cuisines) ? item.cuisines.join(', ') : '';
+
+    col.innerHTML = `
+      <div class="card top-restaurant-card h-100">
+        <div class="card-body">
+          <div class="d-flex justify-content-between align-items-start">
+            <h3 class="h6 mb-1">#${item.rank} ${item.name}</h3>
+            <span class="badge text-bg-dark">${item.votes.toLocaleString()} votes</span>
+          </div>
+          <div class="meta mt-2">
+            <div>Location: <span class="fw-medium">${item.location}</span></div>
+            <div>Type: <span class="fw-medium">${item.restaurant_type}</span></div>
+            <div>Rating: <span class="fw-medium">${rating}</span></div>
+            <div>Cuisines: <span class="fw-medium">${cuisines}</span></div>
+          </div>
+        </div>
+      </div>
+    `;
+
+    gridEl.appendChild(col);
+  }
+}
+
 async function loadTopRestaurants() {
   const loadingEl = document.getElementById('top-restaurants-loading');
   const errorEl = document.getElementById('top-restaurants-error');
@@ -127,33 +165,7 @@ async function loadTopRestaurants() {
       throw new Error(body && body.error ? body.error : `Request failed (${res.status})`);
     }
 
-    const items = body.data.top_restaurants;
-    for (const item of items) {
-      const col = document.createElement('div');
-      col.className = 'col-12 col-lg-6';
-
-      const rating = item.rating == null ? 'N/A' : item.rating.toFixed(2);
-      const cuisines = Array.isArray(item.cuisines) ? item.cuisines.join(', ') : '';
-
-      col.innerHTML = `
-        <div class="card top-restaurant-card h-100">
-          <div class="card-body">
-            <div class="d-flex justify-content-between align-items-start">
-              <h3 class="h6 mb-1">#${item.rank} ${item.name}</h3>
-              <span class="badge text-bg-dark">${item.votes.toLocaleString()} votes</span>
-            </div>
-            <div class="meta mt-2">
-              <div>Location: <span class="fw-medium">${item.location}</span></div>
-              <div>Type: <span class="fw-medium">${item.restaurant_type}</span></div>
-              <div>Rating: <span class="fw-medium">${rating}</span></div>
-              <div>Cuisines: <span class="fw-medium">${cuisines}</span></div>
-            </div>
-          </div>
-        </div>
-      `;
-
-      gridEl.appendChild(col);
-    }
+    renderTopRestaurants(gridEl, body.data);
   } catch (err) {
     errorEl.textContent = err instanceof Error ? err.message : String(err);
     errorEl.classList.remove('d-none');
@@ -162,6 +174,120 @@ async function loadTopRestaurants() {
   }
 }
 
+const CHART_COLORS = ['#0d6efd', '#6610f2', '#d63384', '#fd7e14', '#198754', '#20c997', '#0dcaf0', '#ffc107', '#6c757d', '#dc3545'];
+
+function drawPieChart(ctx, width, height, data) {
+  const total = data.values.reduce((sum, v) => sum + v, 0);
+  if (!total) return;
+
+  const cx = width * 0.3;
+  const cy = height / 2;
+  const radius = Math.min(cx, cy) - 16;
+  let angle = -Math.PI / 2;
+
+  data.values.forEach((value, i) => {
+    const slice = (value / total) * Math.PI * 2;
+    ctx.beginPath();
+    ctx.moveTo(cx, cy);
+    ctx.arc(cx, cy, radius, angle, angle + slice);
+    ctx.closePath();
+    ctx.fillStyle = CHART_COLORS[i % CHART_COLORS.length];
+    ctx.fill();
+    angle += slice;
+  });
+
+  const lineHeight = 18;
+  const top = Math.max(16, cy - (data.labels.length * lineHeight) / 2);
+  ctx.font = '12px sans-serif';
+  ctx.textBaseline = 'middle';
+  data.labels.forEach((label, i) => {
+    const y = top + i * lineHeight;
+    const pct = data.layout.show_percentages ? ` (${((data.values[i] / total) * 100).toFixed(1)}%)` : '';
+    ctx.fillStyle = CHART_COLORS[i % CHART_COLORS.length];
+    ctx.fillRect(width * 0.6, y - 5, 10, 10);
+    ctx.fillStyle = '#212529';
+    ctx.fillText(`${label}${pct}`, width * 0.6 + 16, y);
+  });
+}
+
+function drawBarChart(ctx, width, height, data) {
+  const max = Math.max(...data.values, 0);
+  if (!max) return;
+
+  const labelWidth = Math.min(width * 0.4, 260);
+  const left = labelWidth + 12;
+  const right = 24;
+  const top = 12;
+  const bottom = 32;
+  const rowHeight = (height - top - bottom) / data.values.length;
+
+  ctx.font = '12px sans-serif';
+  ctx.textBaseline = 'middle';
+  data.values.forEach((value, i) => {
+    const y = top + i * rowHeight;
+    const barWidth = ((width - left - right) * value) / max;
+    ctx.fillStyle = CHART_COLORS[0];
+    ctx.fillRect(left, y + rowHeight * 0.15, barWidth, rowHeight * 0.7);
+
+    ctx.fillStyle = '#212529';
+    ctx.textAlign = 'right';
+    ctx.fillText(data.labels[i], labelWidth, y + rowHeight / 2, labelWidth);
+  });
+
+  ctx.textAlign = 'center';
+  ctx.fillStyle = '#6c757d';
+  ctx.fillText(data.layout.value_label, left + (width - left - right) / 2, height - bottom / 2);
+}
+
+function drawChart(canvas, data) {
+  const ctx = canvas.getContext('2d');
+  if (!ctx) return;
+
+  const width = canvas.width;
+  const height = canvas.height;
+  ctx.clearRect(0, 0, width, height);
+
+  if (!data.values.length) {
+    ctx.font = '14px sans-serif';
+    ctx.textAlign = 'center';
+    ctx.fillStyle = '#6c757d';
+    ctx.fillText('No data', width / 2, height / 2);
+    return;
+  }
+
+  if (data.layout.kind === 'pie') {
+    drawPieChart(ctx, width, height, data);
+  } else {
+    drawBarChart(ctx, width, height, data);
+  }
+}
+
+const CHART_TYPES = ['restaurant-types-pie', 'top-restaurants-bar', 'foodie-areas-bar'];
+const CHART_WIDTH = 900;
+const CHART_HEIGHT = 420;
+
+function renderChart(gridEl, item) {
+  const col = document.createElement('div');
+  col.className = 'col-12 col-xl-6';
+
+  const title = item.title || item.chart_type;
+
+  col.innerHTML = `
+    <div class="card h-100">
+      <div class="card-body">
+        <div class="d-flex justify-content-between align-items-start">
+          <h3 class="h6 mb-2">${title}</h3>
+          <span class="badge text-bg-light">${CHART_WIDTH}×${CHART_HEIGHT}</span>
+        </div>
+        <canvas class="img-fluid border rounded" width="${CHART_WIDTH}" height="${CHART_HEIGHT}" aria-label="${title}"></canvas>
+      </div>
+    </div>
+  `;
+
+  gridEl.appendChild(col);
+  drawChart(col.querySelector('canvas'), item);
+}
+
 async function loadCharts() {
   const loadingEl = document.getElementById('charts-loading');
   const errorEl = document.getElementById('charts-error');
@@ -174,41 +300,16 @@ async function loadCharts() {
   errorEl.textContent = '';
   gridEl.innerHTML = '';
 
-  const chartTypes = [
-    { type: 'restaurant-types-pie' },
-    { type: 'top-restaurants-bar' },
-    { type: 'foodie-areas-bar' },
-  ];
-
   try {
-    for (const chart of chartTypes) {
-      const res = await fetch(`/api/charts/${chart.type}?width=900&height=420`);
+    for (const chartType of CHART_TYPES) {
+      const res = await fetch(`/api/charts/${chartType}/data`);
       const body = await res.json();
 
       if (!res.ok || !body.success) {
         throw new Error(body && body.error ? body.error : `Request failed (${res.status})`);
       }
 
-      const item = body.data;
-      const col = document.createElement('div');
-      col.className = 'col-12 col-xl-6';
-
-      const title = item.title || item.chart_type;
-      const src = `data:image/png;base64,${item.base64_image}`;
-
-      col.innerHTML = `
-        <div class="card h-100">
-          <div class="card-body">
-            <div class="d-flex justify-content-between align-items-start">
-              <h3 class="h6 mb-2">${title}</h3>
-              <span class="badge text-bg-light">${item.width}×${item.height}</span>
-            </div>
-            <img class="img-fluid border rounded" alt="${title}" src="${src}" />
-          </div>
-        </div>
-      `;
-
-      gridEl.appendChild(col);
+      renderChart(gridEl, body.data);
     }
   } catch (err) {
     errorEl.textContent = err instanceof Error ? err.message : String(err);
@@ -218,6 +319,62 @@ async function loadCharts() {
   }
 }
 
+// Initial page load fetches every section in one /api/dashboard round trip.
+const DASHBOARD_SECTIONS = [
+  { prefix: 'restaurant-types', ids: ['restaurant-types'], render: renderRestaurantTypes },
+  { prefix: 'top-restaurants', ids: ['top-restaurants'], render: renderTopRestaurants },
+  { prefix: 'foodie-areas', ids: ['foodie-areas'], render: renderFoodieAreas },
+  { prefix: 'charts', ids: CHART_TYPES, render: renderChart },
+];
+
+async function loadDashboard() {
+  const sections = [];
+  for (const section of DASHBOARD_SECTIONS) {
+    const loadingEl = document.getElementById(`${section.prefix}-loading`);
+    const errorEl = document.getElementById(`${section.prefix}-error`);
+    const gridEl = document.getElementById(`${section.prefix}-grid`);
+    if (!loadingEl || !errorEl || !gridEl) continue;
+
+    loadingEl.classList.remove('d-none');
+    errorEl.classList.add('d-none');
+    errorEl.textContent = '';
+    gridEl.innerHTML = '';
+    sections.push({ ...section, loadingEl, errorEl, gridEl });
+  }
+
+  let results = {};
+  let failure = null;
+  try {
+    const res = await fetch('/api/dashboard');
+    const body = await res.json();
+
+    if (!res.ok || !body.success) {
+      throw new Error(body && body.error ? body.error : `Request failed (${res.status})`);
+    }
+    results = body.data.results;
+  } catch (err) {
+    failure = err instanceof Error ? err.message : String(err);
+  }
+
+  for (const section of sections) {
+    try {
+      if (failure) throw new Error(failure);
+      for (const id of section.ids) {
+        const result = results[id];
+        if (!result || !result.success) {
+          throw new Error(result && result.error ? result.error : `Request failed (${id})`);
+        }
+        section.render(section.gridEl, result.data);
+      }
+    } catch (err) {
+      section.errorEl.textContent = err instanceof Error ? err.message : String(err);
+      section.errorEl.classList.remove('d-none');
+    } finally {
+      section.loadingEl.classList.add('d-none');
+    }
+  }
+}
+
 document.addEventListener('DOMContentLoaded', () => {
   const refreshBtn = document.getElementById('refresh-btn');
   if (refreshBtn) {
@@ -247,8 +404,5 @@ document.addEventListener('DOMContentLoaded', () => {
     });
   }
 
-  void loadRestaurantTypes();
-  void loadTopRestaurants();
-  void loadFoodieAreas();
-  void loadCharts();
+  void loadDashboard();
 });